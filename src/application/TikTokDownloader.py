@@ -22,7 +22,7 @@ from src.custom import (
     VERSION_MAJOR,
     VERSION_MINOR,
 )
-from src.manager import Database, DownloadRecorder
+from src.manager import Database, DownloadRecorder, HostWarmer, IDIndex
 from src.module import Cookie, MigrateFolder
 from src.record import BaseLogger, LoggerManager
 from src.tools import (
@@ -71,6 +71,8 @@ class TikTokDownloader:
         self.running = True
         self.run_command = None
         self.database = Database()
+        self.index = IDIndex(self.database, self.console)
+        self.warmer = HostWarmer(self.database)
         self.config = None
         self.option = None
         self.__function_menu = None
@@ -98,6 +100,8 @@ class TikTokDownloader:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.warmer.stop()
+        await self.index.close()
         await self.database.__aexit__(exc_type, exc_val, exc_tb)
         if self.parameter:
             await self.parameter.close_client()
@@ -131,6 +135,11 @@ class TikTokDownloader:
             ),
             (_("检查程序版本更新"), self.check_update),
             (_("切换语言"), self._switch_language),
+            (_("从浏览器读取 Cookie 至 Cookie 池 (抖音)"), self.browser_cookie_pool),
+            (
+                _("从浏览器读取 Cookie 至 Cookie 池 (TikTok)"),
+                self.browser_cookie_pool_tiktok,
+            ),
         )
 
     async def disable_function(
@@ -230,6 +239,7 @@ class TikTokDownloader:
             self.database,
             self.config["Record"],
             self.console,
+            self.index,
         )
         self.logger = {1: LoggerManager, 0: BaseLogger}[self.config["Logger"]]
 
@@ -299,6 +309,9 @@ class TikTokDownloader:
             self.running = example.running
         except KeyboardInterrupt:
             self.running = False
+        finally:
+            example.extractor.close()
+            await example.record.close()
 
     async def monitor(self):
         await self.monitor_clipboard()
@@ -308,10 +321,15 @@ class TikTokDownloader:
             self.parameter,
             self.database,
         )
+        self.warmer.start(self.parameter, True)
         try:
             await example.run(self.run_command)
         except (KeyboardInterrupt, CancelledError):
             await example.stop_listener()
+        finally:
+            await self.warmer.stop()
+            example.extractor.close()
+            await example.record.close()
 
     async def change_config(
         self,
@@ -411,6 +429,9 @@ class TikTokDownloader:
         await self.check_settings(
             False,
         )
+        self.warmer.start(self.parameter)
+        if self.config["Record"]:
+            self.index.start()
         if await self.disclaimer():
             await self.main_menu(safe_pop(self.run_command))
 
@@ -439,7 +460,7 @@ class TikTokDownloader:
 
     def close(self):
         self.event_cookie.set()
-        if self.parameter.folder_mode:
+        if self.parameter.folder_mode or self.parameter.folder_shard:
             remove_empty_directories(self.parameter.ROOT)
             remove_empty_directories(self.parameter.root)
         self.parameter.logger.info(_("正在关闭程序"))
@@ -460,3 +481,22 @@ class TikTokDownloader:
             select=safe_pop(self.run_command),
         ):
             await self.check_settings()
+
+    async def browser_cookie_pool(
+        self,
+    ):
+        if Browser(self.parameter, self.cookie).run(
+            select=safe_pop(self.run_command),
+            pool=True,
+        ):
+            await self.check_settings()
+
+    async def browser_cookie_pool_tiktok(
+        self,
+    ):
+        if Browser(self.parameter, self.cookie).run(
+            True,
+            select=safe_pop(self.run_command),
+            pool=True,
+        ):
+            await self.check_settings()
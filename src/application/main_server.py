@@ -2,7 +2,7 @@ from textwrap import dedent
 from typing import TYPE_CHECKING
 
 from fastapi import Depends, FastAPI, Header, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse
 from uvicorn import Config, Server
 
 from ..custom import (
@@ -13,6 +13,7 @@ from ..custom import (
     VERSION_BETA,
     is_valid_token,
 )
+from ..extract import to_dict
 from ..models import (
     Account,
     AccountTiktok,
@@ -33,6 +34,8 @@ from ..models import (
     UserSearch,
     VideoSearch,
 )
+from ..manager import HostWarmer
+from ..tools import encode_json
 from ..translation import _
 from .main_terminal import TikTok
 
@@ -43,6 +46,13 @@ if TYPE_CHECKING:
 __all__ = ["APIServer"]
 
 
+class CodecJSONResponse(JSONResponse):
+    """已安装 orjson 时使用 orjson 编码响应数据，否则使用标准库 json"""
+
+    def render(self, content) -> bytes:
+        return encode_json(content)
+
+
 def token_dependency(token: str = Header(None)):
     if not is_valid_token(token):
         raise HTTPException(
@@ -89,6 +99,7 @@ class APIServer(TikTok):
             debug=VERSION_BETA,
             title="DouK-Downloader",
             version=__VERSION__,
+            default_response_class=CodecJSONResponse,
         )
         self.setup_routes()
         config = Config(
@@ -98,7 +109,14 @@ class APIServer(TikTok):
             log_level=log_level,
         )
         server = Server(config)
-        await server.serve()
+        warmer = HostWarmer(self.database)
+        warmer.start(self.parameter, True)
+        try:
+            await server.serve()
+        finally:
+            await warmer.stop()
+            self.extractor.close()
+            await self.record.close()
 
     def setup_routes(self):
         @self.server.get(
@@ -707,7 +725,7 @@ class APIServer(TikTok):
     ):
         return DataResponse(
             message=message or _("获取数据成功！"),
-            data=data,
+            data=to_dict(data),
             params=extract.model_dump(),
         )
 
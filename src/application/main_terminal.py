@@ -1,3 +1,4 @@
+from contextlib import AsyncExitStack, aclosing
 from datetime import date, datetime
 from pathlib import Path
 from platform import system
@@ -47,8 +48,8 @@ from ..models import (
     VideoSearch,
 )
 from ..module import DetailTikTokExtractor, DetailTikTokUnofficial
-from ..storage import RecordManager
-from ..tools import DownloaderError, choose, safe_pop
+from ..storage import RecordManager, read_source, source_name, source_options
+from ..tools import DownloaderError, choose, encode_json, safe_pop
 from ..translation import _
 
 if TYPE_CHECKING:
@@ -112,7 +113,7 @@ class TikTok:
         self.console = parameter.console
         self.logger = parameter.logger
         API.init_progress_object(
-            server_mode,
+            server_mode or parameter.progress_mode == "json",
         )
         self.links = LinkExtractor(parameter)
         self.links_tiktok = ExtractorTikTok(parameter)
@@ -206,6 +207,10 @@ class TikTok:
                 _("批量下载视频原画(TikTok)"),
                 self.detail_interactive_tiktok_unofficial,
             ),
+            (
+                _("从原始数据文件重新提取数据"),
+                self.reextract_interactive,
+            ),
         )
         self.__function_account = (
             (_("使用 accounts_urls 参数的账号链接(推荐)"), self.account_detail_batch),
@@ -2030,6 +2035,77 @@ class TikTok:
         await self._deal_hot_data()
         self.logger.info(_("已退出采集抖音热榜数据(抖音)模式"))
 
+    async def reextract_interactive(
+        self,
+        *args,
+    ):
+        if not self.parameter.storage_format:
+            self.logger.warning(_("未设置 storage_format 参数，无法储存重新提取的数据"))
+            return
+        if path := self.console.input(_("请输入原始数据文件或文件夹路径：")):
+            await self.reextract(Path(path.replace('"', "")))
+        self.logger.info(_("已退出从原始数据文件重新提取数据模式"))
+
+    async def reextract(self, path: Path, chunk: int = 1000) -> None:
+        """读取 NDJSON 原始数据文件，离线重新提取数据并按当前储存格式保存"""
+        files = list(path.iterdir()) if path.is_dir() else [path]
+        if not (files := [i for i in files if i.is_file() and source_name(i)]):
+            self.console.print(_("{path} 不存在原始数据文件！").format(path=path))
+            return
+        # 首个分卷文件名称不含序号，按名称与后缀数量排序以保持分卷顺序
+        files.sort(key=lambda i: (source_name(i), len(i.suffixes), i.name))
+        for file in files:
+            self.logger.info(_("正在重新提取原始数据文件: {path}").format(path=file))
+            async with AsyncExitStack() as stack:
+                recorders = {}
+                key, data = None, []
+                for item in read_source(file):
+                    group = (
+                        item["record"],
+                        item["type"],
+                        item["tiktok"],
+                        encode_json(item["options"]),
+                    )
+                    if data and (group != key or len(data) >= chunk):
+                        await self.__reextract_data(
+                            stack, recorders, source_name(file), data
+                        )
+                        data = []
+                    key = group
+                    data.append(item)
+                if data:
+                    await self.__reextract_data(
+                        stack, recorders, source_name(file), data
+                    )
+
+    async def __reextract_data(
+        self,
+        stack: AsyncExitStack,
+        recorders: dict,
+        name: str,
+        data: list[dict],
+    ) -> None:
+        record = data[0]["record"]
+        if record not in recorders:
+            root, params, logger = self.record.run(self.parameter, type_=record)
+            # 重新提取的数据写入独立文件，避免与原有数据文件及原始数据文件混合
+            recorders[record] = await stack.enter_async_context(
+                logger(
+                    root,
+                    name=f"{name}_reextract",
+                    console=self.console,
+                    **(params | {"source": False}),
+                )
+            )
+        await self.extractor.run(
+            [i["data"] for i in data],
+            recorders[record],
+            data[0]["type"],
+            data[0]["tiktok"],
+            capture=False,
+            **source_options(data[0]),
+        )
+
     async def _deal_hot_data(
         self,
         source=False,
@@ -2284,11 +2360,10 @@ class TikTok:
         **kwargs,
     ):
         extractor = DetailTikTokExtractor(self.parameter)
-        for i in ids:
-            if data := await DetailTikTokUnofficial(
-                self.parameter,
-                detail_id=i,
-            ).run():
+        async with aclosing(
+            DetailTikTokUnofficial.run_batch(self.parameter, ids)
+        ) as batch:
+            async for data in batch:
                 if data := extractor.run(data):
                     await self.downloader.run([data], "detail", tiktok=True)
 
@@ -2300,7 +2375,7 @@ class TikTok:
                     _("请选择采集功能"),
                     [i for i, __ in self.__function],
                     self.console,
-                    (11,),
+                    (11, 17),
                 )
             if select in {
                 "Q",
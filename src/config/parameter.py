@@ -1,10 +1,10 @@
 from pathlib import Path
 from shutil import move
-from time import localtime, strftime
+from time import localtime, monotonic, strftime
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Type
 
-from httpx import HTTPStatusError, RequestError, TimeoutException, get
+from httpx import HTTPStatusError, Request, RequestError, TimeoutException, get
 
 from ..custom import (
     BLANK_PREVIEW,
@@ -24,8 +24,18 @@ from ..extract import Extractor
 from ..interface import API, APITikTok
 from ..module import FFMPEG
 from ..record import BaseLogger, LoggerManager
-from ..storage import RecordManager
-from ..tools import Cleaner, DownloaderError, cookie_dict_to_str, create_client
+from ..storage import COMPRESSION, PARQUET_SUPPORT, ZSTD_SUPPORT, RecordManager
+from ..tools import (
+    FOLDER_SHARD,
+    HTTP2_SUPPORT,
+    Cleaner,
+    CookiePool,
+    DNSCache,
+    DownloaderError,
+    ProxyPool,
+    cookie_dict_to_str,
+    create_client,
+)
 from ..translation import _
 
 if TYPE_CHECKING:
@@ -53,6 +63,8 @@ class Parameter:
         "http://": None,
         "https://": None,
     }
+    PROXY_CHECK_URL = "https://www.douyin.com/?recommend=1"
+    PROXY_CHECK_URL_TIKTOK = "https://www.tiktok.com/explore"
 
     def __init__(
         self,
@@ -98,6 +110,27 @@ class Parameter:
         timeout=10,
         douyin_platform=True,
         tiktok_platform=True,
+        cookie_pool: list[dict | str] = None,
+        cookie_pool_tiktok: list[dict | str] = None,
+        cookie_budget: int = 0,
+        proxy_pool: list[str] = None,
+        proxy_pool_tiktok: list[str] = None,
+        proxy_check_url: str = "",
+        proxy_check_url_tiktok: str = "",
+        proxy_check_interval: int = 300,
+        proxy_concurrency: int = 4,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: int = 5,
+        dns_cache_ttl: int = 300,
+        prewarm: bool = False,
+        extract_processes: int = 0,
+        extract_threshold: int = 5000,
+        storage_compression: str = "",
+        storage_source: bool = False,
+        progress_mode: str = "",
+        folder_shard: str = "",
         **kwargs,
     ):
         self.settings = settings
@@ -141,6 +174,18 @@ class Parameter:
         )
         self.cookie_state: bool = self.__check_cookie_state()
         self.cookie_tiktok_state: bool = self.__check_cookie_state(True)
+        self.cookie_budget = self.__check_cookie_budget(cookie_budget)
+        self.cookie_pool_items = self.__check_cookie_pool(cookie_pool)
+        self.cookie_pool_items_tiktok = self.__check_cookie_pool(
+            cookie_pool_tiktok,
+            "cookie_pool_tiktok",
+        )
+        self.cookie_pool = CookiePool(cookie_object.STATE_KEY, self.cookie_budget)
+        self.cookie_pool_tiktok = CookiePool(
+            cookie_object.STATE_KEY,
+            self.cookie_budget,
+        )
+        self.__update_cookie_pool()
         self.set_uif_id()
         # self.set_download_headers()
 
@@ -152,9 +197,13 @@ class Parameter:
         self.date_format = self.__check_date_format(date_format)
         self.split = self.__check_split(split)
         self.folder_mode = self.check_bool_false(folder_mode)
+        self.folder_shard = self.__check_folder_shard(folder_shard)
         self.music = self.check_bool_false(music)
         self.truncate = self.__check_truncate(truncate)
+        self.progress_mode = self.__check_progress_mode(progress_mode)
         self.storage_format = self.__check_storage_format(storage_format)
+        self.storage_compression = self.__check_storage_compression(storage_compression)
+        self.storage_source = self.check_bool_false(storage_source)
         self.dynamic_cover = self.check_bool_false(dynamic_cover)
         self.static_cover = self.check_bool_false(static_cover)
         self.twc_tiktok = self.check_str(twc_tiktok)
@@ -191,13 +240,72 @@ class Parameter:
             enable=self.douyin_platform,
         )
         self.proxy_tiktok: str | None = self.__check_proxy_tiktok(proxy_tiktok)
-        self.client = create_client(
-            timeout=self.timeout,
-            proxy=self.proxy,
+        self.http2 = self.__check_http2(http2)
+        self.max_connections = self.__check_number_value(
+            max_connections,
+            "max_connections",
+            1,
+            100,
         )
-        self.client_tiktok = create_client(
-            timeout=self.timeout,
-            proxy=self.proxy_tiktok,
+        self.max_keepalive_connections = self.__check_number_value(
+            max_keepalive_connections,
+            "max_keepalive_connections",
+            0,
+            20,
+        )
+        self.keepalive_expiry = self.__check_number_value(
+            keepalive_expiry,
+            "keepalive_expiry",
+            0,
+            5,
+        )
+        self.dns_cache_ttl = self.__check_number_value(
+            dns_cache_ttl,
+            "dns_cache_ttl",
+            0,
+            300,
+        )
+        self.resolver = DNSCache(self.dns_cache_ttl)
+        self.activity: dict[str, float] = {}  # 各域名最近一次请求的时间，预热请求除外
+        self.prewarm = self.check_bool_false(prewarm)
+        self.extract_processes = self.__check_extract_processes(extract_processes)
+        self.extract_threshold = self.__check_extract_threshold(extract_threshold)
+        # 数据接口与文件下载使用独立的连接池
+        self.client = self.__create_client(self.proxy)
+        self.client_tiktok = self.__create_client(self.proxy_tiktok)
+        self.client_download = self.__create_client(self.proxy)
+        self.client_download_tiktok = self.__create_client(self.proxy_tiktok)
+        self.proxy_check_interval = self.__check_number_value(
+            proxy_check_interval,
+            "proxy_check_interval",
+            0,
+            300,
+        )
+        self.proxy_concurrency = self.__check_number_value(
+            proxy_concurrency,
+            "proxy_concurrency",
+            1,
+            4,
+        )
+        self.proxy_pool = ProxyPool(
+            self.check_str(proxy_check_url) or self.PROXY_CHECK_URL,
+            self.__check_proxy_pool(proxy_pool, enable=self.douyin_platform),
+            self.proxy_check_interval,
+            self.proxy_concurrency,
+            self.timeout,
+            self.client_options,
+        )
+        self.proxy_pool_tiktok = ProxyPool(
+            self.check_str(proxy_check_url_tiktok) or self.PROXY_CHECK_URL_TIKTOK,
+            self.__check_proxy_pool(
+                proxy_pool_tiktok,
+                "proxy_pool_tiktok",
+                self.tiktok_platform,
+            ),
+            self.proxy_check_interval,
+            self.proxy_concurrency,
+            self.timeout,
+            self.client_options,
         )
 
         self.__generate_folders()
@@ -219,9 +327,13 @@ class Parameter:
             "date_format": self.__check_date_format,
             "split": self.__check_split,
             "folder_mode": self.check_bool_false,
+            "folder_shard": self.__check_folder_shard,
             "music": self.check_bool_false,
             "truncate": self.__check_truncate,
+            "progress_mode": self.__check_progress_mode,
             "storage_format": self.__check_storage_format,
+            "storage_compression": self.__check_storage_compression,
+            "storage_source": self.check_bool_false,
             "dynamic_cover": self.check_bool_false,
             "static_cover": self.check_bool_false,
             "twc_tiktok": self.check_str,
@@ -234,6 +346,9 @@ class Parameter:
             "run_command": self.__check_run_command,
             "ffmpeg": self.__generate_ffmpeg_object,
             "live_qualities": self.__check_live_qualities,
+            "prewarm": self.check_bool_false,
+            "extract_processes": self.__check_extract_processes,
+            "extract_threshold": self.__check_extract_threshold,
             "douyin_platform": self.check_bool_true,
             "tiktok_platform": self.check_bool_true,
         }
@@ -273,6 +388,56 @@ class Parameter:
             self.logger.warning(_("{name} 参数格式错误").format(name=name))
         return {}, ""
 
+    def __check_cookie_pool(
+        self,
+        cookies: list[dict | str] | None,
+        name="cookie_pool",
+    ) -> list[dict | str]:
+        if not cookies:
+            return []
+        if isinstance(cookies, list):
+            items = [i for i in cookies if i and isinstance(i, dict | str)]
+            self.logger.info(f"{name} 参数已设置 {len(items)} 个 Cookie", False)
+            return items
+        self.logger.warning(_("{name} 参数格式错误").format(name=name))
+        return []
+
+    def __check_cookie_budget(self, cookie_budget: int) -> int:
+        return self.__check_number_value(
+            cookie_budget,
+            "cookie_budget",
+            0,
+            0,
+        )
+
+    def __check_extract_processes(self, extract_processes: int) -> int:
+        return self.__check_number_value(
+            extract_processes,
+            "extract_processes",
+            0,
+            0,
+        )
+
+    def __check_extract_threshold(self, extract_threshold: int) -> int:
+        return self.__check_number_value(
+            extract_threshold,
+            "extract_threshold",
+            1,
+            5000,
+        )
+
+    def __update_cookie_pool(self) -> None:
+        self.cookie_pool.budget = self.cookie_budget
+        self.cookie_pool_tiktok.budget = self.cookie_budget
+        self.cookie_pool.update(
+            self.cookie_dict or self.cookie_str,
+            self.cookie_pool_items,
+        )
+        self.cookie_pool_tiktok.update(
+            self.cookie_dict_tiktok or self.cookie_str_tiktok,
+            self.cookie_pool_items_tiktok,
+        )
+
     def __get_cookie(
         self,
         cookie: dict,
@@ -432,15 +597,76 @@ class Parameter:
     ) -> str | None:
         return self.__check_proxy(
             proxy,
-            "https://www.tiktok.com/explore",
+            self.PROXY_CHECK_URL_TIKTOK,
             "TikTok",
             self.tiktok_platform,
         )
 
+    def __check_http2(self, http2: bool) -> bool:
+        if not self.check_bool_false(http2):
+            return False
+        if HTTP2_SUPPORT:
+            self.logger.info("http2 参数已设置为 True", False)
+            return True
+        self.logger.warning(
+            _("未安装 h2 库，无法启用 HTTP/2，程序将使用 HTTP/1.1"),
+        )
+        return False
+
+    @property
+    def transport_options(self) -> dict:
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "resolver": self.resolver,
+        }
+
+    @property
+    def client_options(self) -> dict:
+        # 记录各域名最近一次请求的时间，供连接预热判断域名是否空闲
+        return self.transport_options | {
+            "event_hooks": {"request": [self.__record_activity]},
+        }
+
+    def __create_client(self, proxy: str | None):
+        return create_client(
+            timeout=self.timeout,
+            proxy=proxy,
+            **self.client_options,
+        )
+
+    async def __record_activity(self, request: Request) -> None:
+        if not request.extensions.get("prewarm"):
+            self.activity[request.url.host] = monotonic()
+
+    def __check_proxy_pool(
+        self,
+        proxies: list[str] | None,
+        name="proxy_pool",
+        enable=True,
+    ) -> list[str]:
+        if not enable or not proxies:
+            return []
+        if isinstance(proxies, list):
+            items = [i for i in proxies if i and isinstance(i, str)]
+            self.logger.info(f"{name} 参数已设置 {len(items)} 个代理", False)
+            return items
+        self.logger.warning(_("{name} 参数格式错误").format(name=name))
+        return []
+
+    @staticmethod
+    def __normalize_proxy(proxy: str | None | dict) -> str | None:
+        # 与代理检查结果保持一致，空字符串视为未设置代理
+        if isinstance(proxy, dict):
+            proxy = proxy.get("https://")
+        return (proxy.strip() or None) if isinstance(proxy, str) else None
+
     def __check_proxy(
         self,
         proxy: str | None | dict,
-        url="https://www.douyin.com/?recommend=1",
+        url=PROXY_CHECK_URL,
         remark=_("抖音"),
         enable=True,
     ) -> str | None:
@@ -452,8 +678,8 @@ class Parameter:
                         remark=remark
                     )
                 )
-                if not (proxy := proxy.get("https://")):
-                    return None
+            if not (proxy := self.__normalize_proxy(proxy)):
+                return None
             try:
                 response = get(
                     url,
@@ -530,6 +756,11 @@ class Parameter:
         )
 
     def __check_storage_format(self, storage_format: str) -> str:
+        if storage_format == "parquet" and not PARQUET_SUPPORT:
+            self.logger.warning(
+                _("未安装 pyarrow 库，程序默认不会储存任何数据至文件"),
+            )
+            return ""
         if storage_format in RecordManager.DataLogger.keys():
             self.logger.info(f"storage_format 参数已设置为 {storage_format}", False)
             return storage_format
@@ -545,6 +776,26 @@ class Parameter:
             )
         return ""
 
+    def __check_storage_compression(self, storage_compression: str) -> str:
+        if not storage_compression:
+            return ""
+        if storage_compression not in COMPRESSION:
+            self.logger.warning(
+                _(
+                    "storage_compression 参数 {storage_compression} 设置错误，程序不会压缩数据文件"
+                ).format(storage_compression=storage_compression),
+            )
+            return ""
+        if storage_compression == "zstd" and not ZSTD_SUPPORT:
+            self.logger.warning(
+                _("未安装 zstandard 库，storage_compression 参数已设置为 gzip"),
+            )
+            return "gzip"
+        self.logger.info(
+            f"storage_compression 参数已设置为 {storage_compression}", False
+        )
+        return storage_compression
+
     @staticmethod
     def __check_run_command(run_command: str) -> list:
         return run_command.split()[::-1] if run_command else []
@@ -824,15 +1075,36 @@ class Parameter:
             "date_format": self.date_format,
             "split": self.split,
             "folder_mode": self.folder_mode,
+            "folder_shard": self.folder_shard,
             "music": self.music,
             "truncate": self.truncate,
+            "progress_mode": self.progress_mode,
             "storage_format": self.storage_format,
+            "storage_compression": self.storage_compression,
+            "storage_source": self.storage_source,
             "cookie": self.cookie_str or self.cookie_dict,
             "cookie_tiktok": self.cookie_str_tiktok or self.cookie_dict_tiktok,
+            "cookie_pool": self.cookie_pool_items,
+            "cookie_pool_tiktok": self.cookie_pool_items_tiktok,
+            "cookie_budget": self.cookie_budget,
             "dynamic_cover": self.dynamic_cover,
             "static_cover": self.static_cover,
             "proxy": self.proxy,
             "proxy_tiktok": self.proxy_tiktok,
+            "proxy_pool": [i.proxy for i in self.proxy_pool.items],
+            "proxy_pool_tiktok": [i.proxy for i in self.proxy_pool_tiktok.items],
+            "proxy_check_url": self.proxy_pool.check_url,
+            "proxy_check_url_tiktok": self.proxy_pool_tiktok.check_url,
+            "proxy_check_interval": self.proxy_check_interval,
+            "proxy_concurrency": self.proxy_concurrency,
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "dns_cache_ttl": self.dns_cache_ttl,
+            "prewarm": self.prewarm,
+            "extract_processes": self.extract_processes,
+            "extract_threshold": self.extract_threshold,
             "twc_tiktok": self.twc_tiktok,
             "download": self.download,
             "max_size": self.max_size,
@@ -863,6 +1135,17 @@ class Parameter:
                 "cookie_tiktok",
             ),
         )
+        self.set_cookie_pool(
+            data.pop(
+                "cookie_pool",
+            ),
+            data.pop(
+                "cookie_pool_tiktok",
+            ),
+            data.pop(
+                "cookie_budget",
+            ),
+        )
         self.set_browser_info(
             data.pop(
                 "browser_info",
@@ -879,6 +1162,26 @@ class Parameter:
                 "proxy_tiktok",
             ),
         )
+        await self.set_proxy_pool(
+            data.pop(
+                "proxy_pool",
+            ),
+            data.pop(
+                "proxy_pool_tiktok",
+            ),
+            data.pop(
+                "proxy_check_url",
+            ),
+            data.pop(
+                "proxy_check_url_tiktok",
+            ),
+            data.pop(
+                "proxy_check_interval",
+            ),
+            data.pop(
+                "proxy_concurrency",
+            ),
+        )
         self.set_general_params(data)
 
     async def __update_cookie_data(self, data: dict) -> None:
@@ -948,6 +1251,24 @@ class Parameter:
             )
             self.cookie_tiktok_state: bool = self.__check_cookie_state(True)
             self.__update_download_headers_tiktok()
+        self.__update_cookie_pool()
+
+    def set_cookie_pool(
+        self,
+        cookie_pool: list[dict | str] | None,
+        cookie_pool_tiktok: list[dict | str] | None,
+        cookie_budget: int | None = None,
+    ) -> None:
+        if isinstance(cookie_pool, list):
+            self.cookie_pool_items = self.__check_cookie_pool(cookie_pool)
+        if isinstance(cookie_pool_tiktok, list):
+            self.cookie_pool_items_tiktok = self.__check_cookie_pool(
+                cookie_pool_tiktok,
+                "cookie_pool_tiktok",
+            )
+        if cookie_budget is not None:
+            self.cookie_budget = self.__check_cookie_budget(cookie_budget)
+        self.__update_cookie_pool()
 
     def set_general_params(self, data: dict[str, Any]) -> None:
         for i, j in data.items():
@@ -955,22 +1276,69 @@ class Parameter:
                 self.__CHECK[i](j)
 
     async def set_proxy(self, proxy: str | None, proxy_tiktok: str | None):
-        if isinstance(proxy, str):
+        # 代理未发生变化时保留原有客户端及其连接池
+        if isinstance(proxy, str) and self.__normalize_proxy(proxy) != self.proxy:
             self.proxy: str | None = self.__check_proxy(
                 proxy,
                 remark=_("抖音"),
                 enable=self.douyin_platform,
             )
-        if isinstance(proxy_tiktok, str):
+            await self.client.aclose()
+            await self.client_download.aclose()
+            self.client = self.__create_client(self.proxy)
+            self.client_download = self.__create_client(self.proxy)
+        if (
+            isinstance(proxy_tiktok, str)
+            and self.__normalize_proxy(proxy_tiktok) != self.proxy_tiktok
+        ):
             self.proxy_tiktok: str | None = self.__check_proxy_tiktok(proxy_tiktok)
-        await self.close_client()
-        self.client = create_client(
-            timeout=self.timeout,
-            proxy=self.proxy,
+            await self.client_tiktok.aclose()
+            await self.client_download_tiktok.aclose()
+            self.client_tiktok = self.__create_client(self.proxy_tiktok)
+            self.client_download_tiktok = self.__create_client(self.proxy_tiktok)
+
+    async def set_proxy_pool(
+        self,
+        proxy_pool: list[str] | None,
+        proxy_pool_tiktok: list[str] | None,
+        proxy_check_url: str | None = None,
+        proxy_check_url_tiktok: str | None = None,
+        proxy_check_interval: int | None = None,
+        proxy_concurrency: int | None = None,
+    ) -> None:
+        if proxy_check_interval is not None:
+            self.proxy_check_interval = self.__check_number_value(
+                proxy_check_interval,
+                "proxy_check_interval",
+                0,
+                300,
+            )
+        if proxy_concurrency is not None:
+            self.proxy_concurrency = self.__check_number_value(
+                proxy_concurrency,
+                "proxy_concurrency",
+                1,
+                4,
+            )
+        await self.proxy_pool.update(
+            self.__check_proxy_pool(proxy_pool, enable=self.douyin_platform)
+            if isinstance(proxy_pool, list)
+            else [i.proxy for i in self.proxy_pool.items],
+            self.check_str(proxy_check_url),
+            self.proxy_check_interval,
+            self.proxy_concurrency,
         )
-        self.client_tiktok = create_client(
-            timeout=self.timeout,
-            proxy=self.proxy_tiktok,
+        await self.proxy_pool_tiktok.update(
+            self.__check_proxy_pool(
+                proxy_pool_tiktok,
+                "proxy_pool_tiktok",
+                self.tiktok_platform,
+            )
+            if isinstance(proxy_pool_tiktok, list)
+            else [i.proxy for i in self.proxy_pool_tiktok.items],
+            self.check_str(proxy_check_url_tiktok),
+            self.proxy_check_interval,
+            self.proxy_concurrency,
         )
 
     @staticmethod
@@ -999,6 +1367,10 @@ class Parameter:
     async def close_client(self) -> None:
         await self.client.aclose()
         await self.client_tiktok.aclose()
+        await self.client_download.aclose()
+        await self.client_download_tiktok.aclose()
+        await self.proxy_pool.close()
+        await self.proxy_pool_tiktok.close()
 
     def __generate_folders(self):
         self.compatible()
@@ -1085,6 +1457,32 @@ class Parameter:
             50,
         )
 
+    def __check_folder_shard(self, folder_shard: str) -> str:
+        if not folder_shard:
+            return ""
+        if folder_shard not in FOLDER_SHARD:
+            self.logger.warning(
+                _(
+                    "folder_shard 参数 {folder_shard} 设置错误，程序不会分片储存作品文件"
+                ).format(folder_shard=folder_shard),
+            )
+            return ""
+        self.logger.info(f"folder_shard 参数已设置为 {folder_shard}", False)
+        return folder_shard
+
+    def __check_progress_mode(self, progress_mode: str) -> str:
+        if not progress_mode:
+            return ""
+        if progress_mode != "json":
+            self.logger.warning(
+                _(
+                    "progress_mode 参数 {progress_mode} 设置错误，程序将会使用默认值"
+                ).format(progress_mode=progress_mode),
+            )
+            return ""
+        self.logger.info(f"progress_mode 参数已设置为 {progress_mode}", False)
+        return progress_mode
+
     def __check_name_length(self, name_length: int) -> int:
         return self.__check_number_value(
             name_length,
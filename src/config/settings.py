@@ -69,15 +69,36 @@ class Settings:
         "date_format": "%Y-%m-%d %H:%M:%S",
         "split": "-",
         "folder_mode": False,
+        "folder_shard": "",  # 分片储存模式，支持 date、hash
         "music": False,
         "truncate": 50,
+        "progress_mode": "",  # 下载进度显示模式，json 为无界面模式
         "storage_format": "",
+        "storage_compression": "",  # 分卷数据文件压缩格式，支持 gzip、zstd
+        "storage_source": False,  # NDJSON 格式是否同时保存接口原始数据
         "cookie": "",
         "cookie_tiktok": "",
+        "cookie_pool": [],
+        "cookie_pool_tiktok": [],
+        "cookie_budget": 0,  # 单个 Cookie 每分钟请求次数上限
         "dynamic_cover": False,
         "static_cover": False,
         "proxy": "",
         "proxy_tiktok": "",
+        "proxy_pool": [],
+        "proxy_pool_tiktok": [],
+        "proxy_check_url": "",
+        "proxy_check_url_tiktok": "",
+        "proxy_check_interval": 300,  # 代理池健康检查间隔，单位：秒
+        "proxy_concurrency": 4,  # 单个代理的最大并发请求数
+        "http2": False,
+        "max_connections": 100,  # 单个连接池的最大连接数
+        "max_keepalive_connections": 20,  # 单个连接池保持活动的最大连接数
+        "keepalive_expiry": 5,  # 空闲连接保持时间，单位：秒
+        "dns_cache_ttl": 300,  # 域名解析缓存有效期，单位：秒
+        "prewarm": False,
+        "extract_processes": 0,  # 多进程提取数据使用的进程数量，0 表示关闭
+        "extract_threshold": 5000,  # 启用多进程提取数据的最小数据数量
         "twc_tiktok": "",
         "download": True,
         "max_size": 0,
@@ -2,6 +2,7 @@ from .function import (
     wait,
     failure_handling,
     condition_filter,
+    condition_prefilter,
     suspend,
     is_valid_token,
 )
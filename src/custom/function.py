@@ -39,6 +39,17 @@ def condition_filter(data: dict) -> bool:
     return True
 
 
+def condition_prefilter(data: dict, tiktok: bool) -> bool:
+    """
+    自定义作品预筛选规则，在分页获取数据时对接口返回的原始数据生效，早于数据提取与记录
+    适合根据原始数据字段快速排除作品，例如：抖音作品 data["statistics"]["digg_count"]、TikTok 作品 data["stats"]["diggCount"]
+    需要排除的作品返回 False，否则返回 True
+    """
+    # if not tiktok and data.get("statistics", {}).get("digg_count", 0) < 100:
+    #     return False  # 过滤点赞数量低于 100 的抖音作品
+    return True
+
+
 async def suspend(count: int, console: "ColorfulConsole") -> None:
     """
     如需采集大量数据，请启用该函数，可以在处理指定数量的数据后，暂停一段时间，然后继续运行
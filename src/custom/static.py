@@ -51,6 +51,9 @@ FILE_SIGNATURES: tuple[
     (0, b"\x00\x00\x01\xba", "mpg"),
     (0, b"\x46\x4c\x56\x01", "flv"),
     (8, b"\x41\x56\x49\x20", "avi"),
+    (4, b"\x66\x74\x79\x70\x4d\x34\x41\x20", "m4a"),
+    (0, b"\x49\x44\x33", "mp3"),
+    (4, b"\x66\x74\x79\x70", "mp4"),
 )
 FILE_SIGNATURES_LENGTH = max(
     offset + len(signature) for offset, signature, _ in FILE_SIGNATURES
@@ -1,25 +1,27 @@
-from asyncio import Semaphore, gather
+from asyncio import Semaphore, gather, to_thread
 from datetime import datetime
+from hashlib import sha256
 from pathlib import Path
 from shutil import move
-from time import time
+from time import perf_counter, time
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Callable, Union
+from urllib.parse import urlparse
 
 from aiofiles import open
 from httpx import HTTPStatusError, RequestError, StreamError
 from rich.progress import (
     BarColumn,
-    DownloadColumn,
     Progress,
     SpinnerColumn,
     TextColumn,
     TimeElapsedColumn,
-    TimeRemainingColumn,
     TransferSpeedColumn,
 )
 
 from ..custom import (
+    FILE_SIGNATURES,
+    FILE_SIGNATURES_LENGTH,
     MAX_WORKERS,
     PROGRESS,
 )
@@ -28,21 +30,25 @@ from ..tools import (
     DownloaderError,
     FakeProgress,
     Retry,
+    TransferProgress,
     beautify_string,
     format_size,
+    shard_parts,
 )
 from ..translation import _
+from .scheduler import DownloadScheduler
 
 if TYPE_CHECKING:
     from httpx import AsyncClient
 
     from ..config import Parameter
+    from ..tools import ProxyPool
 
 __all__ = ["Downloader"]
 
 
 class Downloader:
-    semaphore = Semaphore(MAX_WORKERS)
+    scheduler = DownloadScheduler(MAX_WORKERS)
     CONTENT_TYPE_MAP = {
         "image/png": "png",
         "image/jpeg": "jpeg",
@@ -52,6 +58,26 @@ class Downloader:
         "audio/mp4": "m4a",
         "audio/mpeg": "mp3",
     }
+    # 同一文件格式的不同后缀，文件签名与现有后缀属于同一格式时不修改后缀
+    SUFFIX_ALIASES = {
+        "jpg": "jpeg",
+        "m4v": "mp4",
+    }
+    # 接口返回错误信息时的响应类型与响应内容开头
+    ERROR_CONTENT_TYPES = (
+        "text/html",
+        "text/plain",
+        "text/xml",
+        "application/json",
+        "application/xml",
+    )
+    ERROR_SIGNATURES = (
+        b"<!doctype",
+        b"<html",
+        b"<?xml",
+        b"{",
+        b"[",
+    )
 
     def __init__(
         self,
@@ -59,8 +85,10 @@ class Downloader:
         server_mode: bool = False,
     ):
         self.cleaner = params.CLEANER
-        self.client: "AsyncClient" = params.client
-        self.client_tiktok: "AsyncClient" = params.client_tiktok
+        self.client: "AsyncClient" = params.client_download
+        self.client_tiktok: "AsyncClient" = params.client_download_tiktok
+        self.proxy_pool: "ProxyPool" = params.proxy_pool
+        self.proxy_pool_tiktok: "ProxyPool" = params.proxy_pool_tiktok
         self.headers = params.headers_download
         self.headers_tiktok = params.headers_download_tiktok
         self.log = params.logger
@@ -73,6 +101,8 @@ class Downloader:
         self.name_length = params.name_length
         self.split = params.split
         self.folder_mode = params.folder_mode
+        self.folder_shard = params.folder_shard
+        self.shards = set()  # 已创建的分片文件夹
         self.music = params.music
         self.dynamic_cover = params.dynamic_cover
         self.static_cover = params.static_cover
@@ -85,10 +115,13 @@ class Downloader:
         self.chunk = params.chunk
         self.max_retry = params.max_retry
         self.recorder = params.recorder
+        self.prewarm = params.prewarm
+        self.hosts = set()
         self.timeout = params.timeout
         self.ffmpeg = params.ffmpeg
         self.cache = params.cache
         self.truncate = params.truncate
+        self.progress_mode = params.progress_mode
         self.general_progress_object: Callable = self.init_general_progress(
             server_mode,
         )
@@ -109,23 +142,10 @@ class Downloader:
         return FakeProgress()
 
     def __general_progress_object(self):
-        """文件下载进度条"""
-        return Progress(
-            TextColumn(
-                "[progress.description]{task.description}",
-                style=PROGRESS,
-                justify="left",
-            ),
-            SpinnerColumn(),
-            BarColumn(bar_width=20),
-            "[progress.percentage]{task.percentage:>3.1f}%",
-            "•",
-            DownloadColumn(binary_units=True),
-            "•",
-            TimeRemainingColumn(),
-            console=self.console,
-            transient=True,
-            expand=True,
+        """文件下载进度汇总"""
+        return TransferProgress(
+            self.console,
+            self.progress_mode == "json",
         )
 
     def __live_progress_object(self):
@@ -305,7 +325,7 @@ class Downloader:
             )
             name = self.generate_detail_name(item)
             temp_root, actual_root = self.deal_folder_path(
-                root,
+                self.shard_folder(root, item),
                 name,
                 self.folder_mode,
             )
@@ -333,6 +353,7 @@ class Downloader:
                 await self.download_image(
                     suffix="mp4",
                     type_=_("实况"),
+                    role="live",
                     **params,
                     skipped=count.skipped_live,
                 )
@@ -382,6 +403,22 @@ class Downloader:
         actual = root.joinpath(name)
         return cache, actual
 
+    def shard_folder(self, root: Path, item: dict) -> Path:
+        """返回作品文件所在的分片文件夹，未启用分片储存时返回储存文件夹"""
+        if not self.folder_shard:
+            return root
+        folder = root.joinpath(
+            *shard_parts(
+                self.folder_shard,
+                item["id"],
+                item.get("create_timestamp"),
+            )
+        )
+        if folder not in self.shards:
+            folder.mkdir(parents=True, exist_ok=True)
+            self.shards.add(folder)
+        return folder
+
     async def is_downloaded(self, id_: str) -> bool:
         return await self.recorder.has_id(id_)
 
@@ -403,6 +440,7 @@ class Downloader:
         actual_root: Path,
         suffix: str = "jpeg",
         type_: str = _("图集"),
+        role: str = "image",
     ) -> None:
         if not item["downloads"]:
             self.log.error(
@@ -440,6 +478,8 @@ class Downloader:
                     f"【{type_}】{name}_{index}",
                     id_,
                     suffix,
+                    f"{role}_{index}",
+                    self.scheduler.estimate(role),
                 )
             )
 
@@ -484,6 +524,8 @@ class Downloader:
                 f"【{type_}】{name}",
                 id_,
                 suffix,
+                "video",
+                self.scheduler.estimate("video", item["duration"]),
             )
         )
 
@@ -517,6 +559,8 @@ class Downloader:
                     ),
                     id_,
                     suffix,
+                    "music",
+                    self.scheduler.estimate("music"),
                 )
             )
 
@@ -549,6 +593,8 @@ class Downloader:
                     f"【封面】{name}",
                     id_,
                     static_suffix,
+                    "cover",
+                    self.scheduler.estimate("cover"),
                 )
             )
         if all(
@@ -568,6 +614,8 @@ class Downloader:
                     f"【动图】{name}",
                     id_,
                     dynamic_suffix,
+                    "dynamic_cover",
+                    self.scheduler.estimate("dynamic_cover"),
                 )
             )
 
@@ -589,6 +637,8 @@ class Downloader:
         show: str,
         id_: str,
         suffix: str,
+        role: str,
+        size: int,
         count: SimpleNamespace,
         progress: Progress,
         headers: dict = None,
@@ -596,92 +646,146 @@ class Downloader:
         unknown_size=False,
         semaphore: Semaphore = None,
     ) -> bool | None:
-        async with semaphore or self.semaphore:
-            client = self.client_tiktok if tiktok else self.client
-            headers = self.__adapter_headers(
-                headers,
-                tiktok,
-            )
-            self.__record_request_messages(
-                show,
-                url,
-                headers,
-            )
-            try:
-                # length, suffix = await self.__head_file(client, url, headers, suffix, )
-                position = self.__update_headers_range(
-                    headers,
+        # 未指定信号量时，按预估文件大小调度下载任务
+        async with semaphore or self.scheduler.slot(size):
+            # 设置 proxy 参数时优先使用指定代理，不使用代理池
+            if (self.proxy_tiktok if tiktok else self.proxy) or not (
+                pool := self.proxy_pool_tiktok if tiktok else self.proxy_pool
+            ):
+                return await self.__request_file(
+                    self.client_tiktok if tiktok else self.client,
+                    url,
                     temp,
+                    actual,
+                    show,
+                    id_,
+                    suffix,
+                    role,
+                    count,
+                    progress,
+                    headers,
+                    tiktok,
+                    unknown_size,
                 )
-                async with client.stream(
-                    "GET",
+            async with pool.lease() as item:
+                result = await self.__request_file(
+                    item.client,
                     url,
-                    headers=headers,
-                ) as response:
-                    if response.status_code == 416:
-                        raise CacheError(_("文件缓存异常，尝试重新下载"))
-                    response.raise_for_status()
-                    length, suffix = self._extract_content(
-                        response.headers,
-                        suffix,
-                    )
-                    length += position
-                    self._record_response(
-                        response,
-                        show,
-                        length,
-                    )
-                    match self._download_initial_check(
-                        length,
-                        unknown_size,
-                        show,
-                    ):
-                        case 1:
-                            return await self.download_file(
-                                temp,
-                                actual.with_suffix(
-                                    f".{suffix}",
-                                ),
-                                show,
-                                id_,
-                                response,
-                                length,
-                                position,
-                                count,
-                                progress,
-                            )
-                        case 0:
-                            return True
-                        case -1:
-                            return False
-                        case _:
-                            raise DownloaderError
-            except RequestError as e:
-                self.log.warning(_("网络异常: {error_repr}").format(error_repr=repr(e)))
-                return False
-            except HTTPStatusError as e:
-                self.log.warning(
-                    _("响应码异常: {error_repr}").format(error_repr=repr(e))
+                    temp,
+                    actual,
+                    show,
+                    id_,
+                    suffix,
+                    role,
+                    count,
+                    progress,
+                    headers,
+                    tiktok,
+                    unknown_size,
                 )
-                self.console.warning(
-                    _(
-                        "如果 TikTok 平台作品下载功能异常，请检查配置文件中 browser_info_tiktok 的 device_id 参数！"
-                    ),
+                pool.feedback(item, bool(result))
+                return result
+
+    async def __request_file(
+        self,
+        client: "AsyncClient",
+        url: str,
+        temp: Path,
+        actual: Path,
+        show: str,
+        id_: str,
+        suffix: str,
+        role: str,
+        count: SimpleNamespace,
+        progress: Progress,
+        headers: dict = None,
+        tiktok=False,
+        unknown_size=False,
+    ) -> bool | None:
+        headers = self.__adapter_headers(
+            headers,
+            tiktok,
+        )
+        self.__record_request_messages(
+            show,
+            url,
+            headers,
+        )
+        try:
+            # length, suffix = await self.__head_file(client, url, headers, suffix, )
+            position = self.__update_headers_range(
+                headers,
+                temp,
+            )
+            async with client.stream(
+                "GET",
+                url,
+                headers=headers,
+            ) as response:
+                if response.status_code == 416:
+                    raise CacheError(_("文件缓存异常，尝试重新下载"))
+                response.raise_for_status()
+                await self.__record_host(url, tiktok)
+                length, suffix = self._extract_content(
+                    response.headers,
+                    suffix,
                 )
-                return False
-            except CacheError as e:
-                self.delete(temp)
-                self.log.error(str(e))
-                return False
-            except Exception as e:
-                self.log.error(
-                    _(
-                        "下载文件时发生预期之外的错误，请向作者反馈，错误信息: {error}"
-                    ).format(error=repr(e)),
+                length += position
+                self._record_response(
+                    response,
+                    show,
+                    length,
                 )
-                self.log.error(f"URL: {url}", False)
-                self.log.error(f"Headers: {headers}", False)
-                return False
+                match self._download_initial_check(
+                    length,
+                    unknown_size,
+                    show,
+                ):
+                    case 1:
+                        return await self.download_file(
+                            temp,
+                            actual.with_suffix(
+                                f".{suffix}",
+                            ),
+                            show,
+                            id_,
+                            response,
+                            length,
+                            position,
+                            count,
+                            progress,
+                            role,
+                        )
+                    case 0:
+                        return True
+                    case -1:
+                        return False
+                    case _:
+                        raise DownloaderError
+        except RequestError as e:
+            self.log.warning(_("网络异常: {error_repr}").format(error_repr=repr(e)))
+            return False
+        except HTTPStatusError as e:
+            self.log.warning(_("响应码异常: {error_repr}").format(error_repr=repr(e)))
+            self.console.warning(
+                _(
+                    "如果 TikTok 平台作品下载功能异常，请检查配置文件中 browser_info_tiktok 的 device_id 参数！"
+                ),
+            )
+            return False
+        except CacheError as e:
+            self.delete(temp)
+            self.log.error(str(e))
+            return False
+        except Exception as e:
+            self.log.error(
+                _(
+                    "下载文件时发生预期之外的错误，请向作者反馈，错误信息: {error}"
+                ).format(error=repr(e)),
+            )
+            self.log.error(f"URL: {url}", False)
+            self.log.error(f"Headers: {headers}", False)
+            return False
 
     async def download_file(
         self,
@@ -694,16 +798,41 @@ class Downloader:
         position: int,
         count: SimpleNamespace,
         progress: Progress,
+        role: str = "",
     ) -> bool:
+        start = perf_counter()
+        mode = "ab"
+        if position and response.status_code != 206:
+            # 服务器未按请求范围返回数据，丢弃已缓存数据并重新写入完整文件
+            content -= position
+            position = 0
+            mode = "wb"
+        # 断点续传时先读取已缓存数据的文件签名并计算校验值，再随下载数据流式更新
+        digest, head = (
+            await to_thread(self.__read_cache, cache) if position else (sha256(), b"")
+        )
+        size = position
         task_id = progress.add_task(
             beautify_string(show, self.truncate),
             total=content or None,
             completed=position,
         )
         try:
-            async with open(cache, "ab") as f:
+            async with open(cache, mode) as f:
                 async for chunk in response.aiter_bytes(self.chunk):
+                    # 数据块大小不小于 128 KB，第一个数据块包含完整的文件签名
+                    if size == position and not (
+                        actual := self.__check_head(
+                            head + chunk,
+                            response.headers.get("Content-Type", ""),
+                            actual,
+                            show,
+                        )
+                    ):
+                        break
                     await f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
                     progress.update(task_id, advance=len(chunk))
                 progress.remove_task(task_id)
         except (
@@ -717,13 +846,114 @@ class Downloader:
             # self.delete_file(cache)
             await self.recorder.delete_id(id_)
             return False
+        if not actual or not self.__check_size(response, content, size, show):
+            # 响应内容不是有效文件或文件不完整，不保存文件，执行重试
+            if (not actual and not position) or (content and size > content):
+                self.delete(cache)
+            await self.recorder.delete_id(id_)
+            return False
         self.save_file(cache, actual)
         self.log.info(_("{show} 文件下载成功").format(show=show))
         self.log.info(f"文件路径 {actual.resolve()}", False)
         await self.recorder.update_id(id_)
+        await self.recorder.update_file(
+            str(actual.resolve()),
+            id_,
+            role,
+            self.__catalog_folder(actual),
+            size,
+            response.headers.get("Content-Type", ""),
+            digest.hexdigest(),
+            response.url.host,
+            perf_counter() - start,
+        )
         self.add_count(show, id_, count)
         return True
 
+    @staticmethod
+    def __read_cache(cache: Path):
+        digest = sha256()
+        with cache.open("rb") as f:
+            head = f.read(FILE_SIGNATURES_LENGTH)
+            digest.update(head)
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+        return digest, head
+
+    def __check_head(
+        self,
+        head: bytes,
+        content_type: str,
+        actual: Path,
+        show: str,
+    ) -> Path | None:
+        """检查文件开头数据，返回按文件签名修正后缀的文件路径；响应内容无效时返回 None"""
+        if self.is_error_body(head, content_type):
+            self.log.warning(
+                _("{show} 响应内容不是有效的文件，尝试重新下载").format(show=show)
+            )
+            self.log.info(f"{show} 响应内容: {head[:64]!r}", False)
+            return None
+        if (suffix := self.sniff_type(head)) and self.SUFFIX_ALIASES.get(
+            suffix, suffix
+        ) != self.SUFFIX_ALIASES.get(s := actual.suffix[1:], s):
+            self.log.info(f"{show} 文件签名类型 {suffix}", False)
+            return actual.with_suffix(f".{suffix}")
+        return actual
+
+    def __check_size(self, response, content: int, size: int, show: str) -> bool:
+        # 响应内容经过压缩时，响应头的文件大小与解压后的数据大小不一致，不检查文件大小
+        if (
+            not content
+            or size == content
+            or response.headers.get("Content-Encoding", "identity") != "identity"
+        ):
+            return True
+        self.log.warning(
+            _(
+                "{show} 文件不完整，预期大小 {expected} 字节，实际大小 {actual} 字节"
+            ).format(
+                show=show,
+                expected=content,
+                actual=size,
+            )
+        )
+        return False
+
+    @staticmethod
+    def sniff_type(head: bytes) -> str:
+        """根据文件签名判断文件类型，返回文件后缀，未知类型返回空字符串"""
+        for offset, signature, suffix in FILE_SIGNATURES:
+            if head[offset : offset + len(signature)] == signature:
+                return suffix
+        return ""
+
+    @classmethod
+    def is_error_body(cls, head: bytes, content_type: str) -> bool:
+        """判断响应内容是否为网页或 JSON 格式的错误信息"""
+        # 响应内容匹配文件签名时，不受错误的 Content-Type 影响
+        if cls.sniff_type(head):
+            return False
+        if head.lstrip()[:9].lower().startswith(cls.ERROR_SIGNATURES):
+            return True
+        media_type = content_type.split(";")[0].strip().lower()
+        return media_type in cls.ERROR_CONTENT_TYPES
+
+    def __catalog_folder(self, path: Path) -> str:
+        """返回文件所属的储存文件夹名称，例如账号作品文件夹，不包含分片文件夹"""
+        try:
+            return path.resolve().relative_to(self.root.resolve()).parts[0]
+        except (ValueError, IndexError):
+            return path.parent.name
+
+    async def __record_host(self, url: str, tiktok: bool) -> None:
+        # 仅在启用预热时记录下载域名
+        if not self.prewarm:
+            return
+        if (host := urlparse(url).hostname) and host not in self.hosts:
+            self.hosts.add(host)
+            await self.recorder.update_host(host, tiktok)
+
     def __record_request_messages(
         self,
         show: str,
@@ -0,0 +1,113 @@
+from asyncio import CancelledError, Future, get_running_loop
+from contextlib import asynccontextmanager
+from heapq import heappop, heappush
+from itertools import count
+from time import monotonic
+
+from ..custom import MAX_WORKERS
+
+__all__ = ["DownloadScheduler"]
+
+
+class DownloadScheduler:
+    """按文件大小调度下载任务
+
+    等待中的任务按预估文件大小排序，较小的文件优先下载；任务等待时间越长优先级越高，
+    避免大文件长期等待；大文件最多占用 workers - reserved 个下载位置，
+    保留的下载位置仅用于下载小文件
+    """
+
+    LARGE_SIZE = 16 * 1024 * 1024  # 大文件阈值，单位：字节
+    AGING_RATE = 2 * 1024 * 1024  # 任务每等待一秒，优先级提高相当于该字节数
+    VIDEO_BITRATE = 256 * 1024  # 视频平均码率，用于根据时长预估文件大小，单位：字节/秒
+    # 各类文件的预估大小，单位：字节
+    ESTIMATED_SIZE = {
+        "video": 32 * 1024 * 1024,
+        "image": 1024 * 1024,
+        "live": 4 * 1024 * 1024,
+        "music": 4 * 1024 * 1024,
+        "cover": 256 * 1024,
+        "dynamic_cover": 1024 * 1024,
+    }
+
+    def __init__(self, workers: int = MAX_WORKERS, reserved: int = 1):
+        self.workers = workers
+        self.reserved = min(reserved, workers - 1)  # 为小文件保留的下载位置数量
+        self.running = 0  # 正在下载的任务数量
+        self.large = 0  # 正在下载的大文件任务数量
+        self.small_queue: list[tuple[float, int, Future]] = []
+        self.large_queue: list[tuple[float, int, Future]] = []
+        self.counter = count()  # 优先级相同时按提交顺序执行
+
+    @classmethod
+    def estimate(cls, role: str, duration: str = "") -> int:
+        """根据文件类型与作品时长预估文件大小"""
+        role = role.rsplit("_", 1)[0] if role[-1:].isdigit() else role
+        if role == "video" and (seconds := cls.__seconds(duration)):
+            return seconds * cls.VIDEO_BITRATE
+        return cls.ESTIMATED_SIZE.get(role, cls.ESTIMATED_SIZE["video"])
+
+    @asynccontextmanager
+    async def slot(self, size: int = 0):
+        """等待下载位置，退出时释放下载位置"""
+        large = size >= self.LARGE_SIZE
+        await self.__acquire(size, large)
+        try:
+            yield
+        finally:
+            self.__release(large)
+
+    async def __acquire(self, size: int, large: bool) -> None:
+        future = get_running_loop().create_future()
+        heappush(
+            self.large_queue if large else self.small_queue,
+            # 等待时间的优先级补偿对所有任务相同，按提交时间折算为固定的排序值
+            (size + monotonic() * self.AGING_RATE, next(self.counter), future),
+        )
+        self.__dispatch()
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                # 已分配下载位置的任务被取消，释放下载位置
+                self.__release(large)
+            raise
+
+    def __release(self, large: bool) -> None:
+        self.running -= 1
+        if large:
+            self.large -= 1
+        self.__dispatch()
+
+    def __dispatch(self) -> None:
+        while self.running < self.workers:
+            self.__discard(self.small_queue)
+            self.__discard(self.large_queue)
+            small = self.small_queue[0] if self.small_queue else None
+            large = (
+                self.large_queue[0]
+                if self.large_queue and self.large < self.workers - self.reserved
+                else None
+            )
+            if not (small or large):
+                return
+            if small and (not large or small < large):
+                heappop(self.small_queue)[2].set_result(None)
+            else:
+                heappop(self.large_queue)[2].set_result(None)
+                self.large += 1
+            self.running += 1
+
+    @staticmethod
+    def __discard(queue: list[tuple[float, int, Future]]) -> None:
+        # 移除已取消的等待任务
+        while queue and queue[0][2].cancelled():
+            heappop(queue)
+
+    @staticmethod
+    def __seconds(duration: str) -> int:
+        try:
+            hours, minutes, seconds = map(int, duration.split(":"))
+        except (AttributeError, ValueError):
+            return 0
+        return hours * 3600 + minutes * 60 + seconds
@@ -1,3 +1,5 @@
 from .extractor import Extractor
+from .plan import ExtractPlan, Field
+from .record import DetailRecord, to_dict
 
-__all__ = ["Extractor"]
+__all__ = ["Extractor", "ExtractPlan", "Field", "DetailRecord", "to_dict"]
@@ -1,20 +1,17 @@
+from asyncio import gather, get_running_loop
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from json import dumps
+from multiprocessing import get_context
 from time import localtime, strftime
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 from ..custom import (
-    AUTHOR_COVER_INDEX,
-    AUTHOR_COVER_URL_INDEX,
-    AVATAR_LARGER_INDEX,
     BITRATE_INFO_TIKTOK_INDEX,
-    COMMENT_IMAGE_INDEX,
-    COMMENT_IMAGE_LIST_INDEX,
-    COMMENT_STICKER_INDEX,
     DYNAMIC_COVER_INDEX,
-    HOT_WORD_COVER_INDEX,
     IMAGE_INDEX,
     IMAGE_TIKTOK_INDEX,
     LIVE_COVER_INDEX,
@@ -22,7 +19,6 @@ from ..custom import (
     MUSIC_COLLECTION_COVER_INDEX,
     MUSIC_COLLECTION_DOWNLOAD_INDEX,
     MUSIC_INDEX,
-    SEARCH_AVATAR_INDEX,
     SEARCH_USER_INDEX,
     STATIC_COVER_INDEX,
     VIDEO_INDEX,
@@ -31,13 +27,34 @@ from ..custom import (
 )
 from ..tools import DownloaderError
 from ..translation import _
+from .filter import DateFilter
+from .plan import COMMENT, DETAIL, HOT, SEARCH_LIVE, SEARCH_USER, USER
+from .record import DetailRecord
+from .worker import extract_chunk, initialize
 
 if TYPE_CHECKING:
     from datetime import date
 
     from ..config import Parameter
-
-__all__ = ["Extractor"]
+    from .plan import ExtractPlan
+
+__all__ = ["Extractor", "compile_path"]
+
+
+@lru_cache(maxsize=None)
+def compile_path(attribute_chain: str) -> tuple[tuple[str, int | None], ...] | None:
+    """将 "a.b[0].c" 形式的属性链编译为 (键, 索引) 元组，索引无效时返回 None"""
+    path = []
+    for attribute in attribute_chain.split("."):
+        if "[" in attribute:
+            attribute, index = attribute.split("[", 1)
+            try:
+                path.append((attribute, int(index.split("]", 1)[0])))
+            except ValueError:
+                return None
+        else:
+            path.append((attribute, None))
+    return tuple(path)
 
 
 class Extractor:
@@ -77,6 +94,9 @@ class Extractor:
         self.log = params.logger
         self.date_format = params.date_format
         self.cleaner = params.CLEANER
+        self.processes = params.extract_processes
+        self.threshold = params.extract_threshold
+        self.executor = None
         self.type = {
             "batch": self.__batch,
             "detail": self.__detail,
@@ -87,6 +107,25 @@ class Extractor:
             "hot": self.__hot,
             "music": self.__music,
         }
+        self.items = {
+            "batch": self.__extract_batch,
+            "batch_tiktok": self.__extract_batch_tiktok,
+            "comment": self.__extract_comments_data,
+            "user": self.__extract_user_data,
+            "search_general": self.__search_result_classify,
+        }
+        transforms = {
+            "date": self.__format_date,
+            "name": self.__filter_nickname,
+            "gender": self.__format_gender,
+            "user_url": self.__generate_user_url,
+            "str": str,
+        }
+        self.plan_comment = COMMENT.compile(self.safe_extract, transforms)
+        self.plan_user = USER.compile(self.safe_extract, transforms)
+        self.plan_search_user = SEARCH_USER.compile(self.safe_extract, transforms)
+        self.plan_search_live = SEARCH_LIVE.compile(self.safe_extract, transforms)
+        self.plan_hot = HOT.compile(self.safe_extract, transforms)
 
     def get_user_info(self, data: dict) -> dict:
         try:
@@ -128,26 +167,30 @@ class Extractor:
 
     @staticmethod
     def safe_extract(
-        data: SimpleNamespace | list[SimpleNamespace],
+        data: dict | list | SimpleNamespace,
         attribute_chain: str,
         default: str | int | list | dict | SimpleNamespace = "",
     ):
-        attributes = attribute_chain.split(".")
-        for attribute in attributes:
-            if "[" in attribute:
-                parts = attribute.split("[", 1)
-                attribute = parts[0]
-                index = parts[1].split("]", 1)[0]
-                try:
-                    index = int(index)
-                    data = getattr(data, attribute, None)[index]
-                except (IndexError, TypeError, ValueError):
+        """按属性链提取数据，属性链编译结果缓存复用，直接读取原始 dict 与 list"""
+        if (path := compile_path(attribute_chain)) is None:
+            return default
+        for key, index in path:
+            if type(data) is dict:
+                data = data.get(key)
+            elif isinstance(data, SimpleNamespace):
+                data = getattr(data, key, None)
+            else:
+                data = None
+            if index is None:
+                # 空 dict 视为有效数据，与原 SimpleNamespace 转换后的判断保持一致
+                if not data and type(data) is not dict:
                     return default
             else:
-                data = getattr(data, attribute, None)
-                if not data:
+                try:
+                    data = data[index]
+                except (IndexError, KeyError, TypeError):
                     return default
-        return data or default
+        return data if data or type(data) is dict else default
 
     async def run(
         self,
@@ -155,12 +198,79 @@ class Extractor:
         recorder,
         type_="detail",
         tiktok=False,
+        capture=True,
         **kwargs,
     ) -> list[dict]:
         if type_ not in self.type.keys():
             raise DownloaderError
+        if recorder and capture:
+            await recorder.capture(data, type_, tiktok, kwargs)
         return await self.type[type_](data, recorder, tiktok, **kwargs)
 
+    def extract_items(
+        self,
+        type_: str,
+        data: list[dict],
+        container: SimpleNamespace,
+    ) -> list[dict]:
+        """在当前进程中逐条提取数据"""
+        container.all_data = []
+        container.cache = None
+        function = self.items[type_]
+        for item in data:
+            function(container, item)
+        return container.all_data
+
+    async def __extract(
+        self,
+        type_: str,
+        data: list[dict],
+        container: SimpleNamespace,
+    ) -> None:
+        """数据数量达到阈值时分块提交至进程池提取，按原始顺序合并结果"""
+        if not self.processes or len(data) < self.threshold:
+            self.extract_items(type_, data, container)
+            return
+        options = {
+            k: v for k, v in vars(container).items() if k not in {"all_data", "cache"}
+        }
+        size = max(len(data) // (self.processes * 4), 1)
+        loop = get_running_loop()
+        executor = self.__get_executor()
+        results = await gather(
+            *[
+                loop.run_in_executor(
+                    executor,
+                    extract_chunk,
+                    type_,
+                    data[i : i + size],
+                    options,
+                )
+                for i in range(0, len(data), size)
+            ]
+        )
+        container.all_data = []
+        for items, records in results:
+            container.all_data.extend(items)
+            for level, args in records:
+                getattr(self.log, level)(*args)
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        if not self.executor:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=get_context("spawn"),
+                initializer=initialize,
+                initargs=(self.cleaner, self.date_format),
+            )
+        return self.executor
+
+    def close(self) -> None:
+        if self.executor:
+            # 不等待子进程退出，避免阻塞事件循环
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
     async def __batch(
         self,
         data: list[dict],
@@ -185,19 +295,16 @@ class Extractor:
             earliest=earliest,
             latest=latest,
         )
-        self.__platform_classify_detail(
-            data,
-            container,
-            tiktok,
-        )
+        await self.__extract("batch_tiktok" if tiktok else "batch", data, container)
         container.all_data = self.__clean_extract_data(
             container.all_data,
             self.detail_necessary_keys,
         )
-        self.__extract_item_records(container.all_data)
-        await self.__record_data(recorder, container.all_data)
+        # 先筛选再记录，仅记录与下载符合条件的作品
         self.__date_filter(container)
         self.__condition_filter(container)
+        self.__extract_item_records(container.all_data)
+        await self.__record_data(recorder, container.all_data, DETAIL)
         self.__summary_detail(container.all_data)
         return container.all_data
 
@@ -219,10 +326,10 @@ class Extractor:
     def __extract_batch(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         """批量提取作品信息"""
-        container.cache = container.template.copy()
+        container.cache = DetailRecord(container.template)
         self.__extract_detail_info(container.cache, data)
         self.__extract_account_info(container, data)
         self.__extract_music(container.cache, data)
@@ -235,10 +342,10 @@ class Extractor:
     def __extract_batch_tiktok(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         """批量提取作品信息"""
-        container.cache = container.template.copy()
+        container.cache = DetailRecord(container.template)
         self.__extract_detail_info_tiktok(container.cache, data)
         self.__extract_account_info_tiktok(container, data)
         self.__extract_music(container.cache, data, True)
@@ -251,10 +358,10 @@ class Extractor:
     def __extract_extra_info(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         if e := self.safe_extract(data, "anchor_info"):
-            extra = dumps(e, ensure_ascii=False, indent=2, default=lambda x: vars(x))
+            extra = dumps(e, ensure_ascii=False, indent=2)
         else:
             extra = ""
         item["extra"] = extra
@@ -262,7 +369,7 @@ class Extractor:
     def __extract_extra_info_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         # TODO: 尚未适配 TikTok 额外信息
         item["extra"] = ""
@@ -270,18 +377,18 @@ class Extractor:
     def __extract_commodity_data(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         pass
 
     def __extract_game_data(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         pass
 
-    def __extract_description(self, data: SimpleNamespace) -> str:
+    def __extract_description(self, data: dict) -> str:
         # 2023/11/11: 抖音不再折叠过长的作品描述
         return self.safe_extract(data, "desc")
         # if len(desc := self.safe_extract(data, "desc")) < 107:
@@ -305,7 +412,7 @@ class Extractor:
     def __extract_detail_info(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         item["id"] = self.safe_extract(data, "aweme_id")
         item["desc"] = (
@@ -322,7 +429,7 @@ class Extractor:
     def __extract_detail_info_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         item["id"] = self.safe_extract(data, "id")
         item["desc"] = (
@@ -339,7 +446,7 @@ class Extractor:
     def __classifying_detail(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         # 作品分类
         if images := self.safe_extract(data, "images"):
@@ -354,7 +461,7 @@ class Extractor:
     def __classifying_detail_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         if images := self.safe_extract(data, "imagePost.images"):
             self.__extract_image_info_tiktok(item, data, images)
@@ -368,7 +475,7 @@ class Extractor:
     def __extract_additional_info(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         tiktok=False,
     ):
         # item["ratio"] = self.safe_extract(data, "video.ratio")
@@ -406,8 +513,8 @@ class Extractor:
     def __extract_image_info(
         self,
         item: dict,
-        data: SimpleNamespace,
-        images: list[SimpleNamespace],
+        data: dict,
+        images: list[dict],
     ) -> None:
         if any(
             self.safe_extract(
@@ -444,7 +551,7 @@ class Extractor:
     def __extract_image_info_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         images: list,
     ) -> None:
         self.__set_blank_data(
@@ -463,7 +570,7 @@ class Extractor:
     def __set_blank_data(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         type_=_("图集"),
     ):
         item["type"] = type_
@@ -476,7 +583,7 @@ class Extractor:
     def __extract_video_info(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         type_=_("视频"),
     ) -> None:
         item["type"] = type_
@@ -493,7 +600,7 @@ class Extractor:
 
     def __classify_slides_item(
         self,
-        item: SimpleNamespace,
+        item: dict,
     ) -> str:
         if self.safe_extract(item, "video"):
             return self.__extract_video_download(
@@ -503,9 +610,9 @@ class Extractor:
 
     def __extract_video_download(
         self,
-        data: SimpleNamespace,
+        data: dict,
     ) -> tuple[int, int, str]:
-        bit_rate: list[SimpleNamespace] = self.safe_extract(
+        bit_rate: list[dict] = self.safe_extract(
             data,
             "video.bit_rate",
             [],
@@ -513,12 +620,12 @@ class Extractor:
         try:
             bit_rate: list[tuple[int, int, int, int, int, list[str]]] = [
                 (
-                    i.FPS,
-                    i.bit_rate,
-                    i.play_addr.data_size,
-                    i.play_addr.height,
-                    i.play_addr.width,
-                    i.play_addr.url_list,
+                    i["FPS"],
+                    i["bit_rate"],
+                    i["play_addr"]["data_size"],
+                    i["play_addr"]["height"],
+                    i["play_addr"]["width"],
+                    i["play_addr"]["url_list"],
                 )
                 for i in bit_rate
             ]
@@ -542,7 +649,7 @@ class Extractor:
                 if bit_rate
                 else (-1, -1, "")
             )
-        except AttributeError:
+        except (KeyError, TypeError):
             self.log.error(
                 f"视频下载地址解析失败: {data}",
                 False,
@@ -566,7 +673,7 @@ class Extractor:
     def __extract_video_info_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         type_=_("视频"),
     ) -> None:
         item["type"] = type_
@@ -594,9 +701,9 @@ class Extractor:
 
     def __extract_video_download_tiktok(
         self,
-        data: SimpleNamespace,
+        data: dict,
     ) -> tuple[int, int, str]:
-        bitrate_info: list[SimpleNamespace] = self.safe_extract(
+        bitrate_info: list[dict] = self.safe_extract(
             data,
             "video.bitrateInfo",
             [],
@@ -604,11 +711,11 @@ class Extractor:
         try:
             bitrate_info: list[tuple[int, str, int, int, list[str]]] = [
                 (
-                    i.Bitrate,
-                    i.PlayAddr.DataSize,
-                    i.PlayAddr.Height,
-                    i.PlayAddr.Width,
-                    i.PlayAddr.UrlList,
+                    i["Bitrate"],
+                    i["PlayAddr"]["DataSize"],
+                    i["PlayAddr"]["Height"],
+                    i["PlayAddr"]["Width"],
+                    i["PlayAddr"]["UrlList"],
                 )
                 for i in bitrate_info
             ]
@@ -631,7 +738,7 @@ class Extractor:
                 if bitrate_info
                 else (-1, -1, "")
             )
-        except AttributeError:
+        except (KeyError, TypeError):
             self.log.error(
                 f"视频下载地址解析失败: {data}",
                 False,
@@ -666,7 +773,7 @@ class Extractor:
     def __extract_text_extra(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         """作品标签"""
         text = [
@@ -678,7 +785,7 @@ class Extractor:
     def __extract_text_extra_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         """作品标签"""
         text = [
@@ -690,7 +797,7 @@ class Extractor:
     def __extract_cover(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         has=False,
     ) -> None:
         if has:
@@ -708,7 +815,7 @@ class Extractor:
     def __extract_cover_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         has=False,
     ) -> None:
         if has:
@@ -722,7 +829,7 @@ class Extractor:
     def __extract_music(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         tiktok=False,
     ) -> None:
         if music_data := self.safe_extract(data, "music"):
@@ -744,7 +851,7 @@ class Extractor:
         item["music_title"] = title
         item["music_url"] = url
 
-    def __extract_statistics(self, item: dict, data: SimpleNamespace) -> None:
+    def __extract_statistics(self, item: dict, data: dict) -> None:
         data = self.safe_extract(data, "statistics")
         for i in self.statistics_keys:
             item[i] = self.safe_extract(
@@ -756,7 +863,7 @@ class Extractor:
     def __extract_statistics_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         data = self.safe_extract(data, "stats")
         for i, j in enumerate(self.statistics_keys_tiktok):
@@ -769,7 +876,7 @@ class Extractor:
     def __extract_tags(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         if not (t := self.safe_extract(data, "video_tag")):
             item["tag"] = []
@@ -779,7 +886,7 @@ class Extractor:
     def __extract_tags_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         if not (t := self.safe_extract(data, "textExtra")):
             item["tag"] = []
@@ -789,7 +896,7 @@ class Extractor:
     def __extract_account_info(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
         key="author",
     ) -> None:
         data = self.safe_extract(data, key)
@@ -807,7 +914,7 @@ class Extractor:
     def __extract_account_info_tiktok(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
         key="author",
     ) -> None:
         data = self.safe_extract(data, key)
@@ -821,7 +928,7 @@ class Extractor:
     def __extract_nickname_info(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         if container.same:
             container.cache["nickname"] = container.name
@@ -934,14 +1041,13 @@ class Extractor:
     ):
         """从多个数据返回对象"""
         for item in data:
-            item = self.generate_data_object(item)
             if id_ == self.safe_extract(item, key):
                 return item
         raise DownloaderError(_("提取账号信息或合集信息失败，请向作者反馈！"))
 
     def __extract_pretreatment_data(
         self,
-        item: SimpleNamespace,
+        item: dict,
         id_: str,
         name: str,
         mark: str,
@@ -962,29 +1068,6 @@ class Extractor:
         )
         return id_, name.strip(), mark.strip()
 
-    def __platform_classify_detail(
-        self,
-        data: list[dict],
-        container: SimpleNamespace,
-        tiktok: bool,
-    ) -> None:
-        if tiktok:
-            [
-                self.__extract_batch_tiktok(
-                    container,
-                    self.generate_data_object(item),
-                )
-                for item in data
-            ]
-        else:
-            [
-                self.__extract_batch(
-                    container,
-                    self.generate_data_object(item),
-                )
-                for item in data
-            ]
-
     async def __detail(
         self,
         data: list[dict],
@@ -999,16 +1082,12 @@ class Extractor:
             cache=None,
             same=False,
         )
-        self.__platform_classify_detail(
-            data,
-            container,
-            tiktok,
-        )
+        await self.__extract("batch_tiktok" if tiktok else "batch", data, container)
         container.all_data = self.__clean_extract_data(
             container.all_data, self.detail_necessary_keys
         )
         self.__extract_item_records(container.all_data)
-        await self.__record_data(recorder, container.all_data)
+        await self.__record_data(recorder, container.all_data, DETAIL)
         self.__condition_filter(container)
         return container.all_data
 
@@ -1032,45 +1111,20 @@ class Extractor:
         if source:
             container.all_data = data
         else:
-            [
-                self.__extract_comments_data(container, self.generate_data_object(i))
-                for i in data
-            ]
+            await self.__extract("comment", data, container)
             container.all_data = self.__clean_extract_data(
                 container.all_data, self.comment_necessary_keys
             )
-            await self.__record_data(recorder, container.all_data)
+            await self.__record_data(recorder, container.all_data, COMMENT)
         return container.all_data
 
     def __extract_comments_data(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ):
-        container.cache = container.template.copy()
-        container.cache["create_timestamp"] = self.safe_extract(data, "create_time")
-        container.cache["create_time"] = self.__format_date(
-            container.cache["create_timestamp"]
-        )
-        container.cache["ip_label"] = self.safe_extract(data, "ip_label", "未知")
-        container.cache["text"] = self.safe_extract(data, "text")
-        container.cache["image"] = self.safe_extract(
-            data,
-            f"image_list[{COMMENT_IMAGE_LIST_INDEX}].origin_url.url_list[{COMMENT_IMAGE_INDEX}]",
-        )
-        container.cache["sticker"] = self.safe_extract(
-            data, f"sticker.static_url.url_list[{COMMENT_STICKER_INDEX}]"
-        )
-        container.cache["digg_count"] = self.safe_extract(data, "digg_count", -1)
-        container.cache["reply_to_reply_id"] = self.safe_extract(
-            data, "reply_to_reply_id"
-        )
-        container.cache["reply_comment_total"] = self.safe_extract(
-            data, "reply_comment_total", 0
-        )
-        container.cache["reply_id"] = self.safe_extract(data, "reply_id")
-        container.cache["cid"] = self.safe_extract(data, "cid")
-        self.__extract_account_info(container, data, "user")
+        container.cache = self.plan_comment(data, container.template)
+        container.cache["mark"] = container.cache["nickname"]
         container.all_data.append(container.cache)
 
     @classmethod
@@ -1080,7 +1134,6 @@ class Extractor:
             cache=None,
         )
         for item in data:
-            item = cls.generate_data_object(item)
             container.cache = {
                 "reply_comment_total": cls.safe_extract(
                     item,
@@ -1106,21 +1159,15 @@ class Extractor:
     ) -> list[dict]:
         container = SimpleNamespace(all_data=[])
         if tiktok:
-            [
-                self.__extract_live_data_tiktok(container, self.generate_data_object(i))
-                for i in data
-            ]
+            [self.__extract_live_data_tiktok(container, i) for i in data]
         else:
-            [
-                self.__extract_live_data(container, self.generate_data_object(i))
-                for i in data
-            ]
+            [self.__extract_live_data(container, i) for i in data]
         return container.all_data
 
     def __extract_live_data(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ):
         if data := self.safe_extract(
             data, f"data.data[{LIVE_DATA_INDEX}]"
@@ -1129,19 +1176,15 @@ class Extractor:
                 "status": self.safe_extract(data, "status"),
                 "nickname": self.safe_extract(data, "owner.nickname"),
                 "title": self.safe_extract(data, "title"),
-                "flv_pull_url": vars(
-                    self.safe_extract(
-                        data,
-                        "stream_url.flv_pull_url",
-                        SimpleNamespace(),
-                    )
+                "flv_pull_url": self.safe_extract(
+                    data,
+                    "stream_url.flv_pull_url",
+                    {},
                 ),
-                "hls_pull_url_map": vars(
-                    self.safe_extract(
-                        data,
-                        "stream_url.hls_pull_url_map",
-                        SimpleNamespace(),
-                    )
+                "hls_pull_url_map": self.safe_extract(
+                    data,
+                    "stream_url.hls_pull_url_map",
+                    {},
                 ),
                 "cover": self.safe_extract(data, f"cover.url_list[{LIVE_COVER_INDEX}]"),
                 "total_user_str": self.safe_extract(data, "stats.total_user_str"),
@@ -1152,7 +1195,7 @@ class Extractor:
     def __extract_live_data_tiktok(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ):
         data = self.safe_extract(data, "data")
         live_data = {
@@ -1165,7 +1208,7 @@ class Extractor:
             "display_id": self.safe_extract(data, "owner.display_id"),
             "title": self.safe_extract(data, "title"),
             "user_count": self.safe_extract(data, "user_count"),
-            "flv_pull_url": vars(self.safe_extract(data, "stream_url.flv_pull_url")),
+            "flv_pull_url": self.safe_extract(data, "stream_url.flv_pull_url", {}),
             "message": self.safe_extract(data, "message"),
             "prompts": self.safe_extract(data, "prompts"),
         }
@@ -1184,69 +1227,30 @@ class Extractor:
                 "collection_time": datetime.now().strftime(self.date_format),
             },
         )
-        [
-            self.__extract_user_data(container, self.generate_data_object(i))
-            for i in data
-        ]
+        await self.__extract("user", data, container)
         container.all_data = self.__clean_extract_data(
             container.all_data, self.user_necessary_keys
         )
-        await self.__record_data(recorder, container.all_data)
+        await self.__record_data(recorder, container.all_data, USER)
         return container.all_data
 
     def __extract_user_data(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ):
-        container.cache = container.template.copy()
-        container.cache["avatar"] = self.safe_extract(
-            data, f"avatar_larger.url_list[{AVATAR_LARGER_INDEX}]"
-        )
-        container.cache["city"] = self.safe_extract(data, "city")
-        container.cache["country"] = self.safe_extract(data, "country")
-        container.cache["district"] = self.safe_extract(data, "district")
-        container.cache["favoriting_count"] = self.safe_extract(
-            data, "favoriting_count", -1
-        )
-        container.cache["follower_count"] = self.safe_extract(
-            data, "follower_count", -1
-        )
-        container.cache["max_follower_count"] = self.safe_extract(
-            data, "max_follower_count", -1
-        )
-        container.cache["following_count"] = self.safe_extract(
-            data, "following_count", -1
-        )
-        container.cache["total_favorited"] = self.safe_extract(
-            data, "total_favorited", -1
-        )
-        container.cache["gender"] = {1: "男", 2: "女"}.get(
-            self.safe_extract(data, "gender"),
-            "未知",
-        )
-        container.cache["ip_location"] = self.safe_extract(data, "ip_location")
-        container.cache["nickname"] = self.safe_extract(data, "nickname")
-        container.cache["province"] = self.safe_extract(data, "province")
-        container.cache["school_name"] = self.safe_extract(data, "school_name")
-        container.cache["sec_uid"] = self.safe_extract(data, "sec_uid")
-        container.cache["signature"] = self.safe_extract(data, "signature")
-        container.cache["uid"] = self.safe_extract(data, "uid")
-        container.cache["unique_id"] = self.safe_extract(data, "unique_id")
-        container.cache["user_age"] = self.safe_extract(data, "user_age", -1)
-        container.cache["cover"] = self.safe_extract(
-            data, f"cover_url[{AUTHOR_COVER_URL_INDEX}].url_list[{AUTHOR_COVER_INDEX}]"
-        )
-        container.cache["short_id"] = self.safe_extract(data, "short_id")
-        container.cache["aweme_count"] = self.safe_extract(data, "aweme_count", -1)
-        container.cache["verify"] = self.safe_extract(data, "custom_verify", "无")
-        container.cache["enterprise"] = self.safe_extract(
-            data, "enterprise_verify_reason", "无"
-        )
-        container.cache["url"] = (
-            f"https://www.douyin.com/user/{container.cache['sec_uid']}"
-        )
-        container.all_data.append(container.cache)
+        container.all_data.append(self.plan_user(data, container.template))
+
+    def __filter_nickname(self, name: str) -> str:
+        return self.cleaner.filter_name(name, default=_("无效账号昵称"))
+
+    @staticmethod
+    def __format_gender(gender: int) -> str:
+        return {1: "男", 2: "女"}.get(gender, "未知")
+
+    @staticmethod
+    def __generate_user_url(sec_uid: str) -> str:
+        return f"https://www.douyin.com/user/{sec_uid}"
 
     async def __search(
         self,
@@ -1275,17 +1279,14 @@ class Extractor:
             },
             same=False,
         )
-        [
-            self.__search_result_classify(container, self.generate_data_object(i))
-            for i in data
-        ]
-        await self.__record_data(recorder, container.all_data)
+        await self.__extract("search_general", data, container)
+        await self.__record_data(recorder, container.all_data, DETAIL)
         return container.all_data
 
     def __search_result_classify(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ):
         if d := self.safe_extract(data, "aweme_info"):
             self.__extract_batch(container, d)
@@ -1316,48 +1317,12 @@ class Extractor:
                 "collection_time": datetime.now().strftime(self.date_format),
             },
         )
-        [
-            self.__deal_search_user_live(
-                container, self.generate_data_object(i["user_info"])
-            )
-            for i in data
+        container.all_data = [
+            self.plan_search_user(i["user_info"], container.template) for i in data
         ]
-        await self.__record_data(recorder, container.all_data)
+        await self.__record_data(recorder, container.all_data, SEARCH_USER)
         return container.all_data
 
-    def __deal_search_user_live(
-        self,
-        container: SimpleNamespace,
-        data: SimpleNamespace,
-        user=True,
-    ):
-        if user:
-            container.cache = container.template.copy()
-        container.cache["avatar"] = self.safe_extract(
-            data,
-            f"{'avatar_thumb' if user else 'avatar_larger'}.url_list[{SEARCH_AVATAR_INDEX}]",
-        )
-        container.cache["nickname"] = self.safe_extract(data, "nickname")
-        container.cache["sec_uid"] = self.safe_extract(data, "sec_uid")
-        container.cache["signature"] = self.safe_extract(data, "signature")
-        container.cache["uid"] = self.safe_extract(data, "uid")
-        container.cache["short_id"] = self.safe_extract(data, "short_id")
-        container.cache["verify"] = self.safe_extract(data, "custom_verify", "无")
-        container.cache["enterprise"] = self.safe_extract(
-            data, "enterprise_verify_reason", "无"
-        )
-        if user:
-            container.cache["follower_count"] = self.safe_extract(
-                data, "follower_count", -1
-            )
-            container.cache["total_favorited"] = self.safe_extract(
-                data, "total_favorited", -1
-            )
-            container.cache["unique_id"] = self.safe_extract(data, "unique_id")
-            container.all_data.append(container.cache)
-        # else:
-        #     pass
-
     async def __search_live(
         self,
         data: list[dict],
@@ -1370,52 +1335,31 @@ class Extractor:
                 "collection_time": datetime.now().strftime(self.date_format),
             },
         )
-        [self.__deal_search_live(container, self.generate_data_object(i)) for i in data]
-        await self.__record_data(recorder, container.all_data)
+        container.all_data = [
+            self.plan_search_live(i, container.template) for i in data
+        ]
+        await self.__record_data(recorder, container.all_data, SEARCH_LIVE)
         return container.all_data
 
-    def __deal_search_live(
-        self,
-        container: SimpleNamespace,
-        data: SimpleNamespace,
-    ):
-        container.cache = container.template.copy()
-        self.__deal_search_user_live(
-            container, self.safe_extract(data, "author"), False
-        )
-        container.cache["room_id"] = self.safe_extract(data, "aweme_id")
-        container.all_data.append(container.cache)
-
     async def __hot(
         self,
         data: list[dict],
         recorder,
         tiktok: bool,
     ) -> list[dict]:
-        all_data = []
-        [self.__deal_hot_data(all_data, self.generate_data_object(i)) for i in data]
-        await self.__record_data(recorder, all_data)
+        all_data = [self.plan_hot(i, {}) for i in data]
+        await self.__record_data(recorder, all_data, HOT)
         return all_data
 
-    def __deal_hot_data(self, container: list, data: SimpleNamespace):
-        cache = {
-            "position": str(self.safe_extract(data, "position", -1)),
-            "sentence_id": self.safe_extract(data, "sentence_id"),
-            "word": self.safe_extract(data, "word"),
-            "video_count": str(self.safe_extract(data, "video_count", -1)),
-            "event_time": self.__format_date(self.safe_extract(data, "event_time")),
-            "view_count": str(self.safe_extract(data, "view_count", -1)),
-            "hot_value": str(self.safe_extract(data, "hot_value", -1)),
-            "cover": self.safe_extract(
-                data, f"word_cover.url_list[{HOT_WORD_COVER_INDEX}]"
-            ),
-        }
-        container.append(cache)
-
-    async def __record_data(self, record, data: list[dict]):
-        # 记录数据
+    async def __record_data(self, record, data: list[dict], plan: "ExtractPlan"):
+        # 记录数据，数据储存列与提取计划一致时使用提取计划生成的数据行函数
+        if record.field_keys == plan.field_keys:
+            row = plan.row
+        else:
+            row = partial(self.__extract_values, record)
         for i in data:
-            await record.save(self.__extract_values(record, i))
+            await record.save(row(i))
+        await record.flush()
 
     @staticmethod
     def __extract_values(record, data: dict) -> list:
@@ -1423,16 +1367,10 @@ class Extractor:
 
     @staticmethod
     def __date_filter(container: SimpleNamespace):
-        # print("前", len(container.all_data))  # 调试代码
-        result = []
-        for item in container.all_data:
-            create_time = datetime.fromtimestamp(item["create_timestamp"]).date()
-            if container.earliest <= create_time <= container.latest:
-                result.append(item)
-            # else:
-            #     print("丢弃", item)  # 调试代码
-        # print("后", len(result))  # 调试代码
-        container.all_data = result
+        container.all_data = DateFilter(
+            container.earliest,
+            container.latest,
+        ).filter_extracted(container.all_data)
 
     def source_date_filter(
         self,
@@ -1461,20 +1399,13 @@ class Extractor:
         earliest: "date" = ...,
         latest: "date" = ...,
     ) -> list[dict]:
-        result = []
-        for item in data:
-            if not (create_time := item.get(key, 0)):
-                result.append(item)
-                continue
-            create_time = datetime.fromtimestamp(create_time).date()
-            if earliest <= create_time <= latest:
-                result.append(item)
+        filter_ = DateFilter(earliest, latest, key)
+        result = [i for i in data if filter_.check(i.get(key, 0))]
         self.__summary_detail(result)
         return result
 
     @classmethod
     def extract_mix_id(cls, data: dict) -> str:
-        data = cls.generate_data_object(data)
         return cls.safe_extract(data, "mix_info.mix_id")
 
     def __extract_item_records(self, data: list[dict]):
@@ -1484,7 +1415,6 @@ class Extractor:
 
     @classmethod
     def extract_mix_collect_info(cls, data: list[dict]) -> list[dict]:
-        data = cls.generate_data_object(data)
         return [
             {
                 "title": Extractor.safe_extract(i, "mix_name"),
@@ -1495,7 +1425,6 @@ class Extractor:
 
     @classmethod
     def extract_collects_info(cls, data: list[dict]) -> list[dict]:
-        data = cls.generate_data_object(data)
         return [
             {
                 "name": Extractor.safe_extract(i, "collects_name"),
@@ -1527,7 +1456,7 @@ class Extractor:
         [
             self.__extract_collection_music(
                 container,
-                self.generate_data_object(item),
+                item,
             )
             for item in data
         ]
@@ -1536,7 +1465,7 @@ class Extractor:
     def __extract_collection_music(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ):
         container.cache = container.template.copy()
         container.cache["id"] = self.safe_extract(data, "id_str")
@@ -0,0 +1,42 @@
+from datetime import date, datetime, time, timedelta
+
+from ..custom import condition_prefilter
+
+__all__ = ["DateFilter"]
+
+
+class DateFilter:
+    """作品发布日期筛选，日期范围仅在创建时转换为时间戳边界"""
+
+    def __init__(
+        self,
+        earliest: date,
+        latest: date,
+        key: str = "create_time",
+        tiktok=False,
+    ):
+        self.start = datetime.combine(earliest, time.min).timestamp()
+        self.end = datetime.combine(latest + timedelta(days=1), time.min).timestamp()
+        self.key = key
+        self.tiktok = tiktok
+
+    def check(self, timestamp: int | str) -> bool:
+        # 缺少发布时间的作品予以保留
+        if not timestamp:
+            return True
+        try:
+            return self.start <= float(timestamp) < self.end
+        except (TypeError, ValueError):
+            return True
+
+    def filter_source(self, data: list[dict]) -> list[dict]:
+        """筛选接口返回的原始作品数据，同时应用自定义预筛选规则"""
+        return [
+            i
+            for i in data
+            if self.check(i.get(self.key)) and condition_prefilter(i, self.tiktok)
+        ]
+
+    def filter_extracted(self, data: list[dict]) -> list[dict]:
+        """筛选提取后的作品数据"""
+        return [i for i in data if self.check(i["create_timestamp"])]
@@ -0,0 +1,237 @@
+from typing import Any, Callable, NamedTuple
+
+from ..custom import (
+    AUTHOR_COVER_INDEX,
+    AUTHOR_COVER_URL_INDEX,
+    AVATAR_LARGER_INDEX,
+    COMMENT_IMAGE_INDEX,
+    COMMENT_IMAGE_LIST_INDEX,
+    COMMENT_STICKER_INDEX,
+    HOT_WORD_COVER_INDEX,
+    SEARCH_AVATAR_INDEX,
+)
+from ..translation import _
+
+__all__ = [
+    "Field",
+    "ExtractPlan",
+    "DETAIL",
+    "COMMENT",
+    "USER",
+    "SEARCH_USER",
+    "SEARCH_LIVE",
+    "HOT",
+]
+
+
+class Field(NamedTuple):
+    key: str
+    title: str | None  # 数据储存列名，None 表示不写入数据储存
+    type_: str = "TEXT"  # 数据储存列类型
+    path: str | None = None  # 原始数据属性链，None 表示由提取器计算或来自模板
+    default: Any = ""
+    transform: str | None = None  # 转换方法名称，由提取器提供实现
+
+
+class ExtractPlan:
+    """声明式提取计划，同时描述数据提取规则与数据储存列"""
+
+    def __init__(self, *fields: Field):
+        self.fields = fields
+        self.columns = tuple(
+            (i.key, i.title, i.type_) for i in fields if i.title is not None
+        )
+        self.field_keys = [i[0] for i in self.columns]
+        self.title_line = [i[1] for i in self.columns]
+        self.title_type = [i[2] for i in self.columns]
+        self.row = self.__build(
+            "row",
+            "item",
+            "[" + ", ".join(f"item[{i!r}]" for i in self.field_keys) + "]",
+            {},
+        )
+
+    def compile(
+        self,
+        extract: Callable[[Any, str, Any], Any],
+        transforms: dict[str, Callable] = None,
+    ) -> Callable[[dict, dict], dict]:
+        """将提取计划编译为逐字段展开的提取函数，属性链与转换方法仅在编译时解析一次"""
+        transforms = transforms or {}
+        namespace = {"extract": extract}
+        values = []
+        for index, i in enumerate(self.fields):
+            if i.path is None:
+                continue
+            namespace[f"default_{index}"] = i.default
+            value = f"extract(data, {i.path!r}, default_{index})"
+            if i.transform:
+                namespace[f"transform_{index}"] = transforms[i.transform]
+                value = f"transform_{index}({value})"
+            values.append(f"{i.key!r}: {value}")
+        return self.__build(
+            "run",
+            "data, template",
+            "{**template, " + ", ".join(values) + "}",
+            namespace,
+        )
+
+    @staticmethod
+    def __build(name: str, args: str, expression: str, namespace: dict) -> Callable:
+        # 生成不含循环的函数，调用时无需遍历字段
+        exec(f"def {name}({args}):\n    return {expression}\n", namespace)
+        return namespace[name]
+
+
+# 作品数据由提取器按作品类型分别计算，提取计划仅声明数据储存列与数据行顺序
+DETAIL = ExtractPlan(
+    Field("type", "作品类型"),
+    Field("collection_time", "采集时间"),
+    Field("uid", "UID"),
+    Field("sec_uid", "SEC_UID"),
+    Field("unique_id", "ID"),
+    Field("id", "作品ID"),
+    Field("desc", "作品描述"),
+    Field("text_extra", "作品话题"),
+    Field("duration", "视频时长"),
+    Field("height", "视频高度", "INTEGER"),
+    Field("width", "视频宽度", "INTEGER"),
+    Field("share_url", "作品链接"),
+    Field("create_time", "发布时间"),
+    Field("uri", "视频URI"),
+    Field("nickname", "账号昵称"),
+    Field("user_age", "年龄", "INTEGER"),
+    Field("signature", "账号签名"),
+    Field("downloads", "下载地址"),
+    Field("music_author", "音乐作者"),
+    Field("music_title", "音乐标题"),
+    Field("music_url", "音乐链接"),
+    Field("static_cover", "静态封面"),
+    Field("dynamic_cover", "动态封面"),
+    Field("tag", "隐藏标签"),
+    Field("digg_count", "点赞数量", "INTEGER"),
+    Field("comment_count", "评论数量", "INTEGER"),
+    Field("collect_count", "收藏数量", "INTEGER"),
+    Field("share_count", "分享数量", "INTEGER"),
+    Field("play_count", "播放数量", "INTEGER"),
+    Field("extra", "额外信息"),
+)
+COMMENT = ExtractPlan(
+    Field("collection_time", "采集时间"),
+    Field("cid", "评论ID", path="cid"),
+    Field("create_time", "评论时间", path="create_time", transform="date"),
+    Field("uid", "UID", path="user.uid"),
+    Field("sec_uid", "SEC_UID", path="user.sec_uid"),
+    Field(
+        "nickname",
+        "账号昵称",
+        path="user.nickname",
+        default=_("已注销账号"),
+        transform="name",
+    ),
+    Field("signature", "账号签名", path="user.signature"),
+    Field("user_age", "年龄", "INTEGER", "user.user_age", -1),
+    Field("ip_label", "IP归属地", path="ip_label", default="未知"),
+    Field("text", "评论内容", path="text"),
+    Field(
+        "sticker",
+        "评论表情",
+        path=f"sticker.static_url.url_list[{COMMENT_STICKER_INDEX}]",
+    ),
+    Field(
+        "image",
+        "评论图片",
+        path=f"image_list[{COMMENT_IMAGE_LIST_INDEX}]"
+        f".origin_url.url_list[{COMMENT_IMAGE_INDEX}]",
+    ),
+    Field("digg_count", "点赞数量", "INTEGER", "digg_count", -1),
+    Field("reply_comment_total", "回复数量", "INTEGER", "reply_comment_total", 0),
+    Field("reply_id", "回复ID", path="reply_id"),
+    Field("reply_to_reply_id", "回复对象", path="reply_to_reply_id"),
+    Field("create_timestamp", None, path="create_time"),
+    Field("unique_id", None, path="user.unique_id"),
+)
+USER = ExtractPlan(
+    Field("collection_time", "采集时间"),
+    Field("nickname", "昵称昵称", path="nickname"),
+    Field("url", "账号链接", path="sec_uid", transform="user_url"),
+    Field("signature", "账号签名", path="signature"),
+    Field("unique_id", "抖音号", path="unique_id"),
+    Field("user_age", "年龄", "INTEGER", "user_age", -1),
+    Field("gender", "性别", path="gender", transform="gender"),
+    Field("country", "国家", path="country"),
+    Field("province", "省份", path="province"),
+    Field("city", "城市", path="city"),
+    Field("district", "地区", path="district"),
+    Field("ip_location", "IP归属地", path="ip_location"),
+    Field("verify", "标签", path="custom_verify", default="无"),
+    Field("enterprise", "企业", path="enterprise_verify_reason", default="无"),
+    Field("sec_uid", "SEC_UID", path="sec_uid"),
+    Field("uid", "UID", path="uid"),
+    Field("short_id", "SHORT_ID", path="short_id"),
+    Field(
+        "avatar",
+        "头像链接",
+        path=f"avatar_larger.url_list[{AVATAR_LARGER_INDEX}]",
+    ),
+    Field(
+        "cover",
+        "背景图链接",
+        path=f"cover_url[{AUTHOR_COVER_URL_INDEX}].url_list[{AUTHOR_COVER_INDEX}]",
+    ),
+    Field("aweme_count", "作品数量", "INTEGER", "aweme_count", -1),
+    Field("total_favorited", "获赞数量", "INTEGER", "total_favorited", -1),
+    Field("favoriting_count", "喜欢数量", "INTEGER", "favoriting_count", -1),
+    Field("follower_count", "粉丝数量", "INTEGER", "follower_count", -1),
+    Field("following_count", "关注数量", "INTEGER", "following_count", -1),
+    Field("max_follower_count", "粉丝最大值", "INTEGER", "max_follower_count", -1),
+    Field("school_name", None, path="school_name"),
+)
+SEARCH_USER = ExtractPlan(
+    Field("collection_time", "采集时间"),
+    Field("uid", "UID", path="uid"),
+    Field("sec_uid", "SEC_UID", path="sec_uid"),
+    Field("nickname", "账号昵称", path="nickname"),
+    Field("unique_id", "抖音号", path="unique_id"),
+    Field("short_id", "SHORT_ID", path="short_id"),
+    Field(
+        "avatar",
+        "头像链接",
+        path=f"avatar_thumb.url_list[{SEARCH_AVATAR_INDEX}]",
+    ),
+    Field("signature", "账号签名", path="signature"),
+    Field("verify", "标签", path="custom_verify", default="无"),
+    Field("enterprise", "企业", path="enterprise_verify_reason", default="无"),
+    Field("follower_count", "粉丝数量", "INTEGER", "follower_count", -1),
+    Field("total_favorited", "获赞数量", "INTEGER", "total_favorited", -1),
+)
+SEARCH_LIVE = ExtractPlan(
+    Field("collection_time", "采集时间"),
+    Field("room_id", "直播ID", path="aweme_id"),
+    Field("uid", "UID", path="author.uid"),
+    Field("sec_uid", "SEC_UID", path="author.sec_uid"),
+    Field("nickname", "账号昵称", path="author.nickname"),
+    Field("short_id", "SHORT_ID", path="author.short_id"),
+    Field(
+        "avatar",
+        "头像链接",
+        path=f"author.avatar_larger.url_list[{SEARCH_AVATAR_INDEX}]",
+    ),
+    Field("signature", "账号签名", path="author.signature"),
+    Field("verify", "标签", path="author.custom_verify", default="无"),
+    Field("enterprise", "企业", path="author.enterprise_verify_reason", default="无"),
+)
+HOT = ExtractPlan(
+    Field("position", "排名", "INTEGER", "position", -1, "str"),
+    Field("word", "内容", path="word"),
+    Field("hot_value", "热度", "INTEGER", "hot_value", -1, "str"),
+    Field(
+        "cover",
+        "封面",
+        path=f"word_cover.url_list[{HOT_WORD_COVER_INDEX}]",
+    ),
+    Field("event_time", "时间", path="event_time", transform="date"),
+    Field("view_count", "浏览数量", "INTEGER", "view_count", -1, "str"),
+    Field("video_count", "视频数量", "INTEGER", "video_count", -1, "str"),
+    Field("sentence_id", "SENTENCE_ID", path="sentence_id"),
+)
@@ -0,0 +1,114 @@
+from collections.abc import MutableMapping
+from typing import Any, Iterator
+
+__all__ = ["DetailRecord", "DETAIL_KEYS", "to_dict"]
+
+DETAIL_KEYS = (
+    "collection_time",
+    "id",
+    "desc",
+    "create_timestamp",
+    "create_time",
+    "text_extra",
+    "type",
+    "height",
+    "width",
+    "downloads",
+    "duration",
+    "uri",
+    "dynamic_cover",
+    "static_cover",
+    "uid",
+    "sec_uid",
+    "unique_id",
+    "signature",
+    "user_age",
+    "nickname",
+    "mark",
+    "music_author",
+    "music_title",
+    "music_url",
+    "digg_count",
+    "comment_count",
+    "collect_count",
+    "share_count",
+    "play_count",
+    "tag",
+    "extra",
+    "share_url",
+)
+_KEYS = frozenset(DETAIL_KEYS)
+
+
+class DetailRecord(MutableMapping):
+    """作品数据记录，使用 __slots__ 保存字段以降低大批量作品的内存占用
+
+    保留与字典一致的键访问方式，提取、筛选、储存与下载流程无需区分记录类型；
+    仅在返回 Web API 响应时转换为字典
+    """
+
+    __slots__ = DETAIL_KEYS
+
+    def __init__(self, data: dict = None, **kwargs):
+        if data:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _KEYS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        try:
+            setattr(self, key, value)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __delitem__(self, key: str) -> None:
+        try:
+            delattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        for key in DETAIL_KEYS:
+            if hasattr(self, key):
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _KEYS and hasattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in _KEYS else default
+
+    def copy(self) -> "DetailRecord":
+        return DetailRecord(self)
+
+    def to_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self}
+
+    def __getstate__(self) -> dict:
+        return self.to_dict()
+
+    def __setstate__(self, state: dict) -> None:
+        self.update(state)
+
+    def __repr__(self) -> str:
+        return f"DetailRecord({self.to_dict()!r})"
+
+
+def to_dict(data: Any) -> Any:
+    """将作品数据记录转换为字典，其他数据原样返回"""
+    if isinstance(data, DetailRecord):
+        return data.to_dict()
+    if isinstance(data, list):
+        return [to_dict(i) for i in data]
+    return data
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..tools import Cleaner
+    from .extractor import Extractor
+
+__all__ = ["initialize", "extract_chunk"]
+
+_extractor: "Extractor" = None
+
+
+class WorkerLogger:
+    """子进程日志记录，提取完成后交由主进程输出"""
+
+    def __init__(self):
+        self.records: list[tuple[str, tuple]] = []
+
+    def info(self, *args):
+        self.records.append(("info", args))
+
+    def warning(self, *args):
+        self.records.append(("warning", args))
+
+    def error(self, *args):
+        self.records.append(("error", args))
+
+    def pop(self) -> list[tuple[str, tuple]]:
+        records, self.records = self.records, []
+        return records
+
+
+def initialize(cleaner: "Cleaner", date_format: str) -> None:
+    """子进程初始化，每个进程仅创建一次提取器并复用清洗规则与日期格式"""
+    global _extractor
+    from .extractor import Extractor
+
+    _extractor = Extractor(
+        SimpleNamespace(
+            logger=WorkerLogger(),
+            date_format=date_format,
+            CLEANER=cleaner,
+            extract_processes=0,
+            extract_threshold=0,
+        )
+    )
+
+
+def extract_chunk(
+    type_: str,
+    data: list[dict],
+    options: dict,
+) -> tuple[list[dict], list[tuple[str, tuple]]]:
+    result = _extractor.extract_items(type_, data, SimpleNamespace(**options))
+    return result, _extractor.log.pop()
@@ -1,6 +1,7 @@
 from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Callable, Coroutine, Type, Union
 
+from src.extract.filter import DateFilter
 from src.interface.template import API
 from src.translation import _
 
@@ -12,6 +13,9 @@ if TYPE_CHECKING:
 class Account(API):
     post_api = f"{API.domain}aweme/v1/web/aweme/post/"
     favorite_api = f"{API.domain}aweme/v1/web/aweme/favorite/"
+    date_key = "create_time"
+    tiktok = False
+    extra_keys = ()
 
     def __init__(
         self,
@@ -30,12 +34,20 @@ class Account(API):
     ):
         super().__init__(params, cookie, proxy, *args, **kwargs)
         self.sec_user_id = sec_user_id
+        self.sticky = sec_user_id
         self.api, self.favorite, self.pages = self.check_type(
             tab, pages or params.max_pages
         )
         # TODO: 重构数据验证逻辑
         self.latest: date = self.check_latest(latest)
         self.earliest: date = self.check_earliest(earliest)
+        # 分页获取数据时即筛选发布日期，避免提取与记录范围外的作品
+        self.date_filter = DateFilter(
+            self.earliest,
+            self.latest,
+            self.date_key,
+            self.tiktok,
+        )
         self.cursor = cursor
         self.count = count
         self.text = _("账号喜欢作品") if self.favorite else _("账号发布作品")
@@ -254,7 +266,7 @@ class Account(API):
                 self.finished = True
             else:
                 self.cursor = data_dict[cursor]
-                self.append_response(d)
+                self.append_response(self.date_filter.filter_source(d))
                 self.finished = not data_dict[has_more]
         except KeyError:
             if data_dict.get("status_code") == 0:
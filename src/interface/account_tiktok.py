@@ -14,6 +14,8 @@ class AccountTikTok(
 ):
     post_api = f"{APITikTok.domain}api/post/item_list/"
     favorite_api = f"{APITikTok.domain}api/favorite/item_list/"
+    date_key = "createTime"
+    tiktok = True
 
     def __init__(
         self,
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 
 class Collection(API):
+    rotation = False  # 收藏数据与账号绑定，不使用 Cookie 池
+
     def __init__(
         self,
         params: Union["Parameter", "Params"],
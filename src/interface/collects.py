@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class Collects(API):
+    rotation = False  # 收藏数据与账号绑定，不使用 Cookie 池
+
     def __init__(
         self,
         params: Union["Parameter", "Params"],
@@ -133,6 +135,8 @@ class CollectsDetail(Collection, API):
 
 
 class CollectsMix(API):
+    rotation = False  # 收藏数据与账号绑定，不使用 Cookie 池
+
     def __init__(
         self,
         params: Union["Parameter", "Params"],
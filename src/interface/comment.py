@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class Comment(API):
+    extra_keys = ()
+
     def __init__(
         self,
         params: Union["Parameter", "Params"],
@@ -134,7 +136,6 @@ class Comment(API):
         **kwargs,
     ):
         while not self.finished and self.pages > 0:
-            self.progress.update(self.task_id)
             await self.run_single(
                 data_key,
                 error_text,
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 
 class Mix(API):
+    extra_keys = ()
+
     def __init__(
         self,
         params: Union["Parameter", "Params"],
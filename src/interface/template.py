@@ -11,12 +11,20 @@ from rich.progress import (
 )
 
 from ..custom import PROGRESS, USERAGENT, wait
-from ..tools import DownloaderError, FakeProgress, Retry, capture_error_request
+from ..tools import (
+    DownloaderError,
+    FakeProgress,
+    Retry,
+    TransferProgress,
+    capture_error_request,
+    decode_json,
+)
 from ..translation import _
 
 if TYPE_CHECKING:
     from ..config import Parameter
     from ..testers import Params
+    from ..tools import CookiePool, PooledCookie, ProxyPool
 
 __all__ = [
     "API",
@@ -62,6 +70,12 @@ class API:
         "msToken": "",
     }
     progress_object: Callable
+    rotation = True  # 是否允许从 Cookie 池轮换 Cookie
+    # 分页接口除数据、游标、是否有更多数据与响应状态以外需要保留的顶层键
+    # None 表示解码并保留完整响应数据
+    extra_keys: tuple[str, ...] | None = None
+    # 数据解析失败时输出响应状态，仅保留部分顶层键时始终保留
+    status_keys = ("status_code", "status_msg", "statusCode", "statusMsg")
 
     def __init__(
         self,
@@ -82,16 +96,32 @@ class API:
         self.timeout = params.timeout
         self.cookie = cookie
         self.client: AsyncClient = params.client
+        self.cookie_pool: "CookiePool" = params.cookie_pool
+        self.pooled: "PooledCookie" = None
+        # 设置 proxy 参数时优先使用指定代理，不使用代理池
+        self.proxy_pool: "ProxyPool" = None if params.proxy else params.proxy_pool
+        self.sticky = ""  # 代理池固定分配标识，同一标识的请求使用同一代理
         self.pages = 99999
         self.cursor = 0
         self.response = []
         self.finished = False
         self.text = ""
+        self.response_keys: tuple[str, ...] | None = None
         self.set_temp_cookie(cookie)
 
     def set_temp_cookie(self, cookie: str = ""):
+        self.cookie_default = self.headers.get("Cookie", "")
+        self.pooled = None
         if cookie:
             self.headers["Cookie"] = cookie
+        elif self.rotation and self.cookie_pool:
+            self.switch_cookie(self.cookie_pool.select() or self.cookie_pool.items[0])
+
+    def switch_cookie(self, item: "PooledCookie" = None) -> None:
+        if not item:
+            return
+        self.pooled = item
+        self.headers["Cookie"] = item.value or self.cookie_default
 
     def generate_params(
         self,
@@ -161,14 +191,26 @@ class API:
         *args,
         **kwargs,
     ):
-        if data := await self.request_data(
-            self.api,
-            params=params() or self.generate_params(),
-            data=data() or self.generate_data(),
-            method=method,
-            headers=headers,
-            finished=True,
-        ):
+        if self.extra_keys is not None:
+            self.response_keys = (
+                data_key,
+                cursor,
+                has_more,
+                *self.status_keys,
+                *self.extra_keys,
+            )
+        try:
+            data = await self.request_data(
+                self.api,
+                params=params() or self.generate_params(),
+                data=data() or self.generate_data(),
+                method=method,
+                headers=headers,
+                finished=True,
+            )
+        finally:
+            self.response_keys = None
+        if data:
             self.check_response(
                 data, data_key, error_text, cursor, has_more, *args, **kwargs
             )
@@ -190,12 +232,11 @@ class API:
         **kwargs,
     ):
         with self.progress_object() as progress:
-            task_id = progress.add_task(
+            progress.add_task(
                 _("正在获取{text}数据").format(text=self.text),
                 total=None,
             )
             while not self.finished and self.pages > 0:
-                progress.update(task_id)
                 await self.run_single(
                     data_key,
                     error_text,
@@ -250,6 +291,58 @@ class API:
         finished=False,
         *args,
         **kwargs,
+    ):
+        if self.pooled:
+            if item := await self.cookie_pool.acquire(self.pooled):
+                self.switch_cookie(item)
+            else:
+                self.log.warning(
+                    _("Cookie 池中的 Cookie 均已暂停使用，沿用当前 Cookie")
+                )
+        if self.proxy or not self.proxy_pool:
+            response = await self.__send_request(
+                url,
+                params,
+                data,
+                method,
+                headers,
+                encryption,
+                finished,
+                *args,
+                **kwargs,
+            )
+        else:
+            async with self.proxy_pool.lease(self.sticky) as item:
+                # 仅本次请求使用代理池分配的客户端，不替换实例的客户端
+                response = await self.__send_request(
+                    url,
+                    params,
+                    data,
+                    method,
+                    headers,
+                    encryption,
+                    finished,
+                    *args,
+                    client=item.client,
+                    **kwargs,
+                )
+                self.proxy_pool.feedback(item, bool(response))
+        if self.pooled and self.cookie_pool.feedback(self.pooled, bool(response)):
+            self.log.warning(_("当前 Cookie 请求多次失败，暂停使用该 Cookie"))
+        return response
+
+    async def __send_request(
+        self,
+        url: str,
+        params: dict = None,
+        data: dict = None,
+        method="GET",
+        headers: dict = None,
+        encryption="GET",
+        finished=False,
+        *args,
+        client: AsyncClient = None,
+        **kwargs,
     ):
         params = self.deal_url_params(
             params,
@@ -262,6 +355,7 @@ class API:
                     params,
                     headers or self.headers,
                     finished=finished,
+                    client=client,
                     *args,
                     **kwargs,
                 )
@@ -281,6 +375,7 @@ class API:
                     data,
                     headers or self.headers,
                     finished=finished,
+                    client=client,
                     *args,
                     **kwargs,
                 )
@@ -305,6 +400,7 @@ class API:
         params: str,
         headers: dict,
         finished=False,
+        client: AsyncClient = None,
         **kwargs,
     ):
         self.__record_request_messages(
@@ -314,7 +410,7 @@ class API:
             headers,
             **kwargs,
         )
-        response = await self.client.get(
+        response = await (client or self.client).get(
             f"{url}?{params}",
             headers=headers,
             **kwargs,
@@ -352,7 +448,14 @@ class API:
     @Retry.retry
     @capture_error_request
     async def request_data_post(
-        self, url: str, params: str, data: dict, headers: dict, finished=False, **kwargs
+        self,
+        url: str,
+        params: str,
+        data: dict,
+        headers: dict,
+        finished=False,
+        client: AsyncClient = None,
+        **kwargs,
     ):
         self.__record_request_messages(
             url,
@@ -361,7 +464,7 @@ class API:
             headers,
             **kwargs,
         )
-        response = await self.client.post(
+        response = await (client or self.client).post(
             f"{url}?{params}",
             data=data,
             headers=headers,
@@ -404,7 +507,7 @@ class API:
         # if response.status_code != 200:
         #     self.log.error(f"请求 {url} 失败，响应码 {response.status_code}")
         #     return
-        return response.json()
+        return decode_json(response.content, self.response_keys)
 
     def __record_request_messages(
         self,
@@ -470,6 +573,8 @@ class API:
             console=self.console,
             transient=True,
             expand=True,
+            # 与下载进度显示使用相同的固定刷新频率，不随数据请求刷新
+            refresh_per_second=TransferProgress.FPS,
         )
 
     @staticmethod
@@ -538,6 +643,10 @@ class APITikTok(API):
         self.headers = params.headers_tiktok.copy()
         self.cookie = cookie
         self.client: AsyncClient = params.client_tiktok
+        self.cookie_pool: "CookiePool" = params.cookie_pool_tiktok
+        self.proxy_pool: "ProxyPool" = (
+            None if params.proxy_tiktok else params.proxy_pool_tiktok
+        )
         self.set_temp_cookie(cookie)
 
     async def request_data(
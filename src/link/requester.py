@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 
 from ..custom import BLANK_HEADERS
 from ..custom import wait
-from ..tools import Retry, DownloaderError, capture_error_request
+from ..tools import Retry, DownloaderError, capture_error_request, decode_json
 
 if TYPE_CHECKING:
     from httpx import AsyncClient, get, head
@@ -84,7 +84,7 @@ class Requester:
             case "content":
                 return response.content
             case "json":
-                return response.json()
+                return decode_json(response.content)
             case "headers":
                 return response.headers
             case "url":
@@ -1,9 +1,13 @@
 from .cache import Cache
 from .database import Database
+from .index import IDIndex
 from .recorder import DownloadRecorder
+from .warmer import HostWarmer
 
 __all__ = [
     "Cache",
     "DownloadRecorder",
     "Database",
+    "IDIndex",
+    "HostWarmer",
 ]
@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ..tools import Retry
+from ..tools import Retry, is_shard_folder, shard_folders
 from ..translation import _
 
 if TYPE_CHECKING:
@@ -23,8 +23,10 @@ class Cache:
         self.log = parameter.logger  # 日志记录对象
         self.database = database
         self.root = parameter.root  # 作品文件保存根目录
+        self.shard = parameter.folder_shard  # 分片储存模式
         self.mark = mark
         self.name = name
+        self.renamed: list[tuple[Path, Path]] = []  # 本次更新已重命名的文件与文件夹
 
     async def update_cache(
         self,
@@ -45,6 +47,7 @@ class Cache:
                 mark,
                 d,
             )
+            await self.__update_catalog()
         data = (
             id_,
             name,
@@ -56,6 +59,18 @@ class Cache:
     async def has_cache(self, id_: str) -> dict:
         return await self.database.read_mapping_data(id_)
 
+    async def __update_catalog(self):
+        # 按重命名顺序更新下载文件目录，储存文件夹重命名时同时更新文件夹名称
+        renamed, self.renamed = self.renamed, []
+        for old_, new_ in renamed:
+            folder = old_.parent == self.root
+            await self.database.rename_catalog_data(
+                str(old_.resolve()),
+                str(new_.resolve()),
+                old_.name if folder else "",
+                new_.name if folder else "",
+            )
+
     def __check_file(
         self,
         solo_mode: bool,
@@ -146,7 +161,26 @@ class Cache:
         key="name",
     ):
         root = self.root.joinpath(f"{prefix}{id_}_{mark}_{suffix}")
-        item_list = root.iterdir()
+        # 启用分片储存时，作品文件储存在分片文件夹中，启用前下载的作品文件仍在储存文件夹中
+        self.__scan_folder(solo_mode, root, name, mark, data, key)
+        if self.shard:
+            for folder in shard_folders(root, self.shard):
+                self.__scan_folder(solo_mode, folder, name, mark, data, key, False)
+
+    def __scan_folder(
+        self,
+        solo_mode: bool,
+        root: Path,
+        name: str,
+        mark: str,
+        data: dict,
+        key: str,
+        top=True,
+    ):
+        # 扫描储存文件夹时跳过分片文件夹，分片文件夹单独扫描
+        item_list = [
+            i for i in root.iterdir() if not (top and is_shard_folder(i, self.shard))
+        ]
         if solo_mode:
             for f in item_list:
                 if f.is_dir():
@@ -219,6 +253,7 @@ class Cache:
     ) -> bool:
         try:
             old_.rename(new_)
+            self.renamed.append((old_, new_))
             return True
         except PermissionError as e:
             self.console.error(
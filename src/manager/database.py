@@ -1,8 +1,18 @@
-from asyncio import CancelledError
-from contextlib import suppress
+from asyncio import (
+    CancelledError,
+    Future,
+    Queue,
+    QueueEmpty,
+    create_task,
+    get_running_loop,
+)
+from contextlib import asynccontextmanager, suppress
+from os import sep
 from shutil import move
+from time import time
+from typing import Any
 
-from aiosqlite import Row, connect
+from aiosqlite import Connection, Row, connect
 
 from ..custom import PROJECT_ROOT
 
@@ -10,23 +20,42 @@ __all__ = ["Database"]
 
 
 class Database:
+    """程序数据库
+
+    写入操作由单个写入连接按提交顺序执行，同一时间提交的写入操作合并为一个事务；
+    读取操作从只读连接池中获取连接，每次查询使用独立的游标，并发查询互不影响
+    """
+
     __FILE = "DouK-Downloader.db"
+    READERS = 2  # 只读连接数量
+    BATCH_SIZE = 256  # 单个事务合并的写入操作数量上限
 
     def __init__(
         self,
     ):
         self.file = PROJECT_ROOT.joinpath(self.__FILE)
-        self.database = None
-        self.cursor = None
+        self.database: Connection = None  # 写入连接
+        self.readers: Queue[Connection] = None  # 只读连接池
+        self.connections: list[Connection] = []
+        self.queue: Queue[tuple[tuple, Future] | None] = None  # 待执行的写入操作
+        self.writer = None  # 写入任务
 
     async def __connect_database(self):
         self.database = await connect(self.file)
-        self.database.row_factory = Row
-        self.cursor = await self.database.cursor()
+        await self.database.execute("PRAGMA journal_mode=WAL;")
+        await self.database.execute("PRAGMA synchronous=NORMAL;")
         await self.__create_table()
         await self.__write_default_config()
         await self.__write_default_option()
         await self.database.commit()
+        self.readers = Queue()
+        for _ in range(self.READERS):
+            reader = await connect(f"{self.file.resolve().as_uri()}?mode=ro", uri=True)
+            reader.row_factory = Row
+            self.connections.append(reader)
+            self.readers.put_nowait(reader)
+        self.queue = Queue()
+        self.writer = create_task(self.__write_loop())
 
     async def __create_table(self):
         await self.database.execute(
@@ -47,6 +76,32 @@ class Database:
         NAME TEXT PRIMARY KEY,
         VALUE TEXT NOT NULL
         );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS host_data (
+        HOST TEXT PRIMARY KEY,
+        TIKTOK INTEGER NOT NULL CHECK(TIKTOK IN (0, 1)),
+        UPDATE_TIME INTEGER NOT NULL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS catalog_data (
+        PATH TEXT PRIMARY KEY,
+        ID TEXT NOT NULL,
+        ROLE TEXT NOT NULL,
+        FOLDER TEXT NOT NULL,
+        SIZE INTEGER NOT NULL,
+        CONTENT_TYPE TEXT NOT NULL,
+        CHECKSUM TEXT NOT NULL,
+        HOST TEXT NOT NULL,
+        DURATION REAL NOT NULL,
+        UPDATE_TIME INTEGER NOT NULL
+        );""")
+        await self.database.execute(
+            "CREATE INDEX IF NOT EXISTS catalog_id ON catalog_data (ID);"
+        )
+        await self.database.execute(
+            "CREATE INDEX IF NOT EXISTS catalog_folder ON catalog_data (FOLDER, UPDATE_TIME);"
+        )
+        await self.database.execute(
+            "CREATE INDEX IF NOT EXISTS catalog_time ON catalog_data (UPDATE_TIME);"
+        )
 
     async def __write_default_config(self):
         await self.database.execute("""INSERT OR IGNORE INTO config_data (NAME, VALUE)
@@ -58,71 +113,285 @@ class Database:
         await self.database.execute("""INSERT OR IGNORE INTO option_data (NAME, VALUE)
                             VALUES ('Language', 'zh_CN');""")
 
+    @asynccontextmanager
+    async def __reader(self):
+        reader = await self.readers.get()
+        try:
+            yield reader
+        finally:
+            self.readers.put_nowait(reader)
+
+    async def __fetchall(self, sql: str, parameters: tuple = ()) -> list[Row]:
+        async with self.__reader() as reader:
+            return await reader.execute_fetchall(sql, parameters)
+
+    async def __fetchone(self, sql: str, parameters: tuple = ()) -> Row | None:
+        async with self.__reader() as reader:
+            async with reader.execute(sql, parameters) as cursor:
+                return await cursor.fetchone()
+
+    async def __write(self, *statements: tuple[str, Any, bool]) -> None:
+        """提交写入操作并等待事务提交
+
+        每个写入操作为 (SQL, 参数, 是否批量执行)，同一次调用的写入操作在同一事务中执行
+        """
+        future = get_running_loop().create_future()
+        self.queue.put_nowait((statements, future))
+        await future
+
+    async def __write_loop(self):
+        while item := await self.queue.get():
+            batch = [item]
+            with suppress(QueueEmpty):
+                while len(batch) < self.BATCH_SIZE:
+                    if not (item := self.queue.get_nowait()):
+                        # 关闭数据库时，执行已提交的写入操作后结束
+                        self.queue.put_nowait(None)
+                        break
+                    batch.append(item)
+            try:
+                await self.__execute_batch(batch)
+            except Exception as e:
+                # 事务执行异常仅影响当前批次的写入操作，写入任务继续运行
+                with suppress(Exception):
+                    await self.database.rollback()
+                for _, future in batch:
+                    self.__set_exception(future, e)
+
+    async def __execute_batch(self, batch: list[tuple[tuple, Future]]):
+        done = []
+        # 显式开启事务，避免保存点释放时提交事务
+        await self.database.execute("BEGIN;")
+        for statements, future in batch:
+            if future.done():
+                # 等待写入的任务已取消，跳过该写入操作
+                continue
+            try:
+                await self.database.execute("SAVEPOINT operation;")
+                for sql, parameters, many in statements:
+                    if many:
+                        await self.database.executemany(sql, parameters)
+                    else:
+                        await self.database.execute(sql, parameters)
+                await self.database.execute("RELEASE operation;")
+                done.append(future)
+            except Exception as e:
+                # 仅回滚执行失败的写入操作，不影响同一事务中的其他写入操作
+                await self.database.execute("ROLLBACK TO operation;")
+                await self.database.execute("RELEASE operation;")
+                self.__set_exception(future, e)
+        try:
+            await self.database.commit()
+        except Exception as e:
+            await self.database.rollback()
+            for future in done:
+                self.__set_exception(future, e)
+        else:
+            for future in done:
+                if not future.done():
+                    future.set_result(None)
+
+    @staticmethod
+    def __set_exception(future: Future, error: Exception) -> None:
+        if not future.done():
+            future.set_exception(error)
+
     async def read_config_data(self):
-        await self.cursor.execute("SELECT * FROM config_data")
-        return await self.cursor.fetchall()
+        return await self.__fetchall("SELECT * FROM config_data")
 
     async def read_option_data(self):
-        await self.cursor.execute("SELECT * FROM option_data")
-        return await self.cursor.fetchall()
+        return await self.__fetchall("SELECT * FROM option_data")
 
     async def update_config_data(
         self,
         name: str,
         value: int,
     ):
-        await self.database.execute(
-            "REPLACE INTO config_data (NAME, VALUE) VALUES (?,?)", (name, value)
+        await self.__write(
+            (
+                "REPLACE INTO config_data (NAME, VALUE) VALUES (?,?)",
+                (name, value),
+                False,
+            )
         )
-        await self.database.commit()
 
     async def update_option_data(
         self,
         name: str,
         value: str,
     ):
-        await self.database.execute(
-            "REPLACE INTO option_data (NAME, VALUE) VALUES (?,?)", (name, value)
+        await self.__write(
+            (
+                "REPLACE INTO option_data (NAME, VALUE) VALUES (?,?)",
+                (name, value),
+                False,
+            )
         )
-        await self.database.commit()
 
     async def update_mapping_data(self, id_: str, name: str, mark: str):
-        await self.database.execute(
-            "REPLACE INTO mapping_data (ID, NAME, MARK) VALUES (?,?,?)",
-            (id_, name, mark),
+        await self.__write(
+            (
+                "REPLACE INTO mapping_data (ID, NAME, MARK) VALUES (?,?,?)",
+                (id_, name, mark),
+                False,
+            )
         )
-        await self.database.commit()
 
     async def read_mapping_data(self, id_: str):
-        await self.cursor.execute(
+        return await self.__fetchone(
             "SELECT NAME, MARK FROM mapping_data WHERE ID=?", (id_,)
         )
-        return await self.cursor.fetchone()
+
+    async def update_host_data(self, host: str, tiktok: bool):
+        await self.__write(
+            (
+                "REPLACE INTO host_data (HOST, TIKTOK, UPDATE_TIME) VALUES (?,?,?)",
+                (host, int(tiktok), int(time())),
+                False,
+            )
+        )
+
+    async def read_host_data(self, limit: int = 32):
+        return await self.__fetchall(
+            "SELECT HOST, TIKTOK FROM host_data ORDER BY UPDATE_TIME DESC LIMIT ?",
+            (limit,),
+        )
 
     async def has_download_data(self, id_: str) -> bool:
-        await self.cursor.execute("SELECT ID FROM download_data WHERE ID=?", (id_,))
-        return bool(await self.cursor.fetchone())
+        return bool(
+            await self.__fetchone("SELECT ID FROM download_data WHERE ID=?", (id_,))
+        )
 
     async def write_download_data(self, id_: str):
-        await self.database.execute(
-            "INSERT OR IGNORE INTO download_data (ID) VALUES (?);", (id_,)
+        await self.__write(
+            ("INSERT OR IGNORE INTO download_data (ID) VALUES (?);", (id_,), False)
+        )
+
+    async def read_download_data(self, size: int = 10000):
+        async with self.__reader() as reader:
+            async with reader.execute("SELECT ID FROM download_data") as cursor:
+                while rows := await cursor.fetchmany(size):
+                    for row in rows:
+                        yield row[0]
+
+    async def update_download_data(self, inserts: list[str], deletes: list[str]):
+        """在单个事务中批量写入新增与删除的下载记录"""
+        await self.__write(
+            (
+                "INSERT OR IGNORE INTO download_data (ID) VALUES (?);",
+                [(i,) for i in inserts],
+                True,
+            ),
+            ("DELETE FROM download_data WHERE ID=?", [(i,) for i in deletes], True),
         )
-        await self.database.commit()
 
     async def delete_download_data(self, ids: list | tuple | str):
         if not ids:
             return
         if isinstance(ids, str):
             ids = [ids]
-        [await self.__delete_download_data(i) for i in ids]
-        await self.database.commit()
-
-    async def __delete_download_data(self, id_: str):
-        await self.database.execute("DELETE FROM download_data WHERE ID=?", (id_,))
+        await self.__write(
+            ("DELETE FROM download_data WHERE ID=?", [(i,) for i in ids], True)
+        )
 
     async def delete_all_download_data(self):
-        await self.database.execute("DELETE FROM download_data")
-        await self.database.commit()
+        await self.__write(("DELETE FROM download_data", (), False))
+
+    async def write_catalog_data(
+        self,
+        path: str,
+        id_: str,
+        role: str,
+        folder: str,
+        size: int,
+        content_type: str,
+        checksum: str,
+        host: str,
+        duration: float,
+    ):
+        await self.__write(
+            (
+                """REPLACE INTO catalog_data (
+                PATH, ID, ROLE, FOLDER, SIZE, CONTENT_TYPE, CHECKSUM, HOST, DURATION, UPDATE_TIME
+                ) VALUES (?,?,?,?,?,?,?,?,?,?)""",
+                (
+                    path,
+                    id_,
+                    role,
+                    folder,
+                    size,
+                    content_type,
+                    checksum,
+                    host,
+                    duration,
+                    int(time()),
+                ),
+                False,
+            )
+        )
+
+    async def rename_catalog_data(
+        self,
+        old: str,
+        new_: str,
+        old_folder: str = "",
+        new_folder: str = "",
+    ):
+        """文件或文件夹重命名后更新下载文件目录的文件路径与储存文件夹名称"""
+        prefix = f"{old}{sep}"
+        statements = [
+            (
+                "UPDATE OR REPLACE catalog_data SET PATH=? WHERE PATH=?",
+                (new_, old),
+                False,
+            ),
+            (
+                """UPDATE OR REPLACE catalog_data SET PATH=? || SUBSTR(PATH, ?)
+                WHERE SUBSTR(PATH, 1, ?)=?""",
+                (f"{new_}{sep}", len(prefix) + 1, len(prefix), prefix),
+                False,
+            ),
+        ]
+        if old_folder:
+            statements.append(
+                (
+                    "UPDATE catalog_data SET FOLDER=? WHERE FOLDER=?",
+                    (new_folder, old_folder),
+                    False,
+                )
+            )
+        await self.__write(*statements)
+
+    async def read_catalog_data(self, id_: str):
+        return await self.__fetchall(
+            "SELECT * FROM catalog_data WHERE ID=? ORDER BY ROLE", (id_,)
+        )
+
+    async def read_catalog_folder(self, folder: str, start: int = 0, end: int = None):
+        """查询指定文件夹在指定时间范围内下载的文件"""
+        return await self.__fetchall(
+            """SELECT * FROM catalog_data WHERE FOLDER=? AND UPDATE_TIME BETWEEN ? AND ?
+            ORDER BY UPDATE_TIME""",
+            (folder, start, end or int(time())),
+        )
+
+    async def read_catalog_summary(self):
+        """按文件夹统计文件数量、总大小与平均下载速度"""
+        return await self.__fetchall(
+            """SELECT FOLDER, COUNT(*) AS COUNT, SUM(SIZE) AS SIZE,
+            SUM(SIZE) / MAX(SUM(DURATION), 0.001) AS SPEED, MAX(UPDATE_TIME) AS UPDATE_TIME
+            FROM catalog_data GROUP BY FOLDER ORDER BY SIZE DESC"""
+        )
+
+    async def read_catalog_daily(self, days: int = 30):
+        """按日期统计最近下载的文件数量、总大小与平均下载速度"""
+        return await self.__fetchall(
+            """SELECT DATE(UPDATE_TIME, 'unixepoch', 'localtime') AS DATE,
+            COUNT(*) AS COUNT, SUM(SIZE) AS SIZE,
+            SUM(SIZE) / MAX(SUM(DURATION), 0.001) AS SPEED
+            FROM catalog_data WHERE UPDATE_TIME >= ? GROUP BY DATE ORDER BY DATE""",
+            (int(time()) - days * 86400,),
+        )
 
     async def __aenter__(self):
         self.compatible()
@@ -130,8 +399,14 @@ class Database:
         return self
 
     async def close(self):
-        with suppress(CancelledError):
-            await self.cursor.close()
+        if self.writer:
+            self.queue.put_nowait(None)
+            with suppress(CancelledError):
+                await self.writer
+            self.writer = None
+        for reader in self.connections:
+            await reader.close()
+        self.connections.clear()
         await self.database.close()
 
     async def __aexit__(self, exc_type, exc_value, traceback):
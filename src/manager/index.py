@@ -0,0 +1,167 @@
+from array import array
+from asyncio import CancelledError, Lock, Task, create_task, shield, sleep
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+from ..translation import _
+
+if TYPE_CHECKING:
+    from ..tools import ColorfulConsole
+    from .database import Database
+
+__all__ = ["IDIndex"]
+
+
+class IDIndex:
+    """作品下载记录的内存索引
+
+    启动时将 download_data 数据表加载为有序的 array("Q")，在内存中判断作品是否已下载；
+    新增与删除的记录暂存于内存，定时及关闭时以单个事务批量写入数据库。
+    程序异常退出时最多丢失最近一个写入间隔内的记录，仅导致作品被重复下载，数据库不会损坏
+    """
+
+    FLUSH_INTERVAL = 5  # 暂存记录写入数据库的间隔，单位：秒
+    MERGE_SIZE = 65536  # 新增记录数量达到该值时合并至有序数组
+    MAX_ID = 2**64  # array("Q") 可储存的整数上限
+
+    def __init__(self, database: "Database", console: "ColorfulConsole"):
+        self.database = database
+        self.console = console
+        self.ids = array("Q")  # 已下载作品 ID，有序数组
+        self.added: set[int] = set()  # 未合并至有序数组的新增记录
+        self.removed: set[int] = set()  # 有序数组中已删除的记录
+        self.others: set[str] = set()  # 无法转换为整数的作品 ID
+        # 待写入数据库的记录，True 为新增，False 为删除
+        self.pending: dict[str, bool] = {}
+        self.loaded = False
+        self.lock = Lock()
+        self.task = None  # 定时写入任务
+        self.loader = None  # 后台加载任务
+
+    async def load(self) -> None:
+        if self.loaded:
+            return
+        async with self.lock:
+            if self.loaded:
+                return
+            ids = array("Q")
+            async for id_ in self.database.read_download_data():
+                if (key := self.__key(id_)) is None:
+                    self.others.add(id_)
+                else:
+                    ids.append(key)
+            self.ids = array("Q", sorted(ids))
+            self.loaded = True
+
+    def start(self) -> None:
+        """在后台加载索引，加载完成前的查询会等待加载结束"""
+        if not self.loaded and not self.loader:
+            self.loader = create_task(self.load())
+
+    async def has(self, id_: str) -> bool:
+        await self.load()
+        if (key := self.__key(id_)) is None:
+            return id_ in self.others
+        if key in self.added:
+            return True
+        if key in self.removed:
+            return False
+        return self.__search(key)
+
+    def add(self, id_: str) -> None:
+        """新增下载记录，调用前需加载索引"""
+        if (key := self.__key(id_)) is None:
+            self.others.add(id_)
+        elif key in self.removed:
+            self.removed.discard(key)
+        elif not self.__search(key):
+            self.added.add(key)
+            if len(self.added) >= self.MERGE_SIZE:
+                self.__merge()
+        self.__schedule(id_, True)
+
+    def remove(self, id_: str) -> None:
+        """删除下载记录，调用前需加载索引"""
+        if (key := self.__key(id_)) is None:
+            self.others.discard(id_)
+        elif key in self.added:
+            self.added.discard(key)
+        elif self.__search(key):
+            self.removed.add(key)
+        self.__schedule(id_, False)
+
+    async def clear(self) -> None:
+        async with self.lock:
+            self.ids = array("Q")
+            self.added.clear()
+            self.removed.clear()
+            self.others.clear()
+            self.pending.clear()
+            await self.database.delete_all_download_data()
+
+    async def flush(self) -> None:
+        if not self.pending:
+            return
+        async with self.lock:
+            pending, self.pending = self.pending, {}
+            try:
+                await self.database.update_download_data(
+                    [k for k, v in pending.items() if v],
+                    [k for k, v in pending.items() if not v],
+                )
+            except BaseException:
+                # 写入失败时保留暂存记录，等待下次写入
+                self.pending = pending | self.pending
+                raise
+
+    async def close(self) -> None:
+        await self.__cancel(self.loader)
+        await self.__cancel(self.task)
+        self.loader = self.task = None
+        await self.flush()
+
+    async def __cancel(self, task: Task | None) -> None:
+        # 后台任务异常不影响关闭索引，写入失败的暂存记录由最后一次写入处理
+        if not task:
+            return
+        task.cancel()
+        try:
+            await task
+        except CancelledError:
+            pass
+        except Exception as e:
+            self.console.warning(
+                _("下载记录索引后台任务异常: {error}").format(error=repr(e))
+            )
+
+    def __schedule(self, id_: str, value: bool) -> None:
+        self.pending[id_] = value
+        if not self.task or self.task.done():
+            self.task = create_task(self.__delay_flush())
+
+    async def __delay_flush(self) -> None:
+        await sleep(self.FLUSH_INTERVAL)
+        # 关闭索引时取消定时任务，避免中断正在执行的写入事务
+        await shield(self.flush())
+
+    def __search(self, key: int) -> bool:
+        index = bisect_left(self.ids, key)
+        return index < len(self.ids) and self.ids[index] == key
+
+    def __merge(self) -> None:
+        ids = [i for i in self.ids if i not in self.removed]
+        self.ids = array("Q", sorted(ids + list(self.added)))
+        self.added.clear()
+        self.removed.clear()
+
+    @classmethod
+    def __key(cls, id_: str) -> int | None:
+        # 以 0 开头的 ID 转换为整数后可能与其他 ID 重复，不转换为整数
+        if (
+            id_.isascii()
+            and id_.isdigit()
+            and id_[0] != "0"
+            and (key := int(id_)) < cls.MAX_ID
+        ):
+            return key
+        return None
@@ -12,6 +12,7 @@ from ..custom import (
 if TYPE_CHECKING:
     from ..tools import ColorfulConsole
     from .database import Database
+    from .index import IDIndex
 
 __all__ = [
     "DownloadRecorder",
@@ -118,30 +119,69 @@ class __DownloadRecorder:
 class DownloadRecorder:
     detail = compile(r"\d{19}")
 
-    def __init__(self, database: "Database", switch: bool, console: "ColorfulConsole"):
+    def __init__(
+        self,
+        database: "Database",
+        switch: bool,
+        console: "ColorfulConsole",
+        index: "IDIndex",
+    ):
         self.switch = switch
         self.console = console
         self.database = database
+        self.index = index
 
     async def has_id(self, id_: str) -> bool:
-        return (
-            await self.database.has_download_data(id_) if self.switch and id_ else False
-        )
+        return await self.index.has(id_) if self.switch and id_ else False
 
     async def update_id(self, id_: str):
         if self.switch and id_:
-            await self.database.write_download_data(id_)
+            await self.index.load()
+            self.index.add(id_)
+
+    async def update_host(self, host: str, tiktok: bool) -> None:
+        """记录文件下载域名，供下次运行时预热连接"""
+        if host:
+            await self.database.update_host_data(host, tiktok)
+
+    async def update_file(
+        self,
+        path: str,
+        id_: str,
+        role: str,
+        folder: str,
+        size: int,
+        content_type: str,
+        checksum: str,
+        host: str,
+        duration: float,
+    ) -> None:
+        """记录下载文件的路径、大小、校验值与下载耗时，不受下载记录开关影响"""
+        await self.database.write_catalog_data(
+            path,
+            id_,
+            role,
+            folder,
+            size,
+            content_type,
+            checksum,
+            host,
+            duration,
+        )
 
     async def delete_id(self, id_: str) -> None:
         if self.switch and id_:
-            await self.database.delete_download_data(id_)
+            await self.index.load()
+            self.index.remove(id_)
 
     async def delete_ids(self, ids: str) -> None:
         if ids.upper() == "ALL":
-            await self.database.delete_all_download_data()
+            await self.index.clear()
         else:
-            ids = self.__extract_ids(ids)
-            await self.database.delete_download_data(ids)
+            await self.index.load()
+            for i in self.__extract_ids(ids):
+                self.index.remove(i)
+            await self.index.flush()
 
     def __extract_ids(self, ids: str) -> list[str]:
         ids = ids.split()
@@ -0,0 +1,125 @@
+from asyncio import CancelledError, create_task, gather, sleep
+from contextlib import suppress
+from time import monotonic
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from httpx import HTTPError
+
+from ..interface import API, APITikTok
+from ..translation import _
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+    from ..config import Parameter
+    from .database import Database
+
+__all__ = ["HostWarmer"]
+
+
+class HostWarmer:
+    """预热数据接口与近期文件下载域名的解析结果和连接"""
+
+    LIMIT = 16  # 预热的历史下载域名数量上限
+    MIN_INTERVAL = 1  # 刷新间隔下限，单位：秒
+
+    def __init__(self, database: "Database"):
+        self.database = database
+        self.parameter: "Parameter" = None
+        self.task = None
+        self.keep = False
+
+    async def run(self, parameter: "Parameter", idle: int = 0) -> None:
+        """预热数据接口与近期文件下载域名；idle 大于 0 时仅预热空闲时间不少于 idle 秒的域名"""
+        if not parameter.prewarm:
+            return
+        targets = self.__api_targets(parameter)
+        for host, tiktok in await self.database.read_host_data(self.LIMIT):
+            targets.extend((host, i) for i in self.__clients(parameter, tiktok, True))
+        if idle:
+            # 近期有请求的域名连接仍然可用，无需刷新
+            now = monotonic()
+            targets = [
+                (i, j)
+                for i, j in targets
+                if now - parameter.activity.get(i, now - idle) >= idle
+            ]
+        if not targets:
+            return
+        await gather(*[self.__warm(parameter, i, j) for i, j in targets])
+        parameter.logger.info(
+            _("已预热 {count} 个域名的连接").format(count=len({i for i, _ in targets})),
+            False,
+        )
+
+    @classmethod
+    def __api_targets(cls, parameter: "Parameter") -> list[tuple[str, "AsyncClient"]]:
+        targets = []
+        if parameter.douyin_platform:
+            host = urlparse(API.domain).hostname
+            targets.extend((host, i) for i in cls.__clients(parameter, False))
+        if parameter.tiktok_platform:
+            host = urlparse(APITikTok.domain).hostname
+            targets.extend((host, i) for i in cls.__clients(parameter, True))
+        return targets
+
+    @staticmethod
+    def __clients(
+        parameter: "Parameter",
+        tiktok: bool,
+        download=False,
+    ) -> list["AsyncClient"]:
+        """返回请求使用的客户端；未设置代理且启用代理池时，返回代理池中全部代理的客户端"""
+        if tiktok:
+            proxy, pool = parameter.proxy_tiktok, parameter.proxy_pool_tiktok
+        else:
+            proxy, pool = parameter.proxy, parameter.proxy_pool
+        if pool and not proxy:
+            return [i.client for i in pool.items]
+        if download:
+            return [
+                parameter.client_download_tiktok
+                if tiktok
+                else parameter.client_download
+            ]
+        return [parameter.client_tiktok if tiktok else parameter.client]
+
+    @staticmethod
+    async def __warm(parameter: "Parameter", host: str, client: "AsyncClient"):
+        await parameter.resolver.resolve(host, 443)
+        try:
+            await client.head(f"https://{host}/", extensions={"prewarm": True})
+        except (HTTPError, RuntimeError) as e:
+            parameter.logger.info(f"预热 {host} 失败: {e!r}", False)
+
+    def start(self, parameter: "Parameter", keep=False) -> None:
+        """启动后台预热任务；keep 为 True 时持续运行，空闲期间定期刷新连接"""
+        self.parameter = parameter
+        if not parameter.prewarm:
+            return
+        if self.task and not self.task.done():
+            if self.keep or not keep:
+                return
+            self.task.cancel()
+        self.keep = keep
+        self.task = create_task(self.__keep_warm() if keep else self.run(parameter))
+
+    async def __keep_warm(self) -> None:
+        with suppress(CancelledError):
+            await self.run(self.parameter)
+            while True:
+                await sleep(interval := self.__interval(self.parameter))
+                await self.run(self.parameter, interval)
+
+    def __interval(self, parameter: "Parameter") -> int:
+        # 在空闲连接过期之前刷新，避免连接池中的连接被关闭
+        return max(parameter.keepalive_expiry - 1, self.MIN_INTERVAL)
+
+    async def stop(self) -> None:
+        if self.task:
+            self.task.cancel()
+            with suppress(CancelledError):
+                await self.task
+            self.task = None
+        self.keep = False
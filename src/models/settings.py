@@ -77,15 +77,36 @@ class Settings(BaseModel):
     date_format: str | None = None
     split: str | None = None
     folder_mode: bool | None = None
+    folder_shard: str | None = None
     music: bool | None = None
     truncate: int | None = None
+    progress_mode: str | None = None
     storage_format: str | None = None
+    storage_compression: str | None = None
+    storage_source: bool | None = None
     cookie: str | dict = ""
     cookie_tiktok: str | dict = ""
+    cookie_pool: List[str | dict] | None = None
+    cookie_pool_tiktok: List[str | dict] | None = None
+    cookie_budget: int | None = None
     dynamic_cover: bool | None = None
     static_cover: bool | None = None
     proxy: str | None = None
     proxy_tiktok: str | None = None
+    proxy_pool: List[str] | None = None
+    proxy_pool_tiktok: List[str] | None = None
+    proxy_check_url: str | None = None
+    proxy_check_url_tiktok: str | None = None
+    proxy_check_interval: int | None = None
+    proxy_concurrency: int | None = None
+    http2: bool | None = None
+    max_connections: int | None = None
+    max_keepalive_connections: int | None = None
+    keepalive_expiry: int | None = None
+    dns_cache_ttl: int | None = None
+    prewarm: bool | None = None
+    extract_processes: int | None = None
+    extract_threshold: int | None = None
     twc_tiktok: str | None = None
     download: bool | None = None
     max_size: int | None = None
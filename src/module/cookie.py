@@ -76,6 +76,17 @@ class Cookie:
         data[key] = cookie
         self.settings.update(data)
 
+    def save_cookie_pool(self, cookie: dict, key="cookie_pool") -> bool:
+        """追加 Cookie 至 Cookie 池，返回值表示是否写入"""
+        data = self.settings.read()
+        pool = data.get(key) or []
+        if cookie in pool:
+            return False
+        pool.append(cookie)
+        data[key] = pool
+        self.settings.update(data)
+        return True
+
     @classmethod
     def validate_cookie_minimal(cls, cookie_str: str) -> bool:
         """
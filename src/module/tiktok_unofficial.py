@@ -1,19 +1,22 @@
+from asyncio import Lock, Semaphore, as_completed, create_task, gather
 from time import strftime, localtime
-from types import SimpleNamespace
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AsyncGenerator
 from typing import Union
 
-from httpx import get
-
 from src.custom import BLANK_HEADERS
+from src.custom import MAX_WORKERS
 from src.custom import wait
 from src.extract import Extractor
 from src.testers import Params
 from src.tools import Retry
 from src.tools import capture_error_request
+from src.tools import create_client
+from src.tools import decode_json
 from src.translation import _
 
 if TYPE_CHECKING:
+    from httpx import AsyncClient
+
     from src.config import Parameter
     from src.testers import Params
 
@@ -25,42 +28,79 @@ class DetailTikTokUnofficial:
         proxy: str = None,
         detail_id: str = ...,
         *args,
+        limiter: Lock = None,
         **kwargs,
     ):
         self.headers = BLANK_HEADERS
         self.log = params.logger
         self.console = params.console
         self.api = "https://www.tikwm.com/api/"
-        self.proxy = proxy or params.proxy_tiktok
+        self.proxy = proxy
+        self.client: "AsyncClient" = (
+            create_client(timeout=params.timeout, proxy=proxy)
+            if proxy
+            else params.client_tiktok
+        )
         self.max_retry = params.max_retry
         self.timeout = params.timeout
         self.detail_id = detail_id
+        self.limiter = limiter  # 并发请求共享请求间隔，请求频率与逐个请求时一致
         self.text = _("作品")
 
     async def run(
         self,
     ) -> dict:
-        data = await self.request_data_get()
+        try:
+            data = await self.request_data_get()
+        finally:
+            if self.proxy:
+                await self.client.aclose()
         data = self.check_response(data)
         return data
 
+    @classmethod
+    async def run_batch(
+        cls,
+        params: Union["Parameter", "Params"],
+        ids: list[str],
+        concurrency: int = MAX_WORKERS,
+    ) -> AsyncGenerator[dict, None]:
+        """并发获取多个作品数据，按完成顺序逐个返回"""
+        semaphore = Semaphore(concurrency)
+        limiter = Lock()
+
+        async def inner(detail_id: str) -> dict:
+            async with semaphore:
+                return await cls(params, detail_id=detail_id, limiter=limiter).run()
+
+        tasks = [create_task(inner(i)) for i in ids]
+        try:
+            for task in as_completed(tasks):
+                if data := await task:
+                    yield data
+        finally:
+            # 调用方提前停止迭代或被取消时，取消尚未完成的请求
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+
     @Retry.retry
     @capture_error_request
     async def request_data_get(
         self,
     ):
-        response = get(
+        if self.limiter:
+            async with self.limiter:
+                await wait()
+        else:
+            await wait()
+        response = await self.client.get(
             self.api,
             params={"url": self.detail_id, "hd": "1"},
             headers=self.headers,
-            timeout=self.timeout,
-            follow_redirects=True,
-            verify=False,
-            proxy=self.proxy,
         )
         response.raise_for_status()
-        await wait()
-        return response.json()
+        return decode_json(response.content)
 
     def check_response(
         self,
@@ -93,7 +133,6 @@ class DetailTikTokExtractor:
 
     def run(self, data: dict) -> dict:
         item = {}
-        data = Extractor.generate_data_object(data)
         self.extract_detail_tiktok(item, data)
         self.extract_music_tiktok(item, data)
         self.extract_author_tiktok(item, data)
@@ -103,7 +142,7 @@ class DetailTikTokExtractor:
     def extract_detail_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         item["id"] = Extractor.safe_extract(data, "id")
         item["desc"] = (
@@ -121,7 +160,7 @@ class DetailTikTokExtractor:
     def extract_author_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         item["uid"] = Extractor.safe_extract(data, "author.id")
         item["nickname"] = Extractor.safe_extract(data, "author.nickname")
@@ -130,7 +169,7 @@ class DetailTikTokExtractor:
     def extract_music_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         item["music_author"] = Extractor.safe_extract(data, "music_info.author")
         item["music_title"] = Extractor.safe_extract(data, "music_info.title")
@@ -139,7 +178,7 @@ class DetailTikTokExtractor:
     @staticmethod
     def extract_statistics_tiktok(
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         for i in Extractor.statistics_keys:
             item[i] = Extractor.safe_extract(
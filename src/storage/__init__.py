@@ -1,3 +1,14 @@
+from .compress import COMPRESSION, ZSTD_SUPPORT
 from .manager import RecordManager
+from .ndjson import read_source, source_name, source_options
+from .parquet import PARQUET_SUPPORT
 
-__all__ = ["RecordManager"]
+__all__ = [
+    "RecordManager",
+    "COMPRESSION",
+    "ZSTD_SUPPORT",
+    "PARQUET_SUPPORT",
+    "read_source",
+    "source_name",
+    "source_options",
+]
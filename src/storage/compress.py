@@ -0,0 +1,53 @@
+from gzip import open as gzip_open
+from importlib.util import find_spec
+from io import BufferedReader
+from pathlib import Path
+from shutil import copyfileobj
+from typing import IO
+
+__all__ = [
+    "COMPRESSION",
+    "ZSTD_SUPPORT",
+    "compress_file",
+    "open_compressed",
+]
+
+# 压缩格式与文件后缀
+COMPRESSION = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+# zstd 压缩依赖 zstandard 库，未安装时仅支持 gzip 压缩
+ZSTD_SUPPORT = find_spec("zstandard") is not None
+
+
+def open_compressed(path: Path, compression: str, mode="rb") -> IO[bytes]:
+    """以二进制模式打开压缩文件，追加模式写入新的压缩帧"""
+    match compression:
+        case "gzip":
+            return gzip_open(path, mode)
+        case "zstd":
+            from zstandard import ZstdCompressor, ZstdDecompressor
+
+            if "r" in mode:
+                return BufferedReader(
+                    ZstdDecompressor().stream_reader(
+                        path.open("rb"),
+                        read_across_frames=True,
+                    )
+                )
+            return ZstdCompressor().stream_writer(path.open(mode))
+        case _:
+            return path.open(mode)
+
+
+def compress_file(path: Path, compression: str) -> Path:
+    """压缩文件并删除原文件，返回压缩文件路径"""
+    target = path.with_name(f"{path.name}{COMPRESSION[compression]}")
+    with (
+        path.open("rb") as source,
+        open_compressed(target, compression, "wb") as file,
+    ):
+        copyfileobj(source, file, 1024 * 1024)
+    path.unlink()
+    return target
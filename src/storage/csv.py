@@ -1,9 +1,11 @@
+from asyncio import Lock, to_thread
 from csv import writer
-from os.path import getsize
+from io import StringIO
 from pathlib import Path
 from platform import system
 from typing import TYPE_CHECKING
 
+from .compress import compress_file
 from .text import BaseTextLogger
 
 if TYPE_CHECKING:
@@ -13,10 +15,16 @@ __all__ = ["CSVLogger"]
 
 
 class CSVLogger(BaseTextLogger):
-    """CSV 格式保存数据"""
+    """CSV 格式保存数据
+
+    数据先写入内存缓冲区，缓冲数据在后台线程中批量写入文件；
+    文件大小达到上限时切换至下一个分卷文件，可选压缩已完成的分卷文件
+    """
 
     __type = "csv"
     encode = "UTF-8-SIG" if system() == "Windows" else "UTF-8"
+    BUFFER_SIZE = 1024 * 1024  # 缓冲数据达到该字符数时写入文件
+    MAX_SIZE = 512 * 1024 * 1024  # 单个分卷文件大小上限，单位：字节
 
     def __init__(
         self,
@@ -26,31 +34,81 @@ class CSVLogger(BaseTextLogger):
         console: "ColorfulConsole",
         old=None,
         name="Download",
+        compression: str = "",
         *args,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self.console = console
         self.file = None  # 文件对象
-        self.writer = None  # CSV对象
+        self.buffer = StringIO()  # 数据缓冲区
+        self.writer = writer(self.buffer)  # CSV对象
+        self.root = root
         self.name = self._rename(root, self.__type, old, name)  # 文件名称
-        self.path = root.joinpath(f"{self.name}.{self.__type}")  # 文件路径
+        self.path = self._part_path(root, self.name, self.__type)  # 文件路径
         self.title_line = title_line  # 标题行
         self.field_keys = field_keys
+        self.compression = compression  # 分卷文件压缩格式
+        self.size = 0  # 当前分卷文件大小
+        self.lock = Lock()  # 保证缓冲数据按顺序写入文件
 
     async def __aenter__(self):
-        self.file = self.path.open("a", encoding=self.encode, newline="")
-        self.writer = writer(self.file)
+        await to_thread(self.__open)
         await self.title()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self.file.close()
+        try:
+            await self.flush()
+        finally:
+            await to_thread(self.file.close)
 
     async def title(self):
-        if getsize(self.path) == 0:
+        if self.size == 0:
             # 如果文件没有任何数据，则写入标题行
             await self.save(self.title_line)
 
     async def _save(self, data, *args, **kwargs):
         self.writer.writerow(data)
+        if self.buffer.tell() >= self.BUFFER_SIZE:
+            await self.flush()
+
+    async def flush(self):
+        if not (text := self.buffer.getvalue()):
+            return
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        async with self.lock:
+            await to_thread(self.__write, text)
+
+    def __current_part(self) -> int:
+        # 继续写入最后一个未压缩且未达到大小上限的分卷文件
+        index = self._next_part(self.root, self.name, self.__type)
+        if index > 1:
+            path = self._part_path(self.root, self.name, self.__type, index - 1)
+            if path.exists() and path.stat().st_size < self.MAX_SIZE:
+                return index - 1
+        return index
+
+    def __open(self, index: int = None):
+        index = index or self.__current_part()
+        self.path = self._part_path(self.root, self.name, self.__type, index)
+        self.file = self.path.open("a", encoding=self.encode, newline="")
+        self.size = self.file.tell()
+
+    def __write(self, text: str):
+        self.file.write(text)
+        self.file.flush()
+        self.size = self.file.tell()
+        if self.size >= self.MAX_SIZE:
+            self.__rotate()
+
+    def __rotate(self):
+        self.file.close()
+        if self.compression:
+            compress_file(self.path, self.compression)
+        self.__open(self._next_part(self.root, self.name, self.__type))
+        title = StringIO()
+        writer(title).writerow(self.title_line)
+        self.file.write(title.getvalue())
+        self.size = self.file.tell()
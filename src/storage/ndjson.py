@@ -0,0 +1,189 @@
+from asyncio import Lock, to_thread
+from datetime import date
+from pathlib import Path
+from re import compile
+from typing import IO, TYPE_CHECKING, Iterator
+
+from ..tools import decode_json, encode_json
+from .compress import COMPRESSION, open_compressed
+from .text import BaseTextLogger
+
+if TYPE_CHECKING:
+    from ..tools import ColorfulConsole
+
+__all__ = ["NDJSONLogger", "read_source", "source_name", "source_options"]
+
+SOURCE_FILE = compile(r"^(.+?)(?:\.\d{3})?\.source\.ndjson(?:\.(?:gz|zst))?$")
+
+
+class NDJSONWriter:
+    """NDJSON 分卷文件写入，缓冲数据在后台线程中批量写入"""
+
+    BUFFER_SIZE = 1024 * 1024  # 缓冲数据达到该字节数时写入文件
+    MAX_SIZE = 512 * 1024 * 1024  # 单个分卷文件大小上限，单位：字节
+
+    def __init__(
+        self,
+        root: Path,
+        name: str,
+        type_: str,
+        compression: str = "",
+    ):
+        self.root = root
+        self.name = name
+        self.compression = compression
+        self.type = f"{type_}{COMPRESSION.get(compression, '')}"
+        self.file: IO[bytes] = None
+        self.path: Path = None
+        self.buffer: list[bytes] = []
+        self.size = 0  # 缓冲数据字节数
+        self.lock = Lock()
+
+    async def write(self, data: dict) -> None:
+        self.buffer.append(encode_json(data) + b"\n")
+        self.size += len(self.buffer[-1])
+        if self.size >= self.BUFFER_SIZE:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self.buffer:
+            return
+        data, self.buffer, self.size = b"".join(self.buffer), [], 0
+        async with self.lock:
+            await to_thread(self.__write, data)
+
+    async def close(self) -> None:
+        await self.flush()
+        if self.file:
+            await to_thread(self.file.close)
+            self.file = None
+
+    def __write(self, data: bytes) -> None:
+        if not self.file:
+            self.__open()
+        self.file.write(data)
+        self.file.flush()
+        if self.path.stat().st_size >= self.MAX_SIZE:
+            self.file.close()
+            self.file = None
+
+    def __open(self) -> None:
+        # 继续写入最后一个未达到大小上限的分卷文件，压缩文件追加写入新的压缩帧
+        index = BaseTextLogger._next_part(self.root, self.name, self.type)
+        if index > 1:
+            path = BaseTextLogger._part_path(self.root, self.name, self.type, index - 1)
+            if path.exists() and path.stat().st_size < self.MAX_SIZE:
+                index -= 1
+        self.path = BaseTextLogger._part_path(self.root, self.name, self.type, index)
+        self.file = open_compressed(self.path, self.compression, "ab")
+
+
+class NDJSONLogger(BaseTextLogger):
+    """NDJSON 格式保存数据
+
+    每条数据写入一行 JSON 对象；启用原始数据捕获时，
+    同时保存接口返回的原始数据，用于离线重新提取数据
+    """
+
+    __type = "ndjson"
+    __source = "source.ndjson"
+
+    def __init__(
+        self,
+        root: Path,
+        title_line: tuple,
+        field_keys: tuple,
+        console: "ColorfulConsole",
+        old=None,
+        name="Download",
+        compression: str = "",
+        source=False,
+        record="detail",
+        *args,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.console = console
+        self.name = self._rename(root, self.__type, old, name)  # 文件名称
+        self._rename(root, self.__source, old, name)
+        self.title_line = title_line
+        self.field_keys = field_keys
+        self.record = record  # 数据储存类型
+        self.writer = NDJSONWriter(root, self.name, self.__type, compression)
+        self.source = (
+            NDJSONWriter(root, self.name, self.__source, compression)
+            if source
+            else None
+        )
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.writer.close()
+        if self.source:
+            await self.source.close()
+
+    async def save(self, data: list, *args, **kwargs):
+        # 保留数据原始类型，不转换为字符串
+        return await self._save(data, *args, **kwargs)
+
+    async def _save(self, data: list, *args, **kwargs):
+        await self.writer.write(dict(zip(self.field_keys, data)))
+
+    async def capture(
+        self,
+        data: list[dict],
+        type_: str,
+        tiktok: bool,
+        options: dict,
+    ):
+        if not self.source:
+            return
+        options = {
+            k: v
+            for k, v in options.items()
+            if isinstance(v, str | int | float | bool | None)
+        }
+        for i in data:
+            await self.source.write(
+                {
+                    "record": self.record,
+                    "type": type_,
+                    "tiktok": tiktok,
+                    "options": options,
+                    "data": i,
+                }
+            )
+
+    async def flush(self):
+        await self.writer.flush()
+        if self.source:
+            await self.source.flush()
+
+
+def source_name(path: Path) -> str | None:
+    """返回原始数据文件对应的数据文件名称，非原始数据文件返回 None"""
+    if match := SOURCE_FILE.match(path.name):
+        return match.group(1)
+    return None
+
+
+def read_source(path: Path) -> Iterator[dict]:
+    """逐行读取原始数据文件"""
+    compression = next(
+        (k for k, v in COMPRESSION.items() if path.name.endswith(v)),
+        "",
+    )
+    with open_compressed(path, compression, "rb") as file:
+        for line in file:
+            if line := line.strip():
+                yield decode_json(line)
+
+
+def source_options(item: dict) -> dict:
+    """重新提取数据时使用的提取参数"""
+    options = item["options"]
+    if item["type"] == "batch":
+        options |= {
+            "earliest": date(2016, 9, 20),
+            "latest": date.today(),
+        }
+    return options
@@ -0,0 +1,116 @@
+from asyncio import to_thread
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .text import BaseTextLogger
+
+if TYPE_CHECKING:
+    from ..tools import ColorfulConsole
+
+__all__ = ["ParquetLogger", "PARQUET_SUPPORT"]
+
+# Parquet 格式依赖 pyarrow 库
+PARQUET_SUPPORT = find_spec("pyarrow") is not None
+
+
+class ParquetLogger(BaseTextLogger):
+    """Parquet 格式保存数据
+
+    按数据表列类型生成列式结构，缓冲数据达到行组大小时以行组追加写入；
+    Parquet 文件无法追加写入，每次运行写入新的分卷文件
+    """
+
+    __type = "parquet"
+    ROW_GROUP_SIZE = 10000  # 单个行组数据行数
+    COMPRESSION = "zstd"
+
+    def __init__(
+        self,
+        root: Path,
+        title_line: tuple,
+        title_type: tuple,
+        field_keys: tuple,
+        console: "ColorfulConsole",
+        old=None,
+        name="Download",
+        *args,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.console = console
+        self.root = root
+        self.name = self._rename(root, self.__type, old, name)  # 文件名称
+        self.path = self._part_path(root, self.name, self.__type)
+        self.title_line = title_line  # 列名
+        self.integer = [i.startswith("INTEGER") for i in title_type]  # 整数列
+        self.field_keys = field_keys
+        self.schema = None
+        self.writer = None  # ParquetWriter 对象
+        self.columns = [[] for _ in title_line]  # 待写入数据，按列缓冲
+        self.rows = 0  # 待写入数据行数
+
+    async def __aenter__(self):
+        import pyarrow as pa
+
+        self.schema = pa.schema(
+            [
+                (i, pa.int64() if j else pa.string())
+                for i, j in zip(self.title_line, self.integer)
+            ]
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.__write()
+        if self.writer:
+            await to_thread(self.writer.close)
+            self.writer = None
+
+    async def _save(self, data, *args, **kwargs):
+        for column, integer, value in zip(self.columns, self.integer, data):
+            column.append(self.__integer(value) if integer else value)
+        self.rows += 1
+        if self.rows >= self.ROW_GROUP_SIZE:
+            await self.__write()
+
+    # 提取器每页数据调用的 flush 不写入数据，避免产生过小的行组；
+    # Parquet 文件在关闭前不可读取，提前写入无法提高数据安全性
+
+    async def __write(self):
+        if not self.rows:
+            return
+        columns, self.columns = self.columns, [[] for _ in self.title_line]
+        self.rows = 0
+        await to_thread(self.__write_table, columns)
+
+    def __write_table(self, columns: list[list]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self.writer:
+            self.path = self._part_path(
+                self.root,
+                self.name,
+                self.__type,
+                self._next_part(self.root, self.name, self.__type),
+            )
+            self.writer = pq.ParquetWriter(
+                str(self.path),
+                self.schema,
+                compression=self.COMPRESSION,
+                use_dictionary=True,
+            )
+        self.writer.write_table(
+            pa.Table.from_arrays(
+                [pa.array(i, type=j.type) for i, j in zip(columns, self.schema)],
+                schema=self.schema,
+            )
+        )
+
+    @staticmethod
+    def __integer(value: str) -> int | None:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
@@ -1,7 +1,9 @@
+from asyncio import Lock
 from pathlib import Path
 from re import sub
+from time import monotonic
 
-from aiosqlite import connect
+from aiosqlite import Connection, connect
 from sqlite3 import OperationalError
 
 from rich.text import Text
@@ -11,12 +13,21 @@ from ..custom import ERROR
 from ..translation import _
 from .sql import BaseSQLLogger
 
-__all__ = ["SQLLogger"]
+__all__ = ["SQLLogger", "SQLitePool"]
 
 
 class SQLLogger(BaseSQLLogger):
     """SQLite 数据库保存数据"""
 
+    BATCH_SIZE = 500  # 缓冲数据达到该数量时写入数据库
+    FLUSH_INTERVAL = 5  # 距上次写入超过该秒数时写入数据库
+    PRAGMA = (
+        "PRAGMA journal_mode=WAL;",
+        "PRAGMA synchronous=NORMAL;",
+        "PRAGMA cache_size=-16000;",  # 页面缓存 16 MB
+        "PRAGMA temp_store=MEMORY;",
+    )
+
     def __init__(
         self,
         root: Path,
@@ -26,10 +37,12 @@ class SQLLogger(BaseSQLLogger):
         field_keys: tuple,
         old=None,
         name="Download",
+        pool: "SQLitePool" = None,
         *args,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        self.pool = pool  # 共享连接池，未设置时独立创建连接
         self.db = None  # 数据库
         self.cursor = None  # 游标对象
         self.name = (old, name)  # 数据表名称
@@ -38,16 +51,41 @@ class SQLLogger(BaseSQLLogger):
         self.title_line = title_line  # 数据表列名
         self.title_type = title_type  # 数据表数据类型
         self.field_keys = field_keys
+        self.insert_sql = ""
+        self.buffer: list = []  # 待写入数据
+        self.flushed = monotonic()
 
     async def __aenter__(self):
-        self.db = await connect(self.path)
-        self.cursor = await self.db.cursor()
-        await self.update_sheet()
-        await self.create()
+        if self.pool:
+            self.db = await self.pool.connect(self.path)
+            await self.pool.ensure(self)
+        else:
+            self.db = await self.open(self.path)
+            await self.ensure()
+        self.insert_sql = f"""REPLACE INTO {self.name} ({
+            ", ".join(self.title_line)
+        }) VALUES ({", ".join(["?" for _ in self.title_line])});"""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.db.close()
+        try:
+            await self.flush()
+        finally:
+            if not self.pool:
+                await self.db.close()
+
+    @classmethod
+    async def open(cls, path: Path) -> Connection:
+        db = await connect(path)
+        for i in cls.PRAGMA:
+            await db.execute(i)
+        return db
+
+    async def ensure(self):
+        """更新数据表名称并创建数据表"""
+        self.cursor = await self.db.cursor()
+        await self.update_sheet()
+        await self.create()
 
     async def create(self):
         create_sql = f"""CREATE TABLE IF NOT EXISTS {self.name} ({
@@ -57,10 +95,20 @@ class SQLLogger(BaseSQLLogger):
         await self.db.commit()
 
     async def _save(self, data, *args, **kwargs):
-        insert_sql = f"""REPLACE INTO {self.name} ({
-            ", ".join(self.title_line)
-        }) VALUES ({", ".join(["?" for _ in self.title_line])});"""
-        await self.cursor.execute(insert_sql, data)
+        self.buffer.append(data)
+        if (
+            len(self.buffer) >= self.BATCH_SIZE
+            or monotonic() - self.flushed >= self.FLUSH_INTERVAL
+        ):
+            await self.flush()
+
+    async def flush(self):
+        """在单个事务中批量写入缓冲数据"""
+        self.flushed = monotonic()
+        if not self.buffer:
+            return
+        data, self.buffer = self.buffer, []
+        await self.db.executemany(self.insert_sql, data)
         await self.db.commit()
 
     async def update_sheet(self):
@@ -108,3 +156,37 @@ class SQLLogger(BaseSQLLogger):
             text = self.SHEET_NAME.sub("_", text)
             text = sub(r"_+", "_", text)
         return text
+
+
+class SQLitePool:
+    """SQLite 数据库连接池
+
+    每个数据库文件在进程生命周期内复用同一连接与写入线程，
+    已创建的数据表仅在首次使用时检查与创建
+    """
+
+    def __init__(self):
+        self.connections: dict[Path, Connection] = {}
+        self.tables: dict[tuple[Path, tuple], str] = {}  # 已创建的数据表名称
+        self.lock = Lock()
+
+    async def connect(self, path: Path) -> Connection:
+        async with self.lock:
+            if path not in self.connections:
+                self.connections[path] = await SQLLogger.open(path)
+            return self.connections[path]
+
+    async def ensure(self, logger: SQLLogger) -> None:
+        key = (logger.path, logger.name)
+        async with self.lock:
+            if key not in self.tables:
+                await logger.ensure()
+                self.tables[key] = logger.name
+        logger.name = self.tables[key]
+
+    async def close(self) -> None:
+        async with self.lock:
+            for i in self.connections.values():
+                await i.close()
+            self.connections.clear()
+            self.tables.clear()
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from typing import Union
 
 from ..tools import Retry
+from .compress import COMPRESSION
 
 if TYPE_CHECKING:
     from typing import Iterable
@@ -39,16 +40,66 @@ class BaseTextLogger:
         # 实际数据保存逻辑
         pass
 
-    @classmethod
-    def _rename(cls, root: Path, type_: str, old: str, new_: str) -> str:
+    async def flush(self):
+        # 写入缓冲数据，不缓冲数据的储存格式无需处理
+        pass
+
+    async def capture(
+        self,
+        data: list[dict],
+        type_: str,
+        tiktok: bool,
+        options: dict,
+    ):
+        # 保存接口返回的原始数据，仅 NDJSON 格式支持
+        pass
+
+    @staticmethod
+    def _old_name(old: str, new_: str) -> str:
+        # 返回标识变更前的文件名称，标识未变更时返回空字符串
         mark = new_.split("_", 1)
         if not old or mark[-1] == old:
-            return new_
+            return ""
         mark[-1] = old
-        old_file = root.joinpath(f"{'_'.join(mark)}.{type_}")
-        cls.__rename_file(old_file, root.joinpath(f"{new_}.{type_}"))
+        return "_".join(mark)
+
+    @classmethod
+    def _rename(cls, root: Path, type_: str, old: str, new_: str) -> str:
+        if not (old_name := cls._old_name(old, new_)):
+            return new_
+        index = 1
+        while (types := cls._part_types(root, old_name, type_, index)) or index == 1:
+            for i in types:
+                cls.__rename_file(
+                    cls._part_path(root, old_name, i, index),
+                    cls._part_path(root, new_, i, index),
+                )
+            index += 1
         return new_
 
+    @staticmethod
+    def _part_path(root: Path, name: str, type_: str, index: int = 1) -> Path:
+        # 首个分卷文件沿用原文件名称，后续分卷文件添加序号
+        if index == 1:
+            return root.joinpath(f"{name}.{type_}")
+        return root.joinpath(f"{name}.{index:03d}.{type_}")
+
+    @classmethod
+    def _part_types(cls, root: Path, name: str, type_: str, index: int) -> list[str]:
+        # 返回分卷文件已存在的文件类型，包括压缩后的分卷文件
+        return [
+            i
+            for i in (type_, *(f"{type_}{j}" for j in COMPRESSION.values()))
+            if cls._part_path(root, name, i, index).exists()
+        ]
+
+    @classmethod
+    def _next_part(cls, root: Path, name: str, type_: str, index: int = 1) -> int:
+        # 返回从 index 开始首个不存在的分卷序号
+        while cls._part_types(root, name, type_, index):
+            index += 1
+        return index
+
     @staticmethod
     @Retry.retry_infinite
     def __rename_file(old_file: Path, new_file: Path) -> bool:
@@ -1,7 +1,9 @@
+from asyncio import Lock, to_thread
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 from openpyxl.utils.exceptions import IllegalCharacterError
 
 from ..translation import _
@@ -10,13 +12,116 @@ from .text import BaseTextLogger
 if TYPE_CHECKING:
     from ..tools import ColorfulConsole
 
-__all__ = ["XLSXLogger"]
+__all__ = ["XLSXLogger", "XLSXPart", "XLSXPool"]
+
+
+class XLSXPart:
+    """XLSX 分卷文件
+
+    只写模式的数据簿仅能保存一次，分卷文件缓存当前分卷的数据行，
+    每次保存时使用只写模式重新写入整个分卷文件
+    """
+
+    def __init__(self, root: Path, name: str, title_line: tuple, type_="xlsx"):
+        self.root = root
+        self.name = name
+        self.title_line = title_line  # 标题行
+        self.type_ = type_
+        self.index = 0  # 当前分卷序号
+        self.path = BaseTextLogger._part_path(root, name, type_)
+        self.data: list[list] = []  # 当前分卷数据行，不含标题行
+        self.changed = False  # 当前分卷是否存在未保存的数据
+        self.lock = Lock()  # 同一分卷文件同时仅执行一次保存
+
+    def open(self):
+        """切换至下一个分卷文件"""
+        self.index = BaseTextLogger._next_part(
+            self.root,
+            self.name,
+            self.type_,
+            self.index + 1,
+        )
+        self.path = self.__path()
+        self.data = []
+        self.changed = False
+
+    def rename(self, name: str):
+        # 分卷文件已由 BaseTextLogger._rename 重命名，后续数据继续写入重命名后的文件
+        self.name = name
+        self.path = self.__path()
+
+    def __path(self) -> Path:
+        return BaseTextLogger._part_path(self.root, self.name, self.type_, self.index)
+
+    def full(self, max_rows: int) -> bool:
+        return not self.index or len(self.data) >= max_rows
+
+    def append(self, data: list):
+        self.data.append(data)
+        self.changed = True
+
+    async def save(self):
+        async with self.lock:
+            if not self.changed:
+                return
+            self.changed = False
+            # 传递数据行副本，保存期间写入的数据由下次保存写入文件
+            await to_thread(self.__save, self.path, self.title_line, self.data.copy())
+
+    @staticmethod
+    def __save(path: Path, title_line: tuple, data: list[list]):
+        book = Workbook(write_only=True)
+        sheet = book.create_sheet()
+        sheet.append(list(title_line))
+        for i in data:
+            sheet.append(i)
+        # 先写入临时文件再替换，避免保存中断导致已有文件损坏
+        cache = path.with_name(f"{path.name}.tmp")
+        book.save(cache)
+        book.close()
+        cache.replace(path)
+
+
+class XLSXPool:
+    """XLSX 分卷文件缓存
+
+    同一文件名称的数据在程序运行期间写入同一分卷文件，
+    仅在数据行数达到上限时切换分卷文件
+    """
+
+    def __init__(self):
+        self.parts: dict[Path, XLSXPart] = {}
+
+    def get(self, root: Path, name: str, title_line: tuple) -> XLSXPart:
+        key = root.joinpath(name)
+        if key not in self.parts:
+            self.parts[key] = XLSXPart(root, name, title_line)
+        return self.parts[key]
+
+    def rename(self, root: Path, old: str, new_: str) -> None:
+        # 文件名称变更后，缓存的分卷文件随文件名称一同变更，避免再次写入旧文件路径
+        if (part := self.parts.pop(root.joinpath(old), None)) and (
+            key := root.joinpath(new_)
+        ) not in self.parts:
+            part.rename(new_)
+            self.parts[key] = part
+
+    async def close(self) -> None:
+        for i in self.parts.values():
+            await i.save()
+        self.parts.clear()
 
 
 class XLSXLogger(BaseTextLogger):
-    """XLSX 格式保存数据"""
+    """XLSX 格式保存数据
+
+    使用只写模式写入，不读取已有文件；单个分卷文件数据行数达到上限时切换至下一个分卷文件。
+    设置分卷文件缓存时，同一文件名称在程序运行期间复用同一分卷文件，
+    未设置时每次写入使用新的分卷文件；每次写入结束时保存分卷文件
+    """
 
     __type = "xlsx"
+    MAX_ROWS = 100000  # 单个分卷文件最大数据行数，不含标题行
 
     def __init__(
         self,
@@ -26,38 +131,45 @@ class XLSXLogger(BaseTextLogger):
         console: "ColorfulConsole",
         old=None,
         name="Download",
+        workbooks: XLSXPool = None,
         *args,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self.console = console
-        self.book = None  # XLSX数据簿
-        self.sheet = None  # XLSX数据表
+        self.workbooks = workbooks  # 分卷文件缓存
+        self.root = root
         self.name = self._rename(root, self.__type, old, name)  # 文件名称
-        self.path = root.joinpath(f"{self.name}.{self.__type}")
+        if workbooks and (old_name := self._old_name(old, name)):
+            workbooks.rename(root, old_name, self.name)
         self.title_line = title_line  # 标题行
         self.field_keys = field_keys
+        self.part: XLSXPart = None  # 当前分卷文件
 
     async def __aenter__(self):
-        self.book = load_workbook(self.path) if self.path.exists() else Workbook()
-        self.sheet = self.book.active
-        self.title()
+        self.part = (
+            self.workbooks.get(self.root, self.name, self.title_line)
+            if self.workbooks
+            else XLSXPart(self.root, self.name, self.title_line, self.__type)
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self.book.save(self.path)
-        self.book.close()
-
-    def title(self):
-        if not self.sheet["A1"].value:
-            # 如果文件没有任何数据，则写入标题行
-            for col, value in enumerate(self.title_line, start=1):
-                self.sheet.cell(row=1, column=col, value=value)
+        await self.part.save()
 
     async def _save(self, data, *args, **kwargs):
-        try:
-            self.sheet.append(data)
-        except IllegalCharacterError as e:
-            self.console.warning(
-                _("数据包含非法字符，保存数据失败：{error}").format(error=e)
-            )
+        # 只写模式写入非法字符会导致数据表无法继续写入，需在写入前检查
+        for i in data:
+            if isinstance(i, str) and ILLEGAL_CHARACTERS_RE.search(i):
+                self.console.warning(
+                    _("数据包含非法字符，保存数据失败：{error}").format(
+                        error=IllegalCharacterError(
+                            f"{i} cannot be used in worksheets."
+                        )
+                    )
+                )
+                return
+        if self.part.full(self.MAX_ROWS):
+            await self.part.save()
+            self.part.open()
+        self.part.append(data)
@@ -12,6 +12,8 @@ from src.encrypt import ABogus
 from src.encrypt import XBogus
 from src.testers.logger import Logger
 from src.tools import Cleaner
+from src.tools import CookiePool
+from src.tools import ProxyPool
 from src.tools import create_client
 
 
@@ -31,6 +33,8 @@ class Params:
             "Cookie": self.cookie_str_tiktok,
         }
         self.headers_download = DOWNLOAD_HEADERS_TIKTOK
+        self.cookie_pool = CookiePool("sessionid_ss")
+        self.cookie_pool_tiktok = CookiePool("sessionid_ss")
         self.logger = Logger()
         self.ab = ABogus()
         self.xb = XBogus()
@@ -39,13 +43,23 @@ class Params:
         self.timeout = 5
         self.max_pages = 2
         self.date_format = "%Y-%m-%d %H:%M:%S"
+        self.extract_processes = 0
+        self.extract_threshold = 5000
+        self.storage_compression = ""
+        self.storage_source = False
+        self.progress_mode = ""
+        self.folder_shard = ""
+        self.proxy = None
+        self.proxy_tiktok = "http://127.0.0.1:10809"
         self.client = create_client(
             timeout=self.timeout,
         )
         self.client_tiktok = create_client(
             timeout=self.timeout,
-            proxy="http://127.0.0.1:10809",
+            proxy=self.proxy_tiktok,
         )
+        self.proxy_pool = ProxyPool("https://www.douyin.com/?recommend=1")
+        self.proxy_pool_tiktok = ProxyPool("https://www.tiktok.com/explore")
 
     def create_ini(self):
         self.config["dy"] = {
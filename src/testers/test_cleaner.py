@@ -0,0 +1,40 @@
+from pytest import mark
+
+from src.testers.text_benchmark import (
+    RULE_LINUX,
+    RULE_WINDOWS,
+    generate_corpus,
+    reference_beautify_string,
+    reference_filter,
+    reference_filter_name,
+    reference_truncate_string,
+)
+from src.tools import Cleaner, beautify_string, truncate_string
+
+CORPUS = generate_corpus(500)
+
+
+@mark.parametrize("rule", [RULE_WINDOWS, RULE_LINUX, {"ab": "b", "b": "c"}])
+def test_cleaner(rule):
+    cleaner = Cleaner()
+    cleaner.rule = rule
+    for text in CORPUS:
+        assert cleaner.filter(text) == reference_filter(rule, text)
+        assert cleaner.filter_name(text, "默认") == reference_filter_name(
+            rule,
+            text,
+            "默认",
+        )
+
+
+@mark.parametrize("length", [0, 1, 8, 32, 64])
+def test_truncate(length):
+    for text in CORPUS:
+        assert truncate_string(text, length) == reference_truncate_string(
+            text,
+            length,
+        )
+        assert beautify_string(text, length) == reference_beautify_string(
+            text,
+            length,
+        )
@@ -0,0 +1,24 @@
+from json import loads
+
+from src.tools import decode_json, encode_json
+
+CONTENT = (
+    b'{"aweme_list":[{"aweme_id":"1","desc":"\xe4\xbd\x9c\xe5\x93\x81"}],'
+    b'"max_cursor":1700000000000,"has_more":1,"log_pb":{"impr_id":"x"},'
+    b'"extra":{"now":1700000000000}}'
+)
+
+
+def test_decode_json():
+    assert decode_json(CONTENT) == loads(CONTENT)
+    assert decode_json(CONTENT, ("aweme_list", "max_cursor", "has_more")) == {
+        "aweme_list": [{"aweme_id": "1", "desc": "作品"}],
+        "max_cursor": 1700000000000,
+        "has_more": 1,
+    }
+    assert decode_json(b"[1, 2]", ("aweme_list",)) == [1, 2]
+
+
+def test_encode_json():
+    data = {"message": "获取数据成功！", "data": [{"id": "1"}], "params": None}
+    assert loads(encode_json(data)) == data
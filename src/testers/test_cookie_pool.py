@@ -0,0 +1,54 @@
+from asyncio import run
+from time import monotonic
+
+from src.tools import CookiePool
+
+
+def create_pool(budget=0):
+    pool = CookiePool("sessionid_ss", budget)
+    pool.update("ttwid=primary", ["ttwid=a; sessionid_ss=1", "ttwid=b"])
+    return pool
+
+
+def test_acquire():
+    async def acquire():
+        pool = create_pool(budget=1)
+        primary, login, guest = pool.items
+        # 优先使用已登录的 Cookie，预算耗尽后轮换
+        assert await pool.acquire() is login
+        assert await pool.acquire(login) in (primary, guest)
+        item = await pool.acquire(login)
+        assert item in (primary, guest)
+        assert all(i.requests for i in pool.items)
+
+    run(acquire())
+
+
+def test_feedback_pause():
+    pool = create_pool()
+    item = pool.items[1]
+    paused = [pool.feedback(item, False) for _ in range(6)]
+    # 0.8 ** 5 < 0.3 < 0.8 ** 4
+    assert paused == [False, False, False, False, False, True]
+    assert item.score == pool.RECOVERY
+    assert not item.available(monotonic(), pool.WINDOW)
+    assert pool.select() is not item
+    assert not pool.feedback(pool.items[2], True)
+
+
+def test_cooldown_fallback():
+    async def acquire():
+        pool = create_pool()
+        for item in pool.items:
+            pool.feedback(item, False)
+            item.score = 0
+            assert pool.feedback(item, False)
+        # 全部 Cookie 暂停使用时不等待冷却，返回主 Cookie
+        assert await pool.acquire(pool.items[1]) is pool.items[0]
+        pool.items[1].cooldown = 0
+        assert await pool.acquire(pool.items[0]) is pool.items[1]
+        pool.update("", ["ttwid=a"])
+        pool.items[0].cooldown = monotonic() + pool.COOLDOWN
+        assert await pool.acquire() is None
+
+    run(acquire())
@@ -0,0 +1,108 @@
+from asyncio import gather, run, sleep
+from datetime import datetime
+
+from src.downloader import Downloader
+from src.downloader.scheduler import DownloadScheduler
+from src.tools import (
+    ColorfulConsole,
+    TransferProgress,
+    is_shard_folder,
+    shard_folders,
+    shard_parts,
+)
+
+
+def test_sniff_type():
+    assert Downloader.sniff_type(b"\xff\xd8\xff\xe0\x00\x10JFIF") == "jpg"
+    assert Downloader.sniff_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "webp"
+    assert Downloader.sniff_type(b"\x00\x00\x00\x20ftypisom\x00\x00") == "mp4"
+    assert Downloader.sniff_type(b"\x00\x00\x00\x20ftypM4A \x00\x00") == "m4a"
+    assert Downloader.sniff_type(b"ID3\x04\x00") == "mp3"
+    assert Downloader.sniff_type(b"unknown") == ""
+
+
+def test_error_body():
+    assert Downloader.is_error_body(b"\n<!DOCTYPE html><html>", "image/jpeg")
+    assert Downloader.is_error_body(b'{"status_code": 8}', "")
+    assert Downloader.is_error_body(b"unknown", "text/html; charset=utf-8")
+    # 匹配文件签名的响应内容不受错误的 Content-Type 影响
+    assert not Downloader.is_error_body(b"\xff\xd8\xff", "text/html; charset=utf-8")
+    assert not Downloader.is_error_body(b"\x00\x00\x00\x20ftypisom", "text/plain")
+    assert not Downloader.is_error_body(b"\xff\xd8\xff", "image/jpeg")
+    assert not Downloader.is_error_body(b"\x00\x00\x00\x20ftypisom", "video/mp4")
+
+
+async def schedule(scheduler: DownloadScheduler, tasks: list[tuple[str, int]]):
+    order = []
+
+    async def task(name: str, size: int):
+        async with scheduler.slot(size):
+            order.append(name)
+            await sleep(0.01)
+
+    await gather(*[task(i, j) for i, j in tasks])
+    return order
+
+
+def test_scheduler():
+    scheduler = DownloadScheduler(2, 1)
+    large = DownloadScheduler.LARGE_SIZE
+    order = run(
+        schedule(
+            scheduler,
+            [
+                ("video_1", large * 2),
+                ("video_2", large * 3),
+                ("cover_1", 1024),
+                ("image_1", 1024 * 1024),
+                ("cover_2", 1024),
+            ],
+        )
+    )
+    # 大文件最多占用一个下载位置，较小的文件优先下载
+    assert order == ["video_1", "cover_1", "cover_2", "image_1", "video_2"]
+    assert scheduler.running == scheduler.large == 0
+    assert DownloadScheduler.estimate("video", "00:01:00") == 60 * (256 * 1024)
+    assert DownloadScheduler.estimate("image_3") == 1024 * 1024
+
+
+def test_transfer_progress():
+    progress = TransferProgress(ColorfulConsole(), headless=True)
+    video = progress.add_task("【视频】video", total=1000, completed=100)
+    image = progress.add_task("【图集】image", total=200)
+    progress.update(video, advance=400)
+    progress.update(image, advance=200)
+    progress.remove_task(image)
+    data = progress.statistics()
+    assert data["active"] == 1
+    assert data["finished"] == 1
+    assert data["bytes"] == 600
+    assert data["tasks"] == [{"name": "【视频】video", "completed": 500, "total": 1000}]
+
+
+def test_shard(tmp_path):
+    timestamp = int(datetime(2024, 5, 1, 12).timestamp())
+    assert shard_parts("date", "7300000000000000001", timestamp) == ("2024", "05")
+    assert shard_parts("date", "7300000000000000001", None) == ("unknown", "unknown")
+    assert len(shard_parts("hash", "7300000000000000001")[0]) == 2
+    assert shard_parts("", "7300000000000000001") == ()
+    tmp_path.joinpath("2024", "05").mkdir(parents=True)
+    tmp_path.joinpath("2024", "06").mkdir()
+    tmp_path.joinpath("2024", "05", "作品.mp4").touch()
+    tmp_path.joinpath("unknown", "unknown").mkdir(parents=True)
+    # 不符合分片文件夹命名规则的文件夹不视为分片文件夹
+    tmp_path.joinpath("2024", "作品文件夹").mkdir()
+    tmp_path.joinpath("作品文件夹", "05").mkdir(parents=True)
+    tmp_path.joinpath("ab").mkdir()
+    assert sorted(
+        i.relative_to(tmp_path).as_posix() for i in shard_folders(tmp_path, "date")
+    ) == [
+        "2024/05",
+        "2024/06",
+        "unknown/unknown",
+    ]
+    assert shard_folders(tmp_path, "hash") == [tmp_path.joinpath("ab")]
+    assert shard_folders(tmp_path, "") == [tmp_path]
+    assert is_shard_folder(tmp_path.joinpath("2024"), "date")
+    assert not is_shard_folder(tmp_path.joinpath("2024"), "hash")
+    assert not is_shard_folder(tmp_path.joinpath("2024", "05", "作品.mp4"), "date", 1)
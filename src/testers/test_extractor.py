@@ -0,0 +1,133 @@
+from asyncio import run
+from copy import deepcopy
+from pickle import dumps, loads
+from types import SimpleNamespace
+
+from pytest import mark, raises
+
+from src.extract import DetailRecord, Extractor, to_dict
+from src.storage import RecordManager
+from src.testers.logger import Logger
+from src.tools import Cleaner
+
+DATA = {
+    "aweme_id": "7300000000000000000",
+    "desc": "",
+    "statistics": {"digg_count": 0, "share_count": 12},
+    "anchor_info": {},
+    "music": None,
+    "text_extra": [{"hashtag_name": "a"}, {"hashtag_name": ""}],
+    "video": {
+        "duration": 15000,
+        "cover": {"url_list": ["cover_0", "cover_1"]},
+        "bit_rate": [],
+    },
+}
+
+
+@mark.parametrize(
+    "chain, default",
+    [
+        ("aweme_id", ""),
+        ("desc", "default"),
+        ("statistics.digg_count", -1),
+        ("statistics.share_count", -1),
+        ("statistics.play_count", -1),
+        ("anchor_info", ""),
+        ("music.title", ""),
+        ("text_extra[0].hashtag_name", ""),
+        ("text_extra[1].hashtag_name", ""),
+        ("text_extra[5].hashtag_name", ""),
+        ("video.cover.url_list[-1]", ""),
+        ("video.cover.url_list[x]", ""),
+        ("video.bit_rate", []),
+        ("video.duration.value", 0),
+        ("aweme_id[0]", ""),
+    ],
+)
+def test_safe_extract(chain, default):
+    expected = Extractor.safe_extract(
+        Extractor.generate_data_object(DATA),
+        chain,
+        default,
+    )
+    result = Extractor.safe_extract(DATA, chain, default)
+    if isinstance(expected, dict | list) or not hasattr(expected, "__dict__"):
+        assert result == expected
+    else:
+        assert result == vars(expected)
+
+
+def test_detail_record():
+    record = DetailRecord({"collection_time": "2024-01-01 00:00:00"})
+    record["id"] = "7300000000000000000"
+    record["desc"] = "作品描述"
+    assert record["id"] == "7300000000000000000"
+    assert record.get("uri", "") == ""
+    assert record.get("keys") is None
+    assert "desc" in record and "uri" not in record
+    assert list(record) == ["collection_time", "id", "desc"]
+    with raises(KeyError):
+        record["uri"]
+    with raises(KeyError):
+        record["unknown"] = ""
+    assert loads(dumps(record)) == record
+    assert to_dict([record]) == [
+        {
+            "collection_time": "2024-01-01 00:00:00",
+            "id": "7300000000000000000",
+            "desc": "作品描述",
+        }
+    ]
+
+
+class Recorder:
+    field_keys = [i for i in RecordManager.detail_keys if i != "collection_time"]
+
+    def __init__(self):
+        self.rows = []
+
+    async def save(self, data: list):
+        self.rows.append(data)
+
+    async def flush(self):
+        pass
+
+
+def test_process_pool_extract():
+    def create_extractor(processes: int) -> Extractor:
+        return Extractor(
+            SimpleNamespace(
+                logger=Logger(),
+                date_format="%Y-%m-%d %H:%M:%S",
+                CLEANER=Cleaner(),
+                extract_processes=processes,
+                extract_threshold=1,
+            )
+        )
+
+    async def extract(extractor: Extractor) -> tuple[list[dict], list[list]]:
+        recorder = Recorder()
+        try:
+            result = await extractor.run(
+                deepcopy(data), recorder, "detail", capture=False
+            )
+        finally:
+            extractor.close()
+        for item in result:
+            item.pop("collection_time")
+        return to_dict(result), recorder.rows
+
+    data = [
+        DATA
+        | {
+            "aweme_id": str(7300000000000000000 + i),
+            "desc": f"作品{i}",
+            "create_time": 1700000000 + i,
+        }
+        for i in range(16)
+    ]
+    expected = run(extract(create_extractor(0)))
+    assert len(expected[0]) == len(expected[1]) == 16
+    # 进程池分块提取的结果与当前进程提取的结果一致，且保持原始顺序
+    assert run(extract(create_extractor(2))) == expected
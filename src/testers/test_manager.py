@@ -0,0 +1,172 @@
+from asyncio import CancelledError, create_task, gather, run, sleep, wait_for
+from contextlib import suppress
+from pathlib import Path
+
+from src.manager import Database, IDIndex
+from src.testers.logger import Logger
+
+
+async def index_ids(path):
+    database = Database()
+    database.file = path
+    async with database:
+        await database.write_download_data("7300000000000000001")
+        await database.write_download_data("custom_id")
+        index = IDIndex(database, Logger())
+        assert await index.has("7300000000000000001")
+        assert await index.has("custom_id")
+        assert not await index.has("7300000000000000002")
+        index.add("7300000000000000002")
+        index.remove("7300000000000000001")
+        index.remove("custom_id")
+        assert await index.has("7300000000000000002")
+        assert not await index.has("7300000000000000001")
+        assert not await index.has("custom_id")
+        await index.close()
+        reload = IDIndex(database, Logger())
+        assert await reload.has("7300000000000000002")
+        assert not await reload.has("7300000000000000001")
+        assert not await reload.has("custom_id")
+        await reload.clear()
+        assert not await reload.has("7300000000000000002")
+        assert not [i async for i in database.read_download_data()]
+
+
+def test_id_index(tmp_path):
+    run(index_ids(tmp_path.joinpath("DouK-Downloader.db")))
+
+
+class FailingDatabase:
+    def __init__(self):
+        self.fail = True
+        self.rows = []
+
+    async def read_download_data(self):
+        for i in ():
+            yield i
+
+    async def update_download_data(self, inserts: list[str], deletes: list[str]):
+        if self.fail:
+            self.fail = False
+            raise OSError("database is locked")
+        self.rows.append((inserts, deletes))
+
+
+class WarningLogger(Logger):
+    def __init__(self):
+        self.messages = []
+
+    def warning(self, *args):
+        self.messages.append(args)
+
+
+async def index_flush_error(monkeypatch):
+    monkeypatch.setattr(IDIndex, "FLUSH_INTERVAL", 0)
+    database = FailingDatabase()
+    index = IDIndex(database, logger := WarningLogger())
+    await index.load()
+    index.add("7300000000000000001")
+    await sleep(0.01)
+    # 定时写入失败时保留暂存记录，关闭索引时记录异常并再次写入
+    assert index.task.done()
+    assert index.pending
+    await index.close()
+    assert len(logger.messages) == 1
+    assert database.rows == [(["7300000000000000001"], [])]
+    assert not index.pending
+
+
+def test_id_index_flush_error(monkeypatch):
+    run(index_flush_error(monkeypatch))
+
+
+async def concurrent_access(path):
+    database = Database()
+    database.file = path
+    async with database:
+        await gather(
+            *[database.update_mapping_data(str(i), f"name{i}", "") for i in range(200)]
+        )
+        rows = await gather(*[database.read_mapping_data(str(i)) for i in range(200)])
+        assert [i["NAME"] for i in rows] == [f"name{i}" for i in range(200)]
+        await database.update_config_data("Record", 0)
+        config = {i["NAME"]: i["VALUE"] for i in await database.read_config_data()}
+        assert config["Record"] == 0
+
+
+def test_database_concurrent_access(tmp_path):
+    run(concurrent_access(tmp_path.joinpath("DouK-Downloader.db")))
+
+
+async def cancelled_write(path):
+    database = Database()
+    database.file = path
+    async with database:
+        for i in range(4):
+            task = create_task(database.update_mapping_data(str(i), "cancelled", ""))
+            for _ in range(i):
+                await sleep(0)
+            task.cancel()
+            with suppress(CancelledError):
+                await task
+        # 取消等待中的写入操作后，写入任务仍可继续执行写入操作
+        await wait_for(database.update_mapping_data("id", "name", "mark"), 5)
+        row = await database.read_mapping_data("id")
+        assert (row["NAME"], row["MARK"]) == ("name", "mark")
+
+
+def test_database_cancelled_write(tmp_path):
+    run(cancelled_write(tmp_path.joinpath("DouK-Downloader.db")))
+
+
+async def catalog(path):
+    database = Database()
+    database.file = path
+    async with database:
+        for role, size in (("video", 4096), ("cover", 1024)):
+            await database.write_catalog_data(
+                str(Path(f"/Download/UID1_测试_发布作品/作品.{role}")),
+                "7300000000000000001",
+                role,
+                "UID1_测试_发布作品",
+                size,
+                "video/mp4",
+                "0" * 64,
+                "example.com",
+                0.5,
+            )
+        rows = await database.read_catalog_data("7300000000000000001")
+        assert [i["ROLE"] for i in rows] == ["cover", "video"]
+        assert len(await database.read_catalog_folder("UID1_测试_发布作品")) == 2
+        (summary,) = await database.read_catalog_summary()
+        assert summary["COUNT"] == 2
+        assert summary["SIZE"] == 5120
+        assert summary["SPEED"] == 5120
+        (daily,) = await database.read_catalog_daily()
+        assert daily["COUNT"] == 2
+        # 储存文件夹与文件重命名后同步更新文件路径与储存文件夹名称
+        await database.rename_catalog_data(
+            str(Path("/Download/UID1_测试_发布作品")),
+            str(Path("/Download/UID1_新标识_发布作品")),
+            "UID1_测试_发布作品",
+            "UID1_新标识_发布作品",
+        )
+        await database.rename_catalog_data(
+            str(Path("/Download/UID1_新标识_发布作品/作品.video")),
+            str(Path("/Download/UID1_新标识_发布作品/新作品.video")),
+        )
+        rows = await database.read_catalog_data("7300000000000000001")
+        assert [(i["PATH"], i["FOLDER"]) for i in rows] == [
+            (
+                str(Path("/Download/UID1_新标识_发布作品/作品.cover")),
+                "UID1_新标识_发布作品",
+            ),
+            (
+                str(Path("/Download/UID1_新标识_发布作品/新作品.video")),
+                "UID1_新标识_发布作品",
+            ),
+        ]
+
+
+def test_catalog(tmp_path):
+    run(catalog(tmp_path.joinpath("DouK-Downloader.db")))
@@ -0,0 +1,152 @@
+from pytest import mark
+
+from src.extract import plan
+from src.storage import RecordManager
+
+# 提取计划重构前 RecordManager 声明的数据储存列
+COLUMNS = {
+    "DETAIL": (
+        ("type", "作品类型", "TEXT"),
+        ("collection_time", "采集时间", "TEXT"),
+        ("uid", "UID", "TEXT"),
+        ("sec_uid", "SEC_UID", "TEXT"),
+        ("unique_id", "ID", "TEXT"),
+        ("id", "作品ID", "TEXT"),
+        ("desc", "作品描述", "TEXT"),
+        ("text_extra", "作品话题", "TEXT"),
+        ("duration", "视频时长", "TEXT"),
+        ("height", "视频高度", "INTEGER"),
+        ("width", "视频宽度", "INTEGER"),
+        ("share_url", "作品链接", "TEXT"),
+        ("create_time", "发布时间", "TEXT"),
+        ("uri", "视频URI", "TEXT"),
+        ("nickname", "账号昵称", "TEXT"),
+        ("user_age", "年龄", "INTEGER"),
+        ("signature", "账号签名", "TEXT"),
+        ("downloads", "下载地址", "TEXT"),
+        ("music_author", "音乐作者", "TEXT"),
+        ("music_title", "音乐标题", "TEXT"),
+        ("music_url", "音乐链接", "TEXT"),
+        ("static_cover", "静态封面", "TEXT"),
+        ("dynamic_cover", "动态封面", "TEXT"),
+        ("tag", "隐藏标签", "TEXT"),
+        ("digg_count", "点赞数量", "INTEGER"),
+        ("comment_count", "评论数量", "INTEGER"),
+        ("collect_count", "收藏数量", "INTEGER"),
+        ("share_count", "分享数量", "INTEGER"),
+        ("play_count", "播放数量", "INTEGER"),
+        ("extra", "额外信息", "TEXT"),
+    ),
+    "COMMENT": (
+        ("collection_time", "采集时间", "TEXT"),
+        ("cid", "评论ID", "TEXT"),
+        ("create_time", "评论时间", "TEXT"),
+        ("uid", "UID", "TEXT"),
+        ("sec_uid", "SEC_UID", "TEXT"),
+        ("nickname", "账号昵称", "TEXT"),
+        ("signature", "账号签名", "TEXT"),
+        ("user_age", "年龄", "INTEGER"),
+        ("ip_label", "IP归属地", "TEXT"),
+        ("text", "评论内容", "TEXT"),
+        ("sticker", "评论表情", "TEXT"),
+        ("image", "评论图片", "TEXT"),
+        ("digg_count", "点赞数量", "INTEGER"),
+        ("reply_comment_total", "回复数量", "INTEGER"),
+        ("reply_id", "回复ID", "TEXT"),
+        ("reply_to_reply_id", "回复对象", "TEXT"),
+    ),
+    "USER": (
+        ("collection_time", "采集时间", "TEXT"),
+        ("nickname", "昵称昵称", "TEXT"),
+        ("url", "账号链接", "TEXT"),
+        ("signature", "账号签名", "TEXT"),
+        ("unique_id", "抖音号", "TEXT"),
+        ("user_age", "年龄", "INTEGER"),
+        ("gender", "性别", "TEXT"),
+        ("country", "国家", "TEXT"),
+        ("province", "省份", "TEXT"),
+        ("city", "城市", "TEXT"),
+        ("district", "地区", "TEXT"),
+        ("ip_location", "IP归属地", "TEXT"),
+        ("verify", "标签", "TEXT"),
+        ("enterprise", "企业", "TEXT"),
+        ("sec_uid", "SEC_UID", "TEXT"),
+        ("uid", "UID", "TEXT"),
+        ("short_id", "SHORT_ID", "TEXT"),
+        ("avatar", "头像链接", "TEXT"),
+        ("cover", "背景图链接", "TEXT"),
+        ("aweme_count", "作品数量", "INTEGER"),
+        ("total_favorited", "获赞数量", "INTEGER"),
+        ("favoriting_count", "喜欢数量", "INTEGER"),
+        ("follower_count", "粉丝数量", "INTEGER"),
+        ("following_count", "关注数量", "INTEGER"),
+        ("max_follower_count", "粉丝最大值", "INTEGER"),
+    ),
+    "SEARCH_USER": (
+        ("collection_time", "采集时间", "TEXT"),
+        ("uid", "UID", "TEXT"),
+        ("sec_uid", "SEC_UID", "TEXT"),
+        ("nickname", "账号昵称", "TEXT"),
+        ("unique_id", "抖音号", "TEXT"),
+        ("short_id", "SHORT_ID", "TEXT"),
+        ("avatar", "头像链接", "TEXT"),
+        ("signature", "账号签名", "TEXT"),
+        ("verify", "标签", "TEXT"),
+        ("enterprise", "企业", "TEXT"),
+        ("follower_count", "粉丝数量", "INTEGER"),
+        ("total_favorited", "获赞数量", "INTEGER"),
+    ),
+    "SEARCH_LIVE": (
+        ("collection_time", "采集时间", "TEXT"),
+        ("room_id", "直播ID", "TEXT"),
+        ("uid", "UID", "TEXT"),
+        ("sec_uid", "SEC_UID", "TEXT"),
+        ("nickname", "账号昵称", "TEXT"),
+        ("short_id", "SHORT_ID", "TEXT"),
+        ("avatar", "头像链接", "TEXT"),
+        ("signature", "账号签名", "TEXT"),
+        ("verify", "标签", "TEXT"),
+        ("enterprise", "企业", "TEXT"),
+    ),
+    "HOT": (
+        ("position", "排名", "INTEGER"),
+        ("word", "内容", "TEXT"),
+        ("hot_value", "热度", "INTEGER"),
+        ("cover", "封面", "TEXT"),
+        ("event_time", "时间", "TEXT"),
+        ("view_count", "浏览数量", "INTEGER"),
+        ("video_count", "视频数量", "INTEGER"),
+        ("sentence_id", "SENTENCE_ID", "TEXT"),
+    ),
+}
+
+
+@mark.parametrize("name", COLUMNS)
+def test_plan_columns(name):
+    columns = COLUMNS[name]
+    item = getattr(plan, name)
+    assert item.columns == columns
+    assert item.field_keys == [i[0] for i in columns]
+    assert item.title_line == [i[1] for i in columns]
+    assert item.title_type == [i[2] for i in columns]
+    assert getattr(RecordManager, name.lower()) == columns
+
+
+def test_plan_compile():
+    def extract(data, path, default):
+        return data.get(path, default)
+
+    run = plan.HOT.compile(extract, {"str": str, "date": lambda x: f"date:{x}"})
+    item = run({"position": 1, "event_time": 2}, {"extra": 0})
+    assert item == {
+        "extra": 0,
+        "position": "1",
+        "word": "",
+        "hot_value": "-1",
+        "cover": "",
+        "event_time": "date:2",
+        "view_count": "-1",
+        "video_count": "-1",
+        "sentence_id": "",
+    }
+    assert plan.HOT.row(item) == [item[i] for i in plan.HOT.field_keys]
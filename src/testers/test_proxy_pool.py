@@ -0,0 +1,92 @@
+from asyncio import create_task, run, sleep
+
+from src.tools import ProxyPool
+
+PROXIES = ["http://127.0.0.1:10001", "http://127.0.0.1:10002"]
+
+
+def create_pool(concurrency=4):
+    return ProxyPool(
+        "https://example.com", PROXIES, interval=0, concurrency=concurrency
+    )
+
+
+def test_select():
+    async def select():
+        pool = create_pool()
+        first, second = pool.items
+        first.latency, second.latency = 0.5, 0.1
+        assert pool.select() is second
+        # 同一 key 固定使用同一代理，直至该代理不可用
+        assert pool.select("user") is second
+        second.latency = 1
+        assert pool.select("user") is second
+        second.healthy = False
+        assert pool.select("user") is first
+        # 全部代理不可用时仍按评分分配
+        first.healthy = False
+        assert pool.select() is first
+        await pool.close()
+
+    run(select())
+
+
+def test_feedback():
+    async def feedback():
+        pool = create_pool()
+        item = pool.items[0]
+        for _ in range(4):
+            pool.feedback(item, False)
+        assert item.error > pool.THRESHOLD
+        assert not item.healthy
+        assert pool.select() is pool.items[1]
+        for _ in range(5):
+            pool.feedback(item, True)
+        assert item.healthy
+        await pool.close()
+
+    run(feedback())
+
+
+def test_lease_concurrency():
+    async def lease():
+        pool = create_pool(concurrency=2)
+        pool.items = pool.items[:1]
+        item = pool.items[0]
+
+        async def request():
+            async with pool.lease():
+                await sleep(0.01)
+
+        tasks = [create_task(request()) for _ in range(5)]
+        await sleep(0.005)
+        # 超出并发限制的请求等待其他请求释放代理
+        assert item.semaphore.locked()
+        assert item.active == 5
+        for task in tasks:
+            await task
+        assert item.active == 0
+        assert not item.semaphore.locked()
+        await pool.close()
+
+    run(lease())
+
+
+def test_update_while_leased():
+    async def update():
+        pool = create_pool()
+        first, second = pool.items
+        async with pool.lease() as item:
+            assert item is first
+            await pool.update(PROXIES[1:], concurrency=8)
+            assert pool.items == [second]
+            # 正在使用的代理移除后不关闭客户端
+            assert item.retired
+            assert not item.client.is_closed
+            assert second.semaphore._value == 8
+        assert first.client.is_closed
+        assert not second.client.is_closed
+        await pool.close()
+        assert second.client.is_closed
+
+    run(update())
@@ -0,0 +1,305 @@
+from asyncio import run
+from csv import reader
+from gzip import open as gzip_open
+from sqlite3 import connect
+from types import SimpleNamespace
+
+from openpyxl import load_workbook
+from pytest import importorskip
+
+from src.application.main_terminal import TikTok
+from src.extract import Extractor
+from src.storage import RecordManager, read_source, source_name
+from src.storage.csv import CSVLogger
+from src.storage.ndjson import NDJSONLogger
+from src.storage.parquet import ParquetLogger
+from src.storage.sqlite import SQLitePool, SQLLogger
+from src.storage.xlsx import XLSXLogger, XLSXPool
+from src.testers.logger import Logger
+from src.tools import Cleaner
+
+TITLE_LINE = ("作品ID", "作品描述", "点赞数量")
+TITLE_TYPE = ("TEXT PRIMARY KEY", "TEXT", "INTEGER")
+FIELD_KEYS = ("id", "desc", "digg_count")
+
+
+async def save_rows(root, count: int, pool: SQLitePool = None):
+    async with SQLLogger(
+        root,
+        "DetailData.db",
+        TITLE_LINE,
+        TITLE_TYPE,
+        FIELD_KEYS,
+        name="Detail_测试",
+        pool=pool,
+    ) as logger:
+        for i in range(count):
+            await logger.save([str(i), f"作品{i}", i])
+        await logger.flush()
+        for i in range(count):
+            await logger.save([str(i), f"更新{i}", i])
+
+
+def test_sqlite_logger(tmp_path):
+    run(save_rows(tmp_path, SQLLogger.BATCH_SIZE * 2 + 3))
+    with connect(tmp_path.joinpath("DetailData.db")) as db:
+        assert db.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+        rows = db.execute("SELECT * FROM Detail_测试 ORDER BY 点赞数量;").fetchall()
+    assert len(rows) == SQLLogger.BATCH_SIZE * 2 + 3
+    assert rows[-1] == (str(len(rows) - 1), f"更新{len(rows) - 1}", len(rows) - 1)
+
+
+async def save_pooled(root, count: int) -> SQLitePool:
+    pool = SQLitePool()
+    await save_rows(root, count, pool)
+    db = pool.connections[root.joinpath("DetailData.db")]
+    await save_rows(root, count + 1, pool)
+    assert pool.connections == {root.joinpath("DetailData.db"): db}
+    assert pool.tables == {
+        (root.joinpath("DetailData.db"), (None, "Detail_测试")): "Detail_测试",
+    }
+    await pool.close()
+    return pool
+
+
+def test_sqlite_pool(tmp_path):
+    pool = run(save_pooled(tmp_path, 3))
+    assert not pool.connections
+    with connect(tmp_path.joinpath("DetailData.db")) as db:
+        assert db.execute("SELECT COUNT(*) FROM Detail_测试;").fetchone()[0] == 4
+
+
+async def save_xlsx(
+    root,
+    rows: list[list],
+    workbooks: XLSXPool = None,
+    old=None,
+    name="Detail_测试",
+):
+    async with XLSXLogger(
+        root,
+        TITLE_LINE,
+        FIELD_KEYS,
+        SimpleNamespace(warning=print),
+        old,
+        name,
+        workbooks=workbooks,
+    ) as logger:
+        for i in rows:
+            await logger.save(i)
+
+
+def read_xlsx(path) -> list[list]:
+    return [list(i) for i in load_workbook(path).active.iter_rows(values_only=True)]
+
+
+def test_xlsx_logger(tmp_path, monkeypatch):
+    monkeypatch.setattr(XLSXLogger, "MAX_ROWS", 2)
+    existing = tmp_path.joinpath("Detail_测试.xlsx")
+    existing.write_bytes(b"existing")
+    run(
+        save_xlsx(
+            tmp_path,
+            [["1", "a", 1], ["2", "b\x07", 2], ["3", "c", 3], ["4", "d", 4]],
+        )
+    )
+    run(save_xlsx(tmp_path, [["5", "e", 5]]))
+    assert existing.read_bytes() == b"existing"
+    assert read_xlsx(tmp_path.joinpath("Detail_测试.002.xlsx")) == [
+        list(TITLE_LINE),
+        ["1", "a", "1"],
+        ["3", "c", "3"],
+    ]
+    assert read_xlsx(tmp_path.joinpath("Detail_测试.003.xlsx")) == [
+        list(TITLE_LINE),
+        ["4", "d", "4"],
+    ]
+    assert read_xlsx(tmp_path.joinpath("Detail_测试.004.xlsx")) == [
+        list(TITLE_LINE),
+        ["5", "e", "5"],
+    ]
+
+
+def test_xlsx_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(XLSXLogger, "MAX_ROWS", 3)
+    workbooks = XLSXPool()
+    run(save_xlsx(tmp_path, [["1", "a", 1], ["2", "b", 2]], workbooks))
+    # 每次写入结束时保存分卷文件
+    assert read_xlsx(tmp_path.joinpath("Detail_测试.xlsx")) == [
+        list(TITLE_LINE),
+        ["1", "a", "1"],
+        ["2", "b", "2"],
+    ]
+    # 程序运行期间再次写入同一文件名称时沿用当前分卷文件，行数达到上限时切换分卷文件
+    run(save_xlsx(tmp_path, [["3", "c", 3], ["4", "d", 4]], workbooks))
+    assert read_xlsx(tmp_path.joinpath("Detail_测试.xlsx")) == [
+        list(TITLE_LINE),
+        ["1", "a", "1"],
+        ["2", "b", "2"],
+        ["3", "c", "3"],
+    ]
+    assert read_xlsx(tmp_path.joinpath("Detail_测试.002.xlsx")) == [
+        list(TITLE_LINE),
+        ["4", "d", "4"],
+    ]
+    # 文件标识变更后继续写入重命名后的分卷文件
+    run(save_xlsx(tmp_path, [["5", "e", 5]], workbooks, "测试", "Detail_新标识"))
+    run(workbooks.close())
+    assert not tmp_path.joinpath("Detail_测试.002.xlsx").exists()
+    assert read_xlsx(tmp_path.joinpath("Detail_新标识.002.xlsx")) == [
+        list(TITLE_LINE),
+        ["4", "d", "4"],
+        ["5", "e", "5"],
+    ]
+
+
+async def save_csv(root, rows: list[list]):
+    async with CSVLogger(
+        root,
+        TITLE_LINE,
+        FIELD_KEYS,
+        None,
+        name="Detail_测试",
+        compression="gzip",
+    ) as logger:
+        for i in rows:
+            await logger.save(i)
+
+
+def test_csv_logger(tmp_path, monkeypatch):
+    monkeypatch.setattr(CSVLogger, "BUFFER_SIZE", 16)
+    monkeypatch.setattr(CSVLogger, "MAX_SIZE", 64)
+    run(save_csv(tmp_path, [[str(i), f"作品{i}", i] for i in range(4)]))
+    run(save_csv(tmp_path, [["4", "作品4", 4]]))
+    with gzip_open(
+        tmp_path.joinpath("Detail_测试.csv.gz"), "rt", encoding="utf-8"
+    ) as f:
+        first = list(reader(f))
+    with tmp_path.joinpath("Detail_测试.002.csv").open(encoding=CSVLogger.encode) as f:
+        second = list(reader(f))
+    assert first[0] == second[0] == list(TITLE_LINE)
+    assert first[1:] + second[1:] == [[str(i), f"作品{i}", str(i)] for i in range(5)]
+
+
+async def save_parquet(root, rows: list[list]):
+    async with ParquetLogger(
+        root,
+        TITLE_LINE,
+        ("TEXT", "TEXT", "INTEGER"),
+        FIELD_KEYS,
+        None,
+        name="Detail_测试",
+    ) as logger:
+        for i in rows:
+            await logger.save(i)
+
+
+def test_parquet_logger(tmp_path, monkeypatch):
+    pq = importorskip("pyarrow.parquet")
+    monkeypatch.setattr(ParquetLogger, "ROW_GROUP_SIZE", 2)
+    run(save_parquet(tmp_path, [["1", "a", 1], ["2", "b", ""], ["3", "c", 3]]))
+    run(save_parquet(tmp_path, [["4", "d", 4]]))
+    file = pq.ParquetFile(tmp_path.joinpath("Detail_测试.parquet"))
+    assert file.metadata.num_row_groups == 2
+    assert file.read().to_pydict() == {
+        "作品ID": ["1", "2", "3"],
+        "作品描述": ["a", "b", "c"],
+        "点赞数量": [1, None, 3],
+    }
+    assert pq.read_table(tmp_path.joinpath("Detail_测试.002.parquet")).num_rows == 1
+
+
+async def save_ndjson(
+    root,
+    rows: list[list],
+    source: list[dict],
+    type_="batch",
+    options: dict = None,
+    compression="gzip",
+):
+    async with NDJSONLogger(
+        root,
+        TITLE_LINE,
+        FIELD_KEYS,
+        None,
+        name="Detail_测试",
+        compression=compression,
+        source=True,
+    ) as logger:
+        await logger.capture(
+            source,
+            type_,
+            False,
+            {"name": "测试", "tab": 0} if options is None else options,
+        )
+        for i in rows:
+            await logger.save(i)
+        await logger.flush()
+
+
+def test_ndjson_logger(tmp_path):
+    source = [{"aweme_id": "1", "desc": "作品"}, {"aweme_id": "2"}]
+    run(save_ndjson(tmp_path, [["1", "作品", 1]], source[:1]))
+    run(save_ndjson(tmp_path, [["2", "", 0]], source[1:]))
+    assert list(read_source(tmp_path.joinpath("Detail_测试.ndjson.gz"))) == [
+        {"id": "1", "desc": "作品", "digg_count": 1},
+        {"id": "2", "desc": "", "digg_count": 0},
+    ]
+    path = tmp_path.joinpath("Detail_测试.source.ndjson.gz")
+    assert source_name(path) == "Detail_测试"
+    assert source_name(tmp_path.joinpath("Detail_测试.002.source.ndjson")) == (
+        "Detail_测试"
+    )
+    assert source_name(tmp_path.joinpath("Detail_测试.ndjson")) is None
+    assert [i["data"] for i in read_source(path)] == source
+    assert {i["record"] for i in read_source(path)} == {"detail"}
+
+
+async def reextract(root):
+    parameter = SimpleNamespace(
+        root=root,
+        CLEANER=Cleaner(),
+        storage_format="ndjson",
+        storage_compression="",
+        storage_source=True,
+    )
+    example = object.__new__(TikTok)
+    example.parameter = parameter
+    example.logger = example.console = Logger()
+    example.record = RecordManager()
+    example.extractor = Extractor(
+        SimpleNamespace(
+            logger=Logger(),
+            date_format="%Y-%m-%d %H:%M:%S",
+            CLEANER=parameter.CLEANER,
+            extract_processes=0,
+            extract_threshold=0,
+        )
+    )
+    try:
+        await example.reextract(root.joinpath("Data", "Detail_测试.source.ndjson"))
+    finally:
+        await example.record.close()
+
+
+def test_reextract(tmp_path):
+    source = [
+        {"aweme_id": "7300000000000000001", "desc": "作品1", "create_time": 1},
+        {"aweme_id": "7300000000000000002", "desc": "作品2", "create_time": 2},
+    ]
+    root = tmp_path.joinpath("Data")
+    root.mkdir()
+    run(save_ndjson(root, [["1", "作品", 1]], source, "detail", {}, ""))
+    data = root.joinpath("Detail_测试.ndjson").read_bytes()
+    run(reextract(tmp_path))
+    # 重新提取的数据写入独立文件，不修改原有数据文件，也不重复捕获原始数据
+    assert root.joinpath("Detail_测试.ndjson").read_bytes() == data
+    assert sorted(i.name for i in root.iterdir()) == [
+        "Detail_测试.ndjson",
+        "Detail_测试.source.ndjson",
+        "Detail_测试_reextract.ndjson",
+    ]
+    assert [
+        (i["id"], i["desc"])
+        for i in read_source(root.joinpath("Detail_测试_reextract.ndjson"))
+    ] == [("7300000000000000001", "作品1"), ("7300000000000000002", "作品2")]
@@ -0,0 +1,138 @@
+from random import Random
+from re import compile
+from string import ascii_letters, digits, whitespace
+from timeit import timeit
+from unicodedata import name
+
+from emoji import replace_emoji
+
+from src.tools import Cleaner, beautify_string
+
+CONTROL_CHARACTERS = compile(r"[\x00-\x1F\x7F]")
+RULE_WINDOWS = {
+    "/": "",
+    "\\": "",
+    "|": "",
+    "<": "",
+    ">": "",
+    '"': "",
+    "?": "",
+    ":": "",
+    "*": "",
+    "\x00": "",
+} | {i: "" for i in whitespace[1:]}
+RULE_LINUX = {
+    "/": "",
+    "\x00": "",
+} | {i: "" for i in whitespace[1:]}
+CORPUS = [
+    "",
+    "   ",
+    "普通的作品描述 #话题 #测试",
+    'Title: part 1/2 <final> | "quoted" ? * end.',
+    "多行\n描述\t内容\r\n结尾",
+    "控制字符\x00\x07\x1b\x7f测试",
+    "表情 😀😃 👨‍👩‍👧 🇨🇳 1️⃣ ©® 结尾",
+    "日本語のテキスト、ひらがなカタカナ",
+    "한국어 텍스트 테스트",
+    "全角字符：ＡＢＣ１２３，。！",
+    "...前后的点...",
+    " 前后空格 ",
+    " 不换行空格　全角空格",
+    "混合 mixed 文本 text 😀 with emoji 和中文" * 4,
+]
+
+
+def reference_filter(rule: dict, text: str) -> str:
+    for i in rule:
+        text = text.replace(i, rule[i])
+    return text
+
+
+def reference_filter_name(rule: dict, text: str, default: str = "") -> str:
+    text = text.replace(":", ".")
+    text = CONTROL_CHARACTERS.sub("", text)
+    text = reference_filter(rule, text)
+    text = replace_emoji(text)
+    text = " ".join(text.split())
+    text = text.strip().strip(".")
+    return text or default
+
+
+def reference_is_chinese_char(char: str) -> bool:
+    return "CJK" in name(char, "")
+
+
+def reference_truncate_string(s: str, length: int = 64) -> str:
+    count = 0
+    result = ""
+    for char in s:
+        count += 2 if reference_is_chinese_char(char) else 1
+        if count > length:
+            break
+        result += char
+    return result
+
+
+def reference_beautify_string(s: str, length: int = 64) -> str:
+    count = 0
+    for char in s:
+        count += 2 if reference_is_chinese_char(char) else 1
+        if count > length:
+            break
+    else:
+        return s
+    length //= 2
+    start = reference_truncate_string(s, length)
+    end = reference_truncate_string(s[::-1], length)[::-1]
+    return f"{start}...{end}"
+
+
+def generate_corpus(size: int = 2000, seed: int = 0) -> list[str]:
+    """生成包含中英文、标点、控制字符与 Emoji 的随机文本"""
+    random = Random(seed)
+    characters = (
+        ascii_letters
+        + digits
+        + '  :/\\|<>"?*.#\n\t\x00\x07'
+        + "作品描述测试中文字符话题视频图集"
+        + "ひらがなカタカナ한국어ＡＢＣ，。！"
+    )
+    emojis = ["😀", "👨‍👩‍👧", "🇨🇳", "1️⃣", "©", "❤️"]
+    corpus = []
+    for _ in range(size):
+        text = "".join(random.choices(characters, k=random.randint(0, 120)))
+        if random.random() < 0.3:
+            index = random.randint(0, len(text))
+            text = f"{text[:index]}{random.choice(emojis)}{text[index:]}"
+        corpus.append(text)
+    return CORPUS + corpus
+
+
+def benchmark(number: int = 5) -> None:
+    corpus = generate_corpus()
+    cleaner = Cleaner()
+    cleaner.rule = RULE_WINDOWS
+    cases = (
+        (
+            "filter_name",
+            lambda: [reference_filter_name(RULE_WINDOWS, i) for i in corpus],
+            lambda: [cleaner.filter_name(i) for i in corpus],
+        ),
+        (
+            "beautify_string",
+            lambda: [reference_beautify_string(i, 32) for i in corpus],
+            lambda: [beautify_string(i, 32) for i in corpus],
+        ),
+    )
+    for title, old, new in cases:
+        old_time = timeit(old, number=number)
+        new_time = timeit(new, number=number)
+        print(
+            f"{title:<16} {old_time:.4f}s -> {new_time:.4f}s "
+            f"({old_time / new_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -2,12 +2,15 @@ from .browser import Browser
 from .capture import capture_error_params
 from .capture import capture_error_request
 from .choose import choose
+from .codec import ORJSON_SUPPORT, decode_json, encode_json
 from .cleaner import Cleaner
 from .console import ColorfulConsole
+from .cookie_pool import CookiePool, PooledCookie
 from .error import CacheError
 from .error import DownloaderError
 from .file_folder import file_switch
 from .file_folder import remove_empty_directories
+from .file_folder import FOLDER_SHARD, is_shard_folder, shard_folders, shard_parts
 from .format import (
     cookie_dict_to_str,
     cookie_str_to_dict,
@@ -16,10 +19,14 @@ from .format import (
     format_size,
 )
 from .list_pop import safe_pop
+from .proxy_pool import PooledProxy, ProxyPool
 from .retry import Retry
+from .resolver import DNSCache
 from .session import (
+    HTTP2_SUPPORT,
     request_params,
     create_client,
+    create_transport,
 )
 from .temporary import random_string
 from .temporary import timestamp
@@ -28,4 +35,4 @@ from .truncate import beautify_string
 from .truncate import trim_string
 from .truncate import truncate_string
 from .rename_compatible import RenameCompatible
-from .progress import FakeProgress
+from .progress import FakeProgress, TransferProgress
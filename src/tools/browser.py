@@ -45,6 +45,7 @@ class Browser:
                 "douyin.com",
             ],
             key="cookie",
+            pool_key="cookie_pool",
         ),
         True: SimpleNamespace(
             name="TikTok",
@@ -52,6 +53,7 @@ class Browser:
                 "tiktok.com",
             ],
             key="cookie_tiktok",
+            pool_key="cookie_pool_tiktok",
         ),
     }
 
@@ -72,6 +74,7 @@ class Browser:
         self,
         tiktok=False,
         select: str = None,
+        pool=False,
     ):
         if browser := (
             select
@@ -93,19 +96,38 @@ class Browser:
                 self.console.info(
                     _("读取 Cookie 成功！"),
                 )
-                self.__save_cookie(
+                return self.__save_cookie(
                     cookie,
                     tiktok,
+                    pool,
                 )
-            else:
-                self.console.warning(
-                    _("Cookie 数据为空！"),
-                )
+            self.console.warning(
+                _("Cookie 数据为空！"),
+            )
         else:
             self.console.print(_("未选择浏览器！"))
+        return False
 
-    def __save_cookie(self, cookie: dict, tiktok: bool):
-        self.cookie_object.save_cookie(cookie, self.PLATFORM[tiktok].key)
+    def __save_cookie(self, cookie: dict, tiktok: bool, pool=False) -> bool:
+        if not pool:
+            self.cookie_object.save_cookie(cookie, self.PLATFORM[tiktok].key)
+            return True
+        if self.cookie_object.save_cookie_pool(
+            cookie,
+            self.PLATFORM[tiktok].pool_key,
+        ):
+            self.console.info(
+                _("已添加至 {platform_name} Cookie 池").format(
+                    platform_name=self.PLATFORM[tiktok].name
+                ),
+            )
+            return True
+        self.console.warning(
+            _("{platform_name} Cookie 池已存在该 Cookie").format(
+                platform_name=self.PLATFORM[tiktok].name
+            ),
+        )
+        return False
 
     def get(
         self,
@@ -2,7 +2,7 @@ from platform import system
 from re import compile
 from string import whitespace
 
-from emoji import replace_emoji
+from emoji import EMOJI_DATA, replace_emoji
 
 try:
     from ..translation import _
@@ -14,6 +14,8 @@ __all__ = ["Cleaner"]
 
 class Cleaner:
     CONTROL_CHARACTERS = compile(r"[\x00-\x1F\x7F]")
+    # 组成 Emoji 的全部非 ASCII 字符，文本不包含这些字符时无需调用 replace_emoji
+    EMOJI_CHARACTERS = frozenset(j for i in EMOJI_DATA for j in i if ord(j) > 127)
 
     def __init__(self):
         """
@@ -80,7 +82,8 @@ class Cleaner:
 
         text = self.filter(text)
 
-        text = replace_emoji(text)
+        if not self.EMOJI_CHARACTERS.isdisjoint(text):
+            text = replace_emoji(text)
 
         text = self.clear_spaces(text)
 
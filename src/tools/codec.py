@@ -0,0 +1,34 @@
+from importlib.util import find_spec
+from json import dumps as json_dumps
+from json import loads as json_loads
+from typing import Any, Iterable
+
+__all__ = ["ORJSON_SUPPORT", "decode_json", "encode_json"]
+
+# orjson 为可选依赖，未安装时使用标准库 json
+ORJSON_SUPPORT = find_spec("orjson") is not None
+
+if ORJSON_SUPPORT:
+    from orjson import OPT_NON_STR_KEYS
+    from orjson import dumps as orjson_dumps
+    from orjson import loads as orjson_loads
+
+
+def decode_json(content: bytes | str, keys: Iterable[str] = None) -> Any:
+    """解码 JSON 数据，指定 keys 时仅保留所需的顶层键，其余数据随即释放"""
+    data = orjson_loads(content) if ORJSON_SUPPORT else json_loads(content)
+    if keys is None or not isinstance(data, dict):
+        return data
+    return {k: data[k] for k in keys if k in data}
+
+
+def encode_json(data: Any) -> bytes:
+    """编码 JSON 数据，返回 UTF-8 字节"""
+    if ORJSON_SUPPORT:
+        return orjson_dumps(data, option=OPT_NON_STR_KEYS)
+    return json_dumps(
+        data,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
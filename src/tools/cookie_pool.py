@@ -0,0 +1,128 @@
+from asyncio import sleep
+from collections import deque
+from time import monotonic
+
+from .format import cookie_dict_to_str, cookie_str_to_dict
+
+__all__ = ["CookiePool", "PooledCookie"]
+
+
+class PooledCookie:
+    """Cookie 池中的单个 Cookie，记录请求预算与健康评分"""
+
+    def __init__(self, value: str, state: bool, budget: int, primary=False):
+        self.value = value  # 主 Cookie 的值为空字符串，使用请求头原有的 Cookie
+        self.state = state  # 是否已登录
+        self.budget = budget  # 统计窗口内允许的请求次数，0 表示不限制
+        self.primary = primary
+        self.score = 1.0
+        self.cooldown = 0.0
+        self.last_used = 0.0
+        self.requests = deque()
+
+    def __clean(self, now: float, window: int) -> None:
+        while self.requests and now - self.requests[0] >= window:
+            self.requests.popleft()
+
+    def available(self, now: float, window: int) -> bool:
+        if now < self.cooldown:
+            return False
+        self.__clean(now, window)
+        return not self.budget or len(self.requests) < self.budget
+
+    def consume(self, now: float) -> None:
+        self.requests.append(now)
+        self.last_used = now
+
+    def delay(self, now: float, window: int) -> float:
+        """距离该 Cookie 再次可用的秒数"""
+        if now < self.cooldown:
+            return self.cooldown - now
+        self.__clean(now, window)
+        if not self.budget or len(self.requests) < self.budget:
+            return 0
+        return self.requests[0] + window - now
+
+
+class CookiePool:
+    """多 Cookie 轮换池，按请求预算与响应结果分配 Cookie"""
+
+    WINDOW = 60  # 请求预算统计窗口，单位：秒
+    DECAY = 0.8  # 健康评分衰减系数
+    THRESHOLD = 0.3  # 健康评分低于该值时暂停使用
+    RECOVERY = 0.5  # 暂停结束后恢复的健康评分
+    COOLDOWN = 300  # 暂停使用时长，单位：秒
+    MAX_WAIT = 60  # 等待 Cookie 可用的最长时间，超过时不再等待，单位：秒
+
+    def __init__(self, state_key: str, budget: int = 0):
+        self.state_key = state_key
+        self.budget = budget
+        self.items: list[PooledCookie] = []
+
+    def __bool__(self) -> bool:
+        return any(not i.primary for i in self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, cookie: str | dict, primary=False) -> PooledCookie | None:
+        if isinstance(cookie, dict):
+            cookie = cookie_dict_to_str(cookie)
+        if not isinstance(cookie, str) or not (cookie := cookie.strip()):
+            return None
+        if any(i.value == cookie for i in self.items if not i.primary):
+            return None
+        item = PooledCookie(
+            "" if primary else cookie,
+            self.check_state(cookie),
+            self.budget,
+            primary,
+        )
+        self.items.append(item)
+        return item
+
+    def update(self, cookie: str | dict, cookies: list[str | dict]) -> None:
+        """重建 Cookie 池，主 Cookie 同样参与轮换与预算统计"""
+        self.items = []
+        self.add(cookie, True)
+        for i in cookies or ():
+            self.add(i)
+
+    def check_state(self, cookie: str) -> bool:
+        return bool(cookie_str_to_dict(cookie).get(self.state_key))
+
+    def select(self) -> PooledCookie | None:
+        """选择当前可用且健康评分最高的 Cookie，不消耗请求预算"""
+        now = monotonic()
+        if candidates := [i for i in self.items if i.available(now, self.WINDOW)]:
+            return max(candidates, key=lambda i: (i.state, i.score, -i.last_used))
+        return None
+
+    async def acquire(self, current: PooledCookie = None) -> PooledCookie | None:
+        """优先沿用当前 Cookie，预算耗尽或暂停使用时轮换，全部不可用时等待
+
+        等待时间超过 MAX_WAIT 时不再等待，返回主 Cookie；未设置主 Cookie 时返回 None
+        """
+        while True:
+            now = monotonic()
+            if current and current.available(now, self.WINDOW):
+                current.consume(now)
+                return current
+            if item := self.select():
+                item.consume(now)
+                return item
+            delay = min(i.delay(now, self.WINDOW) for i in self.items)
+            if delay > self.MAX_WAIT:
+                if item := next((i for i in self.items if i.primary), None):
+                    item.consume(now)
+                return item
+            await sleep(max(delay, 0.1))
+
+    def feedback(self, item: PooledCookie, success: bool) -> bool:
+        """根据响应结果更新健康评分，返回值表示该 Cookie 是否被暂停使用"""
+        item.score = item.score * self.DECAY + (1 - self.DECAY) * success
+        if item.score < self.THRESHOLD:
+            item.score = self.RECOVERY
+            item.cooldown = monotonic() + self.COOLDOWN
+            return True
+        return False
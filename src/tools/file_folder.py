@@ -1,5 +1,14 @@
 from contextlib import suppress
+from datetime import datetime
+from hashlib import md5
 from pathlib import Path
+from re import compile
+
+# 分片储存模式与各层级分片文件夹的命名规则
+FOLDER_SHARD = {
+    "date": (compile(r"\d{4}|unknown"), compile(r"\d{2}|unknown")),
+    "hash": (compile(r"[0-9a-f]{2}"),),
+}
 
 
 def file_switch(path: Path) -> None:
@@ -9,6 +18,47 @@ def file_switch(path: Path) -> None:
         path.touch()
 
 
+def shard_parts(mode: str, id_: str, timestamp: int = 0) -> tuple[str, ...]:
+    """返回作品文件所在的分片文件夹名称
+
+    date 模式按作品发布年份与月份分片，hash 模式按作品 ID 哈希值前两位分片
+    """
+    match mode:
+        case "date":
+            try:
+                date = datetime.fromtimestamp(int(timestamp))
+            except (TypeError, ValueError, OverflowError, OSError):
+                return "unknown", "unknown"
+            return f"{date.year:04d}", f"{date.month:02d}"
+        case "hash":
+            return (md5(id_.encode(), usedforsecurity=False).hexdigest()[:2],)
+        case _:
+            return ()
+
+
+def is_shard_folder(path: Path, mode: str, level: int = 0) -> bool:
+    """判断文件夹名称是否符合指定层级的分片文件夹命名规则"""
+    patterns = FOLDER_SHARD.get(mode, ())
+    return (
+        level < len(patterns)
+        and bool(patterns[level].fullmatch(path.name))
+        and path.is_dir()
+    )
+
+
+def shard_folders(root: Path, mode: str) -> list[Path]:
+    """返回储存文件夹中的全部分片文件夹，未启用分片储存时返回储存文件夹
+
+    仅返回符合分片文件夹命名规则的文件夹，不包含储存文件夹中的其他文件夹
+    """
+    folders = [root]
+    for level in range(len(FOLDER_SHARD.get(mode, ()))):
+        folders = [
+            j for i in folders for j in i.iterdir() if is_shard_folder(j, mode, level)
+        ]
+    return folders
+
+
 def remove_empty_directories(path: Path) -> None:
     exclude = {
         "\\.",
@@ -1,3 +1,23 @@
+from itertools import count
+from threading import Event, Thread
+from time import monotonic, time
+from typing import TYPE_CHECKING
+
+from rich.live import Live
+from rich.progress_bar import ProgressBar
+from rich.table import Table
+
+from ..custom import PROGRESS
+from ..translation import _
+from .codec import encode_json
+from .format import format_size
+
+if TYPE_CHECKING:
+    from .console import ColorfulConsole
+
+__all__ = ["FakeProgress", "TransferProgress"]
+
+
 class FakeProgress:
     def __init__(
         self,
@@ -38,3 +58,151 @@ class FakeProgress:
         **kwargs,
     ):
         pass
+
+
+class TransferProgress:
+    """文件下载进度汇总
+
+    下载任务仅累加各自的字节计数，不触发渲染；后台线程以固定频率汇总全部任务，
+    显示总体进度与剩余数据量最多的若干个下载任务；无界面模式定期输出 JSON 格式的统计数据
+    """
+
+    FPS = 4  # 进度显示刷新频率
+    TOP = 4  # 显示的下载任务数量上限
+    INTERVAL = 5  # 无界面模式输出统计数据的间隔，单位：秒
+
+    def __init__(
+        self,
+        console: "ColorfulConsole",
+        headless: bool = False,
+    ):
+        self.console = console
+        self.headless = headless
+        # 任务 ID: [描述, 总大小, 已下载大小, 初始大小]
+        self.tasks: dict[int, list] = {}
+        self.ids = count()
+        self.done = 0  # 已结束的任务数量
+        self.done_bytes = 0  # 已结束任务的下载字节数
+        self.start = 0.0
+        self.sample = (0.0, 0)  # 上次计算下载速度时的时间与下载字节数
+        self.speed = 0.0
+        self.live = None
+        self.event = Event()
+        self.thread = None
+
+    def __enter__(self):
+        self.start = monotonic()
+        self.sample = (self.start, 0)
+        if self.headless:
+            self.event.clear()
+            self.thread = Thread(target=self.__report, daemon=True)
+            self.thread.start()
+        else:
+            self.live = Live(
+                get_renderable=self.__render,
+                console=self.console,
+                refresh_per_second=self.FPS,
+                transient=True,
+            )
+            self.live.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.thread:
+            self.event.set()
+            self.thread.join()
+            self.thread = None
+            self.__output()
+        if self.live:
+            self.live.__exit__(exc_type, exc_val, exc_tb)
+            self.live = None
+
+    def add_task(
+        self,
+        description: str,
+        total: int = None,
+        completed: int = 0,
+        **kwargs,
+    ) -> int:
+        self.tasks[task_id := next(self.ids)] = [
+            description,
+            total,
+            completed,
+            completed,
+        ]
+        return task_id
+
+    def update(
+        self,
+        task_id: int,
+        advance: int = 0,
+        **kwargs,
+    ):
+        self.tasks[task_id][2] += advance
+
+    def remove_task(
+        self,
+        task_id: int,
+    ):
+        if task := self.tasks.pop(task_id, None):
+            self.done += 1
+            self.done_bytes += task[2] - task[3]
+
+    def statistics(self) -> dict:
+        # 渲染线程读取下载任务时，仅复制任务列表，不阻塞下载任务
+        tasks = list(self.tasks.values())
+        downloaded = self.done_bytes + sum(i[2] - i[3] for i in tasks)
+        now = monotonic()
+        if (elapsed := now - self.sample[0]) >= 1:
+            self.speed = (downloaded - self.sample[1]) / elapsed
+            self.sample = (now, downloaded)
+        elif self.sample[0] == self.start and elapsed:
+            # 开始下载后的第一秒内使用平均下载速度
+            self.speed = downloaded / elapsed
+        tasks.sort(key=lambda i: (i[1] or 0) - i[2], reverse=True)
+        return {
+            "time": int(time()),
+            "elapsed": round(now - self.start, 1),
+            "active": len(tasks),
+            "finished": self.done,
+            "bytes": downloaded,
+            "speed": round(self.speed),
+            "tasks": [
+                {"name": i[0], "completed": i[2], "total": i[1]}
+                for i in tasks[: self.TOP]
+            ],
+        }
+
+    def __render(self) -> Table:
+        data = self.statistics()
+        table = Table.grid(padding=(0, 1), expand=True)
+        table.add_column(ratio=1, no_wrap=True, style=PROGRESS)
+        table.add_column(width=20)
+        table.add_column(justify="right", no_wrap=True)
+        table.add_row(
+            _("下载中 {active} 个文件，已完成 {finished} 个文件").format(
+                active=data["active"],
+                finished=data["finished"],
+            ),
+            "",
+            f"{format_size(data['bytes'])} • {format_size(data['speed'])}/s",
+        )
+        for i in data["tasks"]:
+            table.add_row(
+                i["name"],
+                ProgressBar(total=i["total"], completed=i["completed"], width=20),
+                f"{format_size(i['completed'])} / {format_size(i['total'] or 0)}",
+            )
+        return table
+
+    def __report(self):
+        while not self.event.wait(self.INTERVAL):
+            self.__output()
+
+    def __output(self):
+        self.console.print(
+            encode_json(self.statistics()).decode(),
+            markup=False,
+            highlight=False,
+            soft_wrap=True,
+        )
@@ -0,0 +1,175 @@
+from asyncio import CancelledError, Semaphore, create_task, gather, sleep
+from contextlib import asynccontextmanager, suppress
+from time import monotonic
+
+from httpx import HTTPStatusError, RequestError
+
+from ..custom import USERAGENT
+from .session import create_client
+
+__all__ = ["ProxyPool", "PooledProxy"]
+
+
+class PooledProxy:
+    """代理池中的单个代理，持有独立的客户端与并发限制"""
+
+    def __init__(
+        self,
+        proxy: str,
+        timeout: int,
+        concurrency: int,
+        options: dict = None,
+    ):
+        self.proxy = proxy
+        self.client = create_client(timeout=timeout, proxy=proxy, **(options or {}))
+        self.semaphore = Semaphore(concurrency)
+        self.latency = 0.0  # 健康检查响应耗时，单位：秒
+        self.error = 0.0  # 请求失败率
+        self.healthy = True
+        self.active = 0  # 占用及等待占用该代理的请求数量
+        self.retired = False  # 已从代理池移除，释放全部占用后关闭客户端
+
+    @property
+    def score(self) -> tuple[float, float, int]:
+        return self.error, self.latency, self.active
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class ProxyPool:
+    """多代理负载池，定期检查代理状态并按评分分配代理"""
+
+    DECAY = 0.8  # 失败率与耗时的衰减系数
+    THRESHOLD = 0.5  # 失败率高于该值时视为不可用
+    STICKY_LIMIT = 1024  # 固定分配记录的最大数量
+
+    def __init__(
+        self,
+        check_url: str,
+        proxies: list[str] = None,
+        interval: int = 300,
+        concurrency: int = 4,
+        timeout: int = 10,
+        options: dict = None,
+    ):
+        self.check_url = check_url
+        self.interval = interval
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.options = options or {}
+        self.items: list[PooledProxy] = [
+            PooledProxy(i, timeout, concurrency, self.options)
+            for i in dict.fromkeys(proxies or ())
+        ]
+        self.sticky: dict[str, PooledProxy] = {}
+        self.task = None
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    async def update(
+        self,
+        proxies: list[str],
+        check_url: str = None,
+        interval: int = None,
+        concurrency: int = None,
+    ) -> None:
+        """更新代理列表，未变化的代理保留原有客户端与连接池"""
+        self.check_url = check_url or self.check_url
+        if interval is not None:
+            self.interval = interval
+        if concurrency and concurrency != self.concurrency:
+            self.concurrency = concurrency
+            # 正在占用的请求释放原有信号量，后续请求使用新的并发限制
+            for i in self.items:
+                i.semaphore = Semaphore(concurrency)
+        items = {i.proxy: i for i in self.items}
+        self.items = [
+            items.pop(i, None)
+            or PooledProxy(i, self.timeout, self.concurrency, self.options)
+            for i in dict.fromkeys(proxies)
+        ]
+        self.sticky = {k: v for k, v in self.sticky.items() if v in self.items}
+        for i in items.values():
+            # 正在使用的代理在释放全部占用后关闭客户端
+            i.retired = True
+            if not i.active:
+                await i.close()
+
+    def select(self, key: str = "") -> PooledProxy:
+        """选择代理；传入 key 时，同一 key 固定使用同一代理直至其不可用"""
+        if (item := self.sticky.get(key)) and item.healthy:
+            return item
+        candidates = [i for i in self.items if i.healthy] or self.items
+        item = min(candidates, key=lambda i: i.score)
+        if key:
+            if len(self.sticky) >= self.STICKY_LIMIT:
+                self.sticky.pop(next(iter(self.sticky)))
+            self.sticky[key] = item
+        return item
+
+    @asynccontextmanager
+    async def lease(self, key: str = ""):
+        """占用代理的一个并发名额，退出时释放"""
+        self.start()
+        item = self.select(key)
+        item.active += 1
+        try:
+            async with item.semaphore:
+                yield item
+        finally:
+            item.active -= 1
+            if item.retired and not item.active:
+                await item.close()
+
+    def feedback(self, item: PooledProxy, success: bool) -> None:
+        item.error = item.error * self.DECAY + (1 - self.DECAY) * (not success)
+        item.healthy = item.error < self.THRESHOLD
+
+    def start(self) -> None:
+        """在事件循环中首次使用代理池时启动后台健康检查"""
+        if self.task or not self.interval:
+            return
+        self.task = create_task(self.__check_loop())
+
+    async def __check_loop(self) -> None:
+        with suppress(CancelledError):
+            while True:
+                await self.check()
+                await sleep(self.interval)
+
+    async def check(self) -> None:
+        await gather(*[self.__check_item(i) for i in self.items])
+
+    async def __check_item(self, item: PooledProxy) -> None:
+        start = monotonic()
+        try:
+            response = await item.client.get(
+                self.check_url,
+                headers={"User-Agent": USERAGENT},
+            )
+            response.raise_for_status()
+        except (RequestError, HTTPStatusError):
+            self.feedback(item, False)
+            item.healthy = False
+            return
+        latency = monotonic() - start
+        item.latency = (
+            item.latency * self.DECAY + (1 - self.DECAY) * latency
+            if item.latency
+            else latency
+        )
+        self.feedback(item, True)
+
+    async def close(self) -> None:
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        for i in self.items:
+            await i.close()
+        self.items = []
+        self.sticky = {}
@@ -0,0 +1,96 @@
+from asyncio import get_running_loop
+from ipaddress import ip_address
+from socket import SOCK_STREAM, gaierror
+from time import monotonic
+from typing import Iterable
+
+from httpcore import (
+    AsyncNetworkBackend,
+    AsyncNetworkStream,
+    ConnectError,
+    ConnectTimeout,
+)
+
+__all__ = ["DNSCache", "CachedNetworkBackend"]
+
+
+class DNSCache:
+    """域名解析缓存，解析结果在有效期内复用，连接失败时立即失效"""
+
+    def __init__(self, ttl: int = 300):
+        self.ttl = ttl
+        self.cache: dict[tuple[str, int], tuple[float, str]] = {}
+
+    async def resolve(self, host: str, port: int) -> str:
+        if not self.ttl or self.__is_address(host):
+            return host
+        if (item := self.cache.get((host, port))) and item[0] > monotonic():
+            return item[1]
+        try:
+            result = await get_running_loop().getaddrinfo(
+                host,
+                port,
+                type=SOCK_STREAM,
+            )
+        except gaierror:
+            return host
+        address = result[0][4][0]
+        self.cache[(host, port)] = (monotonic() + self.ttl, address)
+        return address
+
+    def invalidate(self, host: str, port: int) -> None:
+        self.cache.pop((host, port), None)
+
+    def hosts(self) -> list[str]:
+        return list(dict.fromkeys(i for i, _ in self.cache))
+
+    @staticmethod
+    def __is_address(host: str) -> bool:
+        try:
+            ip_address(host)
+            return True
+        except ValueError:
+            return False
+
+
+class CachedNetworkBackend(AsyncNetworkBackend):
+    """为 httpcore 网络后端增加域名解析缓存，TLS 仍使用原始域名校验"""
+
+    def __init__(self, backend: AsyncNetworkBackend, resolver: DNSCache):
+        self.backend = backend
+        self.resolver = resolver
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable | None = None,
+    ) -> AsyncNetworkStream:
+        try:
+            return await self.backend.connect_tcp(
+                await self.resolver.resolve(host, port),
+                port,
+                timeout=timeout,
+                local_address=local_address,
+                socket_options=socket_options,
+            )
+        except (ConnectError, ConnectTimeout):
+            self.resolver.invalidate(host, port)
+            raise
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable | None = None,
+    ) -> AsyncNetworkStream:
+        return await self.backend.connect_unix_socket(
+            path,
+            timeout=timeout,
+            socket_options=socket_options,
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self.backend.sleep(seconds)
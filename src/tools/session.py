@@ -1,17 +1,47 @@
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Union
 
-from httpx import AsyncClient, AsyncHTTPTransport, Client, HTTPTransport
+from httpx import AsyncClient, AsyncHTTPTransport, Client, HTTPTransport, Limits
 
 from ..custom import TIMEOUT, USERAGENT
 from ..tools import DownloaderError
 from .capture import capture_error_params
+from .codec import decode_json
+from .resolver import CachedNetworkBackend, DNSCache
 from .retry import Retry
 
 if TYPE_CHECKING:
     from ..record import BaseLogger, LoggerManager
     from ..testers import Logger
 
-__all__ = ["request_params", "create_client"]
+__all__ = ["request_params", "create_client", "create_transport", "HTTP2_SUPPORT"]
+
+# HTTP/2 依赖 h2 库，未安装时仅支持 HTTP/1.1
+HTTP2_SUPPORT = find_spec("h2") is not None
+
+
+def create_transport(
+    proxy: str = None,
+    http2=False,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 5.0,
+    resolver: DNSCache = None,
+) -> AsyncHTTPTransport:
+    transport = AsyncHTTPTransport(
+        http2=http2 and HTTP2_SUPPORT,
+        limits=Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        proxy=proxy,
+    )
+    if resolver:
+        # httpx 未开放网络后端参数，替换底层连接池的网络后端以复用解析结果
+        pool = transport._pool
+        pool._network_backend = CachedNetworkBackend(pool._network_backend, resolver)
+    return transport
 
 
 def create_client(
@@ -19,9 +49,22 @@ def create_client(
     timeout=TIMEOUT,
     headers: dict = None,
     proxy: str = None,
+    http2=False,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 5.0,
+    resolver: DNSCache = None,
     *args,
     **kwargs,
 ) -> AsyncClient:
+    options = {
+        "proxy": proxy,
+        "http2": http2,
+        "max_connections": max_connections,
+        "max_keepalive_connections": max_keepalive_connections,
+        "keepalive_expiry": keepalive_expiry,
+        "resolver": resolver,
+    }
     return AsyncClient(
         headers=headers
         or {
@@ -31,8 +74,8 @@ def create_client(
         follow_redirects=True,
         verify=False,
         mounts={
-            "http://": AsyncHTTPTransport(proxy=proxy),
-            "https://": AsyncHTTPTransport(proxy=proxy),
+            "http://": create_transport(**options),
+            "https://": create_transport(**options),
         },
         *args,
         **kwargs,
@@ -107,7 +150,7 @@ async def request(
         case "content":
             return response.content
         case "json":
-            return response.json()
+            return decode_json(response.content)
         case "url":
             return str(response.url)
         case "response":
@@ -1,19 +1,41 @@
 from unicodedata import name
 
+CJK_START = 0x2E80  # 名称包含 CJK 的字符均不早于 CJK 部首补充区
+
+
+class CharWidth(dict):
+    """字符显示宽度查询表，首次查询时计算并缓存"""
+
+    def __missing__(self, char: str) -> int:
+        width = self[char] = 2 if is_chinese_char(char) else 1
+        return width
+
+
+CHAR_WIDTH = CharWidth()
+
 
 def is_chinese_char(char: str) -> bool:
-    return "CJK" in name(char, "")
+    return ord(char) >= CJK_START and "CJK" in name(char, "")
 
 
-def truncate_string(s: str, length: int = 64) -> str:
+def char_widths(s: str) -> list[int]:
+    if s.isascii():
+        return [1] * len(s)
+    return list(map(CHAR_WIDTH.__getitem__, s))
+
+
+def truncate_index(widths: list[int], length: int) -> int:
+    """返回显示宽度不超过 length 的最长前缀长度"""
     count = 0
-    result = ""
-    for char in s:
-        count += 2 if is_chinese_char(char) else 1
+    for index, width in enumerate(widths):
+        count += width
         if count > length:
-            break
-        result += char
-    return result
+            return index
+    return len(widths)
+
+
+def truncate_string(s: str, length: int = 64) -> str:
+    return s[: truncate_index(char_widths(s), length)]
 
 
 def trim_string(s: str, length: int = 64) -> str:
@@ -22,14 +44,13 @@ def trim_string(s: str, length: int = 64) -> str:
 
 
 def beautify_string(s: str, length: int = 64) -> str:
-    count = 0
-    for char in s:
-        count += 2 if is_chinese_char(char) else 1
-        if count > length:
-            break
-    else:
+    # 全部按宽字符计算仍未超出长度时无需计算字符宽度
+    if not s or len(s) * 2 <= length:
+        return s
+    widths = char_widths(s)
+    if sum(widths) <= length:
         return s
     length //= 2
-    start = truncate_string(s, length)
-    end = truncate_string(s[::-1], length)[::-1]
+    start = s[: truncate_index(widths, length)]
+    end = s[len(s) - truncate_index(widths[::-1], length) :]
     return f"{start}...{end}"